@@ -0,0 +1,97 @@
+"""
+@Author: li
+@Email: lijianqiao2906@live.com
+@FileName: cache.py
+@DateTime: 2025-06-17
+@Docs: 基于Redis的短时结果缓存，用于统计类只读接口
+"""
+
+import hashlib
+from collections.abc import Callable
+from enum import Enum
+from functools import wraps
+from typing import Any, TypeVar
+
+import orjson
+import pydantic_core
+from redis.asyncio import Redis
+
+from app.utils.logger import logger
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# 缓存客户端，由应用启动时注入；为None时缓存失效，直接执行被装饰函数
+_redis: Redis | None = None
+
+# 参与缓存键计算的参数类型，服务实例等依赖注入对象不参与
+_KEY_TYPES = (str, int, float, bool, Enum)
+
+
+def set_cache_client(client: Redis | None) -> None:
+    """设置缓存使用的Redis客户端
+
+    Args:
+        client: Redis客户端，传入None表示关闭缓存
+    """
+    global _redis
+    _redis = client
+
+
+def _cache_key(key: str, args: tuple, kwargs: dict[str, Any]) -> str:
+    """根据缓存名称与简单类型参数生成缓存键
+
+    Args:
+        key: 缓存名称
+        args: 位置参数
+        kwargs: 关键字参数
+
+    Returns:
+        缓存键
+    """
+    params = [arg for arg in args if isinstance(arg, _KEY_TYPES)]
+    params += sorted((name, value) for name, value in kwargs.items() if isinstance(value, _KEY_TYPES))
+    if not params:
+        return f"cache:{key}"
+    digest = hashlib.md5(orjson.dumps(params), usedforsecurity=False).hexdigest()
+    return f"cache:{key}:{digest}"
+
+
+def cached(key: str, ttl: int = 15) -> Callable[[F], F]:
+    """缓存异步函数的返回结果
+
+    返回值以JSON形式写入Redis，命中时返回解析后的字典/列表，由调用方的
+    response_model 重新校验。Redis不可用时退化为直接调用。
+
+    Args:
+        key: 缓存名称
+        ttl: 过期时间（秒）
+
+    Returns:
+        装饰器
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _redis is None:
+                return await func(*args, **kwargs)
+
+            cache_key = _cache_key(key, args, kwargs)
+            try:
+                raw = await _redis.get(cache_key)
+                if raw is not None:
+                    return orjson.loads(raw)
+            except Exception as e:
+                logger.warning(f"读取缓存 {cache_key} 失败: {e}")
+
+            result = await func(*args, **kwargs)
+
+            try:
+                await _redis.set(cache_key, pydantic_core.to_json(result), ex=ttl)
+            except Exception as e:
+                logger.warning(f"写入缓存 {cache_key} 失败: {e}")
+            return result
+
+        return wrapper  # type: ignore
+
+    return decorator
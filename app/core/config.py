@@ -25,6 +25,7 @@ class Settings(BaseSettings):
         env_nested_delimiter="__",  # 嵌套变量分隔符
         case_sensitive=True,  # 环境变量区分大小写
         extra="ignore",  # 忽略额外字段
+        frozen=True,  # 配置加载后只读，防止运行期被意外修改
     )
 
     # 应用配置
@@ -37,6 +38,8 @@ class Settings(BaseSettings):
     # 服务器配置
     HOST: str = Field(default="127.0.0.1")
     PORT: int = Field(default=8000)
+    # 工作进程数；WebSocket连接、实时事件总线与SNMP监控均为进程内状态，多进程部署前需确认不依赖这些功能
+    WORKERS: int = Field(default=1, ge=1)
 
     # 运行环境
     ENVIRONMENT: str = Field(default="development")
@@ -112,6 +115,7 @@ class Settings(BaseSettings):
     DB_NAME: str = Field(default="")
     DB_POOL_MAX: int = Field(default=20)
     DB_POOL_CONN_LIFE: int = Field(default=500)
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=1024)
 
     @property
     def TORTOISE_ORM_CONFIG(self) -> dict[str, Any]:
@@ -133,6 +137,8 @@ class Settings(BaseSettings):
                         "minsize": 1,
                         "maxsize": self.DB_POOL_MAX,
                         "max_inactive_connection_lifetime": self.DB_POOL_CONN_LIFE,
+                        # 每个连接缓存的预编译语句数量，ORM生成的参数化SQL文本稳定，可直接复用执行计划
+                        "statement_cache_size": self.DB_STATEMENT_CACHE_SIZE,
                         # 增加一些有用的连接选项
                         "server_settings": {
                             "application_name": self.APP_NAME,
@@ -0,0 +1,65 @@
+"""
+@Author: li
+@Email: lijianqiao2906@live.com
+@FileName: event_bus.py
+@DateTime: 2025-06-17
+@Docs: 进程内实时事件总线，业务方在状态变化时发布事件，由WebSocket推送任务统一消费并广播
+"""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from app.utils.logger import logger
+
+# 事件积压上限，消费方跟不上时丢弃新事件，发布方永不阻塞
+EVENT_BUS_SIZE = 10_000
+
+# 事件：(数据类型, 消息类型, 消息数据)
+event_bus: asyncio.Queue[tuple[str, str, Any]] = asyncio.Queue(maxsize=EVENT_BUS_SIZE)
+
+# 判断数据类型是否有订阅者，由推送任务启动时注入；为None时没有消费方，事件直接丢弃
+_subscriber_check: Callable[[str], bool] | None = None
+
+
+def set_subscriber_check(check: Callable[[str], bool] | None) -> None:
+    """设置订阅者检查函数
+
+    Args:
+        check: 接收数据类型、返回是否有订阅者的函数，传入None表示停止接收事件
+    """
+    global _subscriber_check
+    _subscriber_check = check
+
+
+def has_subscribers(data_type: str) -> bool:
+    """判断数据类型当前是否有订阅者，发布方可据此跳过数据查询与组装
+
+    Args:
+        data_type: 数据类型
+
+    Returns:
+        bool: 是否有订阅者
+    """
+    return _subscriber_check is not None and _subscriber_check(data_type)
+
+
+def publish(data_type: str, message_type: str, data: Any) -> bool:
+    """发布实时事件
+
+    Args:
+        data_type: 数据类型（订阅频道），如 device_status、alerts、metrics、system_logs
+        message_type: 推送给客户端的消息类型
+        data: 消息数据，需可被orjson序列化
+
+    Returns:
+        bool: 是否成功进入事件总线，无订阅者时直接丢弃并返回False
+    """
+    if not has_subscribers(data_type):
+        return False
+    try:
+        event_bus.put_nowait((data_type, message_type, data))
+        return True
+    except asyncio.QueueFull:
+        logger.warning(f"实时事件总线已满，丢弃 {data_type} 事件")
+        return False
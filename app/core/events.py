@@ -7,14 +7,21 @@
 @Docs: 应用程序事件管理
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 import redis.asyncio as redis
 from fastapi import FastAPI
 from tortoise import Tortoise
 
+from app.core.cache import set_cache_client
 from app.core.config import settings
+from app.repositories.monitor_dao import MonitorMetricDAO
 from app.utils.logger import logger
+from app.web.ws.websocket import start_real_time_push, stop_real_time_push
+
+# 监控指标分区维护间隔（秒），长时间运行的进程也能在月份切换前预建好新分区
+PARTITION_MAINTENANCE_INTERVAL = 24 * 60 * 60
 
 
 @asynccontextmanager
@@ -45,9 +52,15 @@ async def startup(app: FastAPI) -> None:
     # 初始化数据库连接
     await init_db()
 
+    # 定期预建监控指标的月分区，首次检查立即执行
+    app.state.partition_task = asyncio.create_task(maintain_partitions())
+
     # 初始化Redis连接
     await init_redis(app)
 
+    # 启动WebSocket实时推送任务，消费事件总线
+    app.state.push_task = start_real_time_push()
+
     logger.info(f"应用程序 {settings.APP_NAME} 启动完成")
 
 
@@ -59,6 +72,13 @@ async def shutdown(app: FastAPI) -> None:
     """
     logger.info(f"应用程序 {settings.APP_NAME} 正在关闭...")
 
+    # 停止WebSocket实时推送任务，之后发布的事件直接丢弃
+    stop_real_time_push()
+    await cancel_task(getattr(app.state, "push_task", None))
+
+    # 停止分区维护任务
+    await cancel_task(getattr(app.state, "partition_task", None))
+
     # 关闭数据库连接
     await close_db()
 
@@ -68,6 +88,32 @@ async def shutdown(app: FastAPI) -> None:
     logger.info(f"应用程序 {settings.APP_NAME} 已关闭")
 
 
+async def cancel_task(task: asyncio.Task | None) -> None:
+    """取消后台任务并等待其退出
+
+    Args:
+        task: 后台任务，为None时忽略
+    """
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def maintain_partitions() -> None:
+    """按固定间隔预建监控指标的月分区，单次失败只记录日志，不影响应用运行"""
+    dao = MonitorMetricDAO()
+    while True:
+        try:
+            await dao.ensure_partitions()
+        except Exception as e:
+            logger.error(f"监控指标分区维护任务异常: {e}")
+        await asyncio.sleep(PARTITION_MAINTENANCE_INTERVAL)
+
+
 async def init_db() -> None:
     """初始化数据库连接"""
     try:
@@ -104,6 +150,7 @@ async def init_redis(app: FastAPI) -> None:
         )
         # 测试连接 (可选, 但推荐)
         await app.state.redis.ping()
+        set_cache_client(app.state.redis)
         logger.info("Redis连接初始化完成并通过ping测试")
     except Exception as e:
         logger.error(f"Redis连接初始化失败: {e}")
@@ -113,6 +160,7 @@ async def init_redis(app: FastAPI) -> None:
 async def close_redis(app: FastAPI) -> None:
     """关闭Redis连接"""
     logger.info("正在关闭Redis连接...")
+    set_cache_client(None)
     if hasattr(app.state, "redis") and app.state.redis:
         try:
             await app.state.redis.close()  # 关闭连接
@@ -13,6 +13,7 @@ from .connection import (
     close_database,
     generate_schemas,
     init_database,
+    ping_database,
 )
 
 __all__ = [
@@ -21,4 +22,5 @@ __all__ = [
     "close_database",
     "generate_schemas",
     "check_database_connection",
+    "ping_database",
 ]
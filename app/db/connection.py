@@ -7,9 +7,10 @@
 @Docs: 数据库连接配置，主要供 Aerich 等迁移工具使用
 """
 
-from tortoise import Tortoise
+from tortoise import Tortoise, connections
 
 from app.core.config import settings
+from app.models.data_models import native_enum_types_sql
 from app.utils.logger import logger
 
 # 导出 Tortoise ORM 配置，供 Aerich 等迁移工具使用
@@ -44,6 +45,10 @@ async def generate_schemas() -> None:
     """
     try:
         logger.info("正在生成数据库表结构...")
+        conn = connections.get("default")
+        if conn.capabilities.dialect == "postgres":
+            # 原生枚举类型需先于引用它的表创建
+            await conn.execute_script(native_enum_types_sql())
         await Tortoise.generate_schemas()
         logger.info("数据库表结构生成成功")
     except Exception as e:
@@ -51,6 +56,21 @@ async def generate_schemas() -> None:
         raise
 
 
+async def ping_database() -> bool:
+    """在已初始化的连接上执行简单查询，检查数据库是否可用
+
+    Returns:
+        bool: 查询成功返回True，否则返回False
+    """
+    try:
+        conn = connections.get("default")
+        await conn.execute_query("SELECT 1")
+        return True
+    except Exception as e:
+        logger.warning(f"数据库连接检查失败: {e}")
+        return False
+
+
 async def check_database_connection() -> bool:
     """检查数据库连接状态
 
@@ -60,13 +80,11 @@ async def check_database_connection() -> bool:
     try:
         await init_database()
         # 执行简单查询测试连接
-        from tortoise import connections
-
-        conn = connections.get("default")
-        await conn.execute_query("SELECT 1")
+        is_connected = await ping_database()
         await close_database()
-        logger.info("数据库连接测试成功")
-        return True
+        if is_connected:
+            logger.info("数据库连接测试成功")
+        return is_connected
     except Exception as e:
         logger.error(f"数据库连接测试失败: {e}")
         return False
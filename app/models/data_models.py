@@ -6,7 +6,13 @@
 @Docs: 网络自动化平台核心数据模型，简化设计只保留必要功能
 """
 
+from enum import Enum
+from typing import Any
+
 from tortoise import fields
+from tortoise.contrib.postgres.indexes import BrinIndex, PostgreSQLIndex
+from tortoise.fields.data import CharEnumFieldInstance
+from tortoise.indexes import PartialIndex
 from tortoise.models import Model
 
 from .data_enum import (
@@ -26,6 +32,93 @@ from .data_enum import (
 )
 
 
+class IPAddressField(fields.Field[str], str):
+    """IP地址字段
+
+    PostgreSQL 中以原生 INET 类型存储（定长、整数比较），读取时统一转换为字符串。
+    """
+
+    SQL_TYPE = "VARCHAR(45)"
+
+    class _db_postgres:
+        SQL_TYPE = "INET"
+
+    def to_python_value(self, value: Any) -> str | None:
+        if value is not None and not isinstance(value, str):
+            value = str(value)
+        self.validate(value)
+        return value
+
+
+# PostgreSQL 原生枚举类型：类型名 -> 枚举类，由 NativeEnumField 注册
+NATIVE_ENUM_TYPES: dict[str, type[Enum]] = {}
+
+
+class NativeEnumField(CharEnumFieldInstance):
+    """枚举字段
+
+    PostgreSQL 中以原生 ENUM 类型存储（4字节定长，索引更小），其他数据库仍为 VARCHAR。
+    类型需先于建表创建，见 native_enum_types_sql()。
+    """
+
+    def __init__(self, enum_type: type[Enum], type_name: str, **kwargs: Any) -> None:
+        super().__init__(enum_type, **kwargs)
+        self.type_name = type_name
+        NATIVE_ENUM_TYPES[type_name] = enum_type
+
+    class _db_postgres:
+        def __init__(self, field: "NativeEnumField") -> None:
+            self.field = field
+
+        @property
+        def SQL_TYPE(self) -> str:
+            return self.field.type_name
+
+
+def native_enum_types_sql() -> str:
+    """生成创建全部原生枚举类型的SQL，类型已存在时跳过
+
+    Returns:
+        SQL脚本
+    """
+    statements = []
+    for type_name, enum_type in NATIVE_ENUM_TYPES.items():
+        labels = ", ".join(f"'{item.value}'" for item in enum_type)
+        statements.append(
+            f"DO $$ BEGIN CREATE TYPE {type_name} AS ENUM ({labels}); "
+            "EXCEPTION WHEN duplicate_object THEN NULL; END $$;"
+        )
+    return "\n".join(statements)
+
+
+class BigIdentityField(fields.BigIntField):
+    """BIGINT 自增主键
+
+    PostgreSQL 中使用 IDENTITY 列代替 BIGSERIAL，序列缓存1000个值，减少高频写入表的序列争用；
+    各连接预取的值互不重叠，id 不再严格按插入顺序递增，可能出现空洞。
+    """
+
+    class _db_postgres:
+        GENERATED_SQL = "BIGINT GENERATED BY DEFAULT AS IDENTITY (CACHE 1000) NOT NULL PRIMARY KEY"
+
+
+class CoveringIndex(PostgreSQLIndex):
+    """带 INCLUDE 列的覆盖索引（PostgreSQL 11+）
+
+    INCLUDE 列只存于叶子页、不参与排序，查询所需列均在索引中时可走 Index Only Scan。
+    """
+
+    def __init__(
+        self,
+        fields: tuple[str, ...],
+        include: tuple[str, ...],
+        condition: dict | None = None,
+    ) -> None:
+        super().__init__(fields=fields, condition=condition)
+        columns = ", ".join(f'"{column}"' for column in include)
+        self.extra = f" INCLUDE ({columns}){self.extra}"
+
+
 class BaseModel(Model):
     """基础模型类
 
@@ -35,7 +128,8 @@ class BaseModel(Model):
     id = fields.IntField(pk=True, description="主键ID")
     created_at = fields.DatetimeField(auto_now_add=True, description="创建时间", db_index=True)
     updated_at = fields.DatetimeField(auto_now=True, description="更新时间")
-    is_deleted = fields.BooleanField(default=False, description="是否已删除", db_index=True)
+    # 几乎所有行都未删除，单列索引选择性极低，不建索引；热点复合索引以部分索引只覆盖未删除的行
+    is_deleted = fields.BooleanField(default=False, description="是否已删除")
 
     class Meta:  # type: ignore
         abstract = True
@@ -48,7 +142,7 @@ class Brand(BaseModel):
     """设备品牌表"""
 
     name = fields.CharField(max_length=50, unique=True, description="品牌名称")  # 华三、华为、思科
-    code = fields.CharField(max_length=20, unique=True, description="品牌代码", db_index=True)  # H3C、HUAWEI、CISCO
+    code = fields.CharField(max_length=20, unique=True, description="品牌代码")  # H3C、HUAWEI、CISCO
     description = fields.TextField(null=True, description="品牌描述")
     is_active = fields.BooleanField(default=True, description="是否启用", db_index=True)
 
@@ -78,7 +172,7 @@ class Area(BaseModel):
     """区域表"""
 
     name = fields.CharField(max_length=100, unique=True, description="区域名称")  # 北京、上海、广州
-    code = fields.CharField(max_length=20, unique=True, description="区域代码", db_index=True)  # BJ、SH、GZ
+    code = fields.CharField(max_length=20, unique=True, description="区域代码")  # BJ、SH、GZ
     parent = fields.ForeignKeyField("models.Area", null=True, related_name="children", description="父级区域")
     description = fields.TextField(null=True, description="区域描述")
     is_active = fields.BooleanField(default=True, description="是否启用", db_index=True)
@@ -108,12 +202,14 @@ class Device(BaseModel):
 
     name = fields.CharField(max_length=100, description="设备名称", db_index=True)
     hostname = fields.CharField(max_length=100, null=True, description="主机名")
-    management_ip = fields.CharField(max_length=15, unique=True, description="管理IP地址")
+    management_ip = IPAddressField(unique=True, description="管理IP地址")
     port = fields.IntField(default=22, description="连接端口")
     account = fields.CharField(max_length=50, description="登录账号")
     password = fields.CharField(max_length=255, description="登录密码")  # AES加密存储
     enable_password = fields.CharField(max_length=255, null=True, description="特权模式密码")
-    connection_type = fields.CharEnumField(ConnectionTypeEnum, default=ConnectionTypeEnum.SSH, description="连接类型")
+    connection_type = NativeEnumField(
+        ConnectionTypeEnum, "connection_type", default=ConnectionTypeEnum.SSH, description="连接类型"
+    )
     brand = fields.ForeignKeyField("models.Brand", related_name="devices", description="设备品牌")
     device_model = fields.ForeignKeyField(
         "models.DeviceModel", null=True, related_name="devices", description="设备型号"
@@ -122,10 +218,10 @@ class Device(BaseModel):
     device_group = fields.ForeignKeyField(
         "models.DeviceGroup", null=True, related_name="devices", description="所属分组"
     )
-    status = fields.CharEnumField(
-        DeviceStatusEnum, default=DeviceStatusEnum.UNKNOWN, description="设备状态", db_index=True
-    )
-    last_check_time = fields.DatetimeField(null=True, description="最后检查时间", db_index=True)
+    # 状态取值少、设备表小，不单独建索引，按品牌/区域/分组的复合索引已包含 status
+    status = NativeEnumField(DeviceStatusEnum, "device_status", default=DeviceStatusEnum.UNKNOWN, description="设备状态")
+    # 每次巡检都会更新，不建索引以便走 HOT 更新（表 fillfactor 由迁移设置为 80）
+    last_check_time = fields.DatetimeField(null=True, description="最后检查时间")
     version = fields.CharField(max_length=100, null=True, description="系统版本")
     serial_number = fields.CharField(max_length=100, null=True, description="序列号")
     description = fields.TextField(null=True, description="设备描述")
@@ -135,9 +231,11 @@ class Device(BaseModel):
         table = "devices"
         table_description = "设备表"
         indexes = [
-            ("brand", "status"),
-            ("area", "status"),
-            ("device_group", "status"),
+            PartialIndex(fields=("brand_id", "status"), condition={"is_deleted": False}),
+            CoveringIndex(
+                fields=("area_id", "status"), include=("name", "management_ip"), condition={"is_deleted": False}
+            ),
+            PartialIndex(fields=("device_group_id", "status"), condition={"is_deleted": False}),
         ]
 
 
@@ -168,6 +266,10 @@ class ConfigTemplate(BaseModel):
 class MonitorMetric(BaseModel):
     """监控指标表"""
 
+    # 分区表在 PostgreSQL 17 之前不支持 IDENTITY 列，仍使用序列默认值，序列缓存由迁移设置
+    id = fields.BigIntField(pk=True, description="主键ID")
+    # 指标按采集顺序追加写入，created_at 与物理顺序一致，用 BRIN 索引代替 B-tree
+    created_at = fields.DatetimeField(auto_now_add=True, description="创建时间")
     device = fields.ForeignKeyField("models.Device", related_name="metrics", description="关联设备")
     metric_type = fields.CharEnumField(MetricTypeEnum, description="指标类型", db_index=True)
     metric_name = fields.CharField(max_length=100, description="指标名称")  # CPU使用率、内存使用率
@@ -175,15 +277,18 @@ class MonitorMetric(BaseModel):
     unit = fields.CharField(max_length=20, null=True, description="指标单位")  # %、MB、°C
     threshold_warning = fields.FloatField(null=True, description="告警阈值")
     threshold_critical = fields.FloatField(null=True, description="严重告警阈值")
-    status = fields.CharEnumField(MetricStatusEnum, default=MetricStatusEnum.NORMAL, description="指标状态", db_index=True)
+    status = NativeEnumField(MetricStatusEnum, "metric_status", default=MetricStatusEnum.NORMAL, description="指标状态")
     collected_at = fields.DatetimeField(description="采集时间", db_index=True)
 
     class Meta:  # type: ignore
         table = "monitor_metrics"
         table_description = "监控指标表"
+        # 数据库中按 collected_at 按月分区（主键为 id + collected_at），分区由迁移与 MonitorMetricDAO 维护
         indexes = [
-            ("device", "metric_type", "collected_at"),
+            CoveringIndex(fields=("device_id", "metric_type", "collected_at"), include=("value", "status")),
+            ("device", "collected_at"),  # 设备最近N条指标，B-tree 可反向扫描，无需 DESC
             ("status", "collected_at"),
+            BrinIndex(fields=("created_at",)),
         ]
 
 
@@ -192,13 +297,15 @@ class Alert(BaseModel):
 
     device = fields.ForeignKeyField("models.Device", related_name="alerts", description="关联设备")
     alert_type = fields.CharEnumField(AlertTypeEnum, description="告警类型", db_index=True)
-    severity = fields.CharEnumField(SeverityEnum, description="告警级别", db_index=True)
+    severity = NativeEnumField(SeverityEnum, "alert_severity", description="告警级别")
     title = fields.CharField(max_length=200, description="告警标题")
     message = fields.TextField(description="告警消息")
     metric_name = fields.CharField(max_length=100, null=True, description="相关指标名称")
     current_value = fields.FloatField(null=True, description="当前值")
     threshold_value = fields.FloatField(null=True, description="阈值")
-    status = fields.CharEnumField(AlertStatusEnum, default=AlertStatusEnum.ACTIVE, description="告警状态", db_index=True)
+    status = NativeEnumField(
+        AlertStatusEnum, "alert_status", default=AlertStatusEnum.ACTIVE, description="告警状态", db_index=True
+    )
     acknowledged_by = fields.CharField(max_length=50, null=True, description="确认人")
     acknowledged_at = fields.DatetimeField(null=True, description="确认时间")
     resolved_at = fields.DatetimeField(null=True, description="解决时间")
@@ -208,8 +315,12 @@ class Alert(BaseModel):
         table_description = "告警表"
         unique_together = (("device", "title", "created_at"),)  # 同一设备同一时间的告警标题唯一
         indexes = [
-            ("device", "status"),
-            ("severity", "status", "created_at"),
+            CoveringIndex(
+                fields=("device_id", "status"),
+                include=("title", "severity", "created_at"),
+                condition={"is_deleted": False},
+            ),
+            PartialIndex(fields=("severity", "status", "created_at"), condition={"is_deleted": False}),
         ]
 
 
@@ -219,15 +330,16 @@ class Alert(BaseModel):
 class OperationLog(BaseModel):
     """操作日志表"""
 
-    user = fields.CharField(max_length=50, null=True, description="操作用户", db_index=True)
-    action = fields.CharEnumField(ActionEnum, description="操作动作", db_index=True)
-    resource_type = fields.CharEnumField(ResourceTypeEnum, description="资源类型", db_index=True)
+    id = BigIdentityField(pk=True, description="主键ID")
+    user = fields.CharField(max_length=50, null=True, description="操作用户")
+    action = fields.CharEnumField(ActionEnum, description="操作动作")
+    resource_type = fields.CharEnumField(ResourceTypeEnum, description="资源类型")
     resource_id = fields.CharField(max_length=50, null=True, description="资源ID")
     resource_name = fields.CharField(max_length=200, null=True, description="资源名称")
     details = fields.JSONField(null=True, description="操作详情")
     ip_address = fields.CharField(max_length=45, null=True, description="操作IP地址")
-    result = fields.CharEnumField(
-        OperationResultEnum, default=OperationResultEnum.SUCCESS, description="操作结果", db_index=True
+    result = NativeEnumField(
+        OperationResultEnum, "operation_result", default=OperationResultEnum.SUCCESS, description="操作结果", db_index=True
     )
     error_message = fields.TextField(null=True, description="错误信息")
     execution_time = fields.FloatField(null=True, description="执行耗时(秒)")
@@ -238,15 +350,18 @@ class OperationLog(BaseModel):
         indexes = [
             ("user", "created_at"),
             ("action", "result", "created_at"),
+            ("action", "created_at"),
+            ("resource_type", "resource_id", "created_at"),
         ]
 
 
 class SystemLog(BaseModel):
     """系统日志表"""
 
-    level = fields.CharEnumField(LogLevelEnum, description="日志级别", db_index=True)
+    id = BigIdentityField(pk=True, description="主键ID")
+    level = fields.CharEnumField(LogLevelEnum, description="日志级别")
     logger_name = fields.CharField(max_length=100, description="日志记录器名称")
-    module = fields.CharField(max_length=100, null=True, description="模块名称", db_index=True)
+    module = fields.CharField(max_length=100, null=True, description="模块名称")
     message = fields.TextField(description="日志消息内容")
     exception_info = fields.TextField(null=True, description="异常信息")
     extra_data = fields.JSONField(null=True, description="额外数据")
@@ -10,6 +10,7 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Any
 
+from app.core.event_bus import has_subscribers, publish
 from app.models.data_models import Device
 from app.services.device_service import DeviceService
 from app.utils.logger import logger
@@ -125,6 +126,7 @@ class SNMPMonitor:
 
             # 存储监控数据
             self.monitoring_data[device.id] = monitoring_data
+            self._publish_device_update(device.id, monitoring_data)
 
             # 检查告警条件
             alerts = self._check_alerts(device, monitoring_data)
@@ -132,14 +134,39 @@ class SNMPMonitor:
             # 存储告警
             for alert in alerts:
                 self.alerts.append(alert)
+                publish("alerts", "new_alert", alert)
                 logger.warning(f"设备 {device.id} 触发告警: {alert['message']}")
 
             return {"device_id": device.id, "success": True, "monitoring_data": monitoring_data, "alerts": alerts}
 
         except Exception as e:
             logger.error(f"监控设备 {device.id} 失败: {e}")
+            self._publish_device_update(device.id, {"error": str(e)})
             return {"device_id": device.id, "success": False, "error": str(e)}
 
+    @staticmethod
+    def _publish_device_update(device_id: int, data: dict[str, Any]) -> None:
+        """将采集结果发布到实时事件总线
+
+        Args:
+            device_id: 设备ID
+            data: 监控数据
+        """
+        # 无订阅者时跳过消息组装
+        if has_subscribers("device_status"):
+            publish(
+                "device_status",
+                "device_status",
+                {
+                    "device_id": device_id,
+                    "status": "offline" if "error" in data else "online",
+                    "last_seen": data.get("collection_time"),
+                },
+            )
+        metrics = data.get("performance_metrics", {}).get("performance_metrics")
+        if metrics and has_subscribers("metrics"):
+            publish("metrics", "metric_update", {"device_id": device_id, "metrics": metrics})
+
     def _check_alerts(self, device: Device, data: dict[str, Any]) -> list[dict[str, Any]]:
         """检查告警条件
 
@@ -235,14 +262,13 @@ class SNMPMonitor:
         Returns:
             list: 告警列表
         """
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        # 告警时间戳均为同一格式的ISO字符串，可直接按字符串比较，无需逐条解析
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
 
         filtered_alerts = []
         for alert in self.alerts:
-            alert_time = datetime.fromisoformat(alert["timestamp"])
-
             # 时间范围过滤
-            if alert_time < cutoff_time:
+            if alert["timestamp"] < cutoff_time:
                 continue
 
             # 设备过滤
@@ -302,9 +328,9 @@ class SNMPMonitor:
         Args:
             hours: 保留时间（小时）
         """
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff_time = (datetime.now() - timedelta(hours=hours)).isoformat()
 
         # 清理旧告警
-        self.alerts = [alert for alert in self.alerts if datetime.fromisoformat(alert["timestamp"]) >= cutoff_time]
+        self.alerts = [alert for alert in self.alerts if alert["timestamp"] >= cutoff_time]
 
         logger.info(f"已清理 {hours} 小时前的旧数据")
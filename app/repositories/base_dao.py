@@ -6,15 +6,91 @@
 @Docs: 数据访问层基类，提供通用的CRUD操作
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 from typing import Any, Generic, TypeVar
 
+from tortoise import timezone
 from tortoise.exceptions import DoesNotExist
+from tortoise.expressions import RawSQL, Subquery
 from tortoise.models import Model
 from tortoise.queryset import QuerySet
 
 ModelType = TypeVar("ModelType", bound=Model)
 
 
+def related_fields(relation: str, fields: Sequence[str]) -> tuple[str, ...]:
+    """为关联模型字段添加关联前缀，用于 values() 跨表取值
+
+    Args:
+        relation: 关联字段名
+        fields: 关联模型的字段列表
+
+    Returns:
+        形如 "relation__field" 的字段元组
+    """
+    return tuple(f"{relation}__{field}" for field in fields)
+
+
+def nest_values(
+    row: dict[str, Any],
+    cache: dict[tuple[str, Any], dict[str, Any]] | None = None,
+    path: str = "",
+) -> dict[str, Any]:
+    """将 values() 返回的扁平行还原为嵌套字典
+
+    "brand__name" 会被放入 row["brand"]["name"]；关联记录的 id 为 None 时
+    （可空外键未关联），整个关联对象置为 None。
+
+    Args:
+        row: values() 返回的单行数据
+        cache: 关联对象缓存，键为 (关联路径, 关联ID)，命中时直接复用已构造的字典
+        path: 当前行所处的关联路径，递归时使用
+
+    Returns:
+        嵌套结构的字典
+    """
+    nested: dict[str, Any] = {}
+    relations: dict[str, dict[str, Any]] = {}
+    for key, value in row.items():
+        relation, sep, rest = key.partition("__")
+        if sep:
+            relations.setdefault(relation, {})[rest] = value
+        else:
+            nested[key] = value
+
+    for relation, values in relations.items():
+        related_id = values.get("id")
+        if related_id is None:
+            nested[relation] = None
+            continue
+
+        cache_key = (f"{path}{relation}", related_id)
+        if cache is not None and cache_key in cache:
+            nested[relation] = cache[cache_key]
+            continue
+
+        child = nest_values(values, cache, f"{path}{relation}__")
+        if cache is not None:
+            cache[cache_key] = child
+        nested[relation] = child
+    return nested
+
+
+def nest_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """批量还原嵌套字典，同一批数据中共享的关联记录（如同一品牌）只构造一次
+
+    Args:
+        rows: values() 返回的多行数据
+
+    Returns:
+        嵌套结构的字典列表，相同关联记录复用同一个字典对象
+    """
+    cache: dict[tuple[str, Any], dict[str, Any]] = {}
+    return [nest_values(row, cache) for row in rows]
+
+
 class BaseDAO(Generic[ModelType]):
     """数据访问层基类
 
@@ -22,6 +98,9 @@ class BaseDAO(Generic[ModelType]):
     所有具体的DAO类都应该继承此基类
     """
 
+    # 列表查询使用 values() 返回的字段，为空时返回模型实例
+    list_fields: tuple[str, ...] = ()
+
     def __init__(self, model: type[ModelType]):
         """初始化DAO
 
@@ -30,6 +109,16 @@ class BaseDAO(Generic[ModelType]):
         """
         self.model = model
 
+    @property
+    def value_fields(self) -> list[str]:
+        """不指定字段时 values() 返回的字段名
+
+        Returns:
+            字段名列表，顺序与模型定义一致
+        """
+        meta = self.model._meta
+        return [field for field in meta.fields_map if field in meta.fields_db_projection]
+
     async def create(self, **kwargs) -> ModelType:
         """创建单个记录
 
@@ -41,17 +130,18 @@ class BaseDAO(Generic[ModelType]):
         """
         return await self.model.create(**kwargs)
 
-    async def bulk_create(self, objects: list[dict[str, Any]]) -> list[ModelType]:
+    async def bulk_create(self, objects: list[dict[str, Any]], batch_size: int | None = 200) -> list[ModelType]:
         """批量创建记录
 
         Args:
             objects: 要创建的记录列表
+            batch_size: 每条 INSERT 语句包含的记录数，None 表示一次性插入
 
         Returns:
             创建的模型实例列表
         """
         instances = [self.model(**obj) for obj in objects]
-        await self.model.bulk_create(instances)
+        await self.model.bulk_create(instances, batch_size=batch_size)
         return instances
 
     async def get_by_id(self, id: int) -> ModelType | None:
@@ -68,6 +158,43 @@ class BaseDAO(Generic[ModelType]):
         except DoesNotExist:
             return None
 
+    async def get_detail(self, **filters: Any) -> dict[str, Any] | ModelType | None:
+        """获取单条记录详情
+
+        设置了 list_fields 时与列表查询取相同的字段，关联数据随同一条 SQL 以 JOIN 取回并还原为嵌套字典。
+
+        Args:
+            **filters: 过滤条件
+
+        Returns:
+            嵌套字典（设置了 list_fields 时）或模型实例，记录不存在时返回None
+        """
+        if not self.list_fields:
+            return await self.model.filter(**filters).first()
+        row = await self.model.filter(**filters).first().values(*self.list_fields)
+        return nest_values(row) if row else None
+
+    @property
+    def updated_at_fields(self) -> tuple[str, ...]:
+        """记录自身及 list_fields 中各关联记录的更新时间字段"""
+        return tuple(f for f in self.list_fields if f.endswith("__updated_at")) + ("updated_at",)
+
+    async def get_updated_at(self, id: int) -> datetime | None:
+        """仅查询更新时间，用于条件请求校验
+
+        与 get_detail 读取相同的关联记录，返回其中最新的更新时间，关联记录变化时同样能被检测到。
+
+        Args:
+            id: 记录ID
+
+        Returns:
+            记录及其关联记录中最新的更新时间，记录不存在时返回None
+        """
+        row = await self.model.filter(id=id).first().values_list(*self.updated_at_fields)
+        if row is None:
+            return None
+        return max(updated_at for updated_at in row if updated_at is not None)
+
     async def get_or_404(self, id: int) -> ModelType:
         """根据ID获取记录，不存在则抛出异常
 
@@ -130,16 +257,20 @@ class BaseDAO(Generic[ModelType]):
         filters: dict[str, Any] | None = None,
         prefetch_related: list[str] | None = None,
         order_by: list[str] | None = None,
-    ) -> list[ModelType]:
+        limit: int | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> list[ModelType] | list[dict[str, Any]]:
         """根据过滤条件获取记录列表
 
         Args:
             filters: 过滤条件字典
             prefetch_related: 预加载的关联字段列表
             order_by: 排序字段列表
+            limit: 最大返回条数，为None时不限制
+            fields: 以 values() 取值的字段列表，指定时返回嵌套字典而非模型实例
 
         Returns:
-            模型实例列表
+            模型实例列表或嵌套字典列表
         """
         queryset = self.model.all()
 
@@ -152,6 +283,11 @@ class BaseDAO(Generic[ModelType]):
         if order_by:
             queryset = queryset.order_by(*order_by)
 
+        if limit is not None:
+            queryset = queryset.limit(limit)
+
+        if fields:
+            return nest_rows(await queryset.values(*fields))
         return await queryset
 
     async def paginate(
@@ -161,6 +297,7 @@ class BaseDAO(Generic[ModelType]):
         filters: dict[str, Any] | None = None,
         prefetch_related: list[str] | None = None,
         order_by: list[str] | None = None,
+        fields: Sequence[str] | None = None,
     ) -> dict[str, Any]:
         """分页查询
 
@@ -170,6 +307,7 @@ class BaseDAO(Generic[ModelType]):
             filters: 过滤条件字典
             prefetch_related: 预加载的关联字段列表
             order_by: 排序字段列表
+            fields: 以 values() 取值的字段列表，指定时 items 为嵌套字典而非模型实例
 
         Returns:
             包含分页信息的字典
@@ -182,18 +320,51 @@ class BaseDAO(Generic[ModelType]):
         if order_by:
             queryset = queryset.order_by(*order_by)
 
-        # 计算总数
-        total = await queryset.count()
+        return await self.paginate_queryset(queryset, page, page_size, prefetch_related, fields)
 
+    async def paginate_queryset(
+        self,
+        queryset: QuerySet[ModelType],
+        page: int = 1,
+        page_size: int = 20,
+        prefetch_related: list[str] | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
+        """对已构造好的查询集分页
+
+        以 values() 取值时，总数通过 COUNT(*) OVER() 随当前页一并返回，省去单独的 COUNT 往返；
+        返回模型实例时直接对查询集执行 SELECT COUNT(*)。
+
+        Args:
+            queryset: 已包含过滤与排序条件的查询集
+            page: 页码（从1开始）
+            page_size: 每页大小
+            prefetch_related: 预加载的关联字段列表
+            fields: 以 values() 取值的字段列表，指定时 items 为嵌套字典而非模型实例
+
+        Returns:
+            包含分页信息的字典
+        """
         # 计算偏移量
         offset = (page - 1) * page_size
 
         # 获取当前页数据
         page_queryset = queryset.offset(offset).limit(page_size)
-        if prefetch_related:
-            page_queryset = page_queryset.prefetch_related(*prefetch_related)
-
-        items = await page_queryset
+        if fields:
+            rows = await page_queryset.annotate(total_count=RawSQL("COUNT(*) OVER()")).values(*fields, "total_count")
+            if rows:
+                total = rows[0]["total_count"]
+                for row in rows:
+                    del row["total_count"]
+            else:
+                # 当前页为空时窗口函数无结果，仅在越界翻页时才需要补查总数
+                total = await queryset.count() if page > 1 else 0
+            items = nest_rows(rows)
+        else:
+            total = await queryset.count()
+            if prefetch_related:
+                page_queryset = page_queryset.prefetch_related(*prefetch_related)
+            items = await page_queryset
 
         # 计算分页信息
         total_pages = (total + page_size - 1) // page_size
@@ -210,6 +381,35 @@ class BaseDAO(Generic[ModelType]):
             "has_prev": has_prev,
         }
 
+    async def iter_batches(
+        self,
+        filters: dict[str, Any] | None = None,
+        fields: Sequence[str] = (),
+        batch_size: int = 5000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """按主键游标分批读取记录，每次数据库往返返回一整批 values() 字典
+
+        使用 id > last_id 的键集分页，批次越往后也不会像 OFFSET 那样越来越慢。
+
+        Args:
+            filters: 过滤条件字典
+            fields: values() 取值字段，为空时取全部字段（需包含 id）
+            batch_size: 每批记录数
+
+        Yields:
+            一批记录字典
+        """
+        queryset = self.model.filter(**(filters or {}))
+        last_id = 0
+        while True:
+            rows = await queryset.filter(id__gt=last_id).order_by("id").limit(batch_size).values(*fields)
+            if not rows:
+                break
+            yield rows
+            if len(rows) < batch_size:
+                break
+            last_id = rows[-1]["id"]
+
     async def update_by_id(self, id: int, **kwargs) -> ModelType | None:
         """根据ID更新记录
 
@@ -220,12 +420,27 @@ class BaseDAO(Generic[ModelType]):
         Returns:
             更新后的模型实例或None
         """
-        instance = await self.get_by_id(id)
-        if instance:
-            await instance.update_from_dict(kwargs).save()
-            await instance.refresh_from_db()
-            return instance
-        return None
+        return await self.update_by_id_if(id, {}, **kwargs)
+
+    async def update_by_id_if(self, id: int, conditions: dict[str, Any], **kwargs) -> ModelType | None:
+        """仅当记录满足附加条件时根据ID更新记录
+
+        条件判断与写入在同一条 UPDATE 语句中完成，并发请求中只有一个能够命中。
+
+        Args:
+            id: 记录ID
+            conditions: 附加过滤条件，如 {"status": "active"}
+            **kwargs: 更新的字段值
+
+        Returns:
+            更新后的模型实例；记录不存在或不满足条件时返回None
+        """
+        # 单条 UPDATE 语句完成更新，影响行数为0即未命中；QuerySet.update 不会触发 auto_now，需显式写入
+        kwargs.setdefault("updated_at", timezone.now())
+        updated = await self.model.filter(id=id, **conditions).update(**kwargs)
+        if not updated:
+            return None
+        return await self.get_by_id(id)
 
     async def update_by_filters(self, filters: dict[str, Any], **kwargs) -> int:
         """根据过滤条件批量更新记录
@@ -248,11 +463,7 @@ class BaseDAO(Generic[ModelType]):
         Returns:
             是否删除成功
         """
-        instance = await self.get_by_id(id)
-        if instance:
-            await instance.delete()
-            return True
-        return False
+        return await self.model.filter(id=id).delete() > 0
 
     async def soft_delete_by_id(self, id: int) -> bool:
         """根据ID软删除记录（标记为已删除）
@@ -276,6 +487,27 @@ class BaseDAO(Generic[ModelType]):
         """
         return await self.model.filter(**filters).delete()
 
+    async def delete_in_batches(self, batch_size: int = 10000, **filters) -> int:
+        """按过滤条件分批删除记录，避免单条大 DELETE 造成长事务与WAL膨胀
+
+        每批执行 DELETE ... WHERE id IN (SELECT id ... ORDER BY id LIMIT n)，批次之间让出事件循环。
+
+        Args:
+            batch_size: 每批删除的记录数
+            **filters: 过滤条件
+
+        Returns:
+            删除的记录总数
+        """
+        total = 0
+        while True:
+            batch_ids = Subquery(self.model.filter(**filters).order_by("id").limit(batch_size).values("id"))
+            deleted = await self.model.filter(id__in=batch_ids).delete()
+            total += deleted
+            if deleted < batch_size:
+                return total
+            await asyncio.sleep(0)
+
     async def soft_delete_by_filters(self, **filters) -> int:
         """根据过滤条件批量软删除记录
 
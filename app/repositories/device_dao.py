@@ -10,12 +10,61 @@ from typing import Any
 
 from app.models.data_models import Area, Brand, Device, DeviceGroup, DeviceModel
 
-from .base_dao import BaseDAO
+from .base_dao import BaseDAO, related_fields
+
+# ================================ 列表查询字段 ================================
+
+BRAND_FIELDS = ("id", "name", "code", "description", "is_active", "created_at", "updated_at")
+AREA_FIELDS = ("id", "name", "code", "parent_id", "description", "is_active", "created_at", "updated_at")
+DEVICE_MODEL_FIELDS = (
+    "id",
+    "name",
+    "brand_id",
+    "device_type",
+    "description",
+    "is_active",
+    "created_at",
+    "updated_at",
+    *related_fields("brand", BRAND_FIELDS),
+)
+DEVICE_GROUP_FIELDS = (
+    "id",
+    "name",
+    "area_id",
+    "description",
+    "is_active",
+    "created_at",
+    "updated_at",
+    *related_fields("area", AREA_FIELDS),
+)
+DEVICE_FIELDS = (
+    "id",
+    "name",
+    "hostname",
+    "management_ip",
+    "port",
+    "account",
+    "connection_type",
+    "status",
+    "last_check_time",
+    "version",
+    "serial_number",
+    "description",
+    "is_active",
+    "created_at",
+    "updated_at",
+    *related_fields("brand", BRAND_FIELDS),
+    *related_fields("device_model", DEVICE_MODEL_FIELDS),
+    *related_fields("area", AREA_FIELDS),
+    *related_fields("device_group", DEVICE_GROUP_FIELDS),
+)
 
 
 class BrandDAO(BaseDAO[Brand]):
     """品牌DAO"""
 
+    list_fields = BRAND_FIELDS
+
     def __init__(self):
         super().__init__(Brand)
 
@@ -46,6 +95,8 @@ class BrandDAO(BaseDAO[Brand]):
 class DeviceModelDAO(BaseDAO[DeviceModel]):
     """设备型号DAO"""
 
+    list_fields = DEVICE_MODEL_FIELDS
+
     def __init__(self):
         super().__init__(DeviceModel)
 
@@ -87,6 +138,8 @@ class DeviceModelDAO(BaseDAO[DeviceModel]):
 class AreaDAO(BaseDAO[Area]):
     """区域DAO"""
 
+    list_fields = AREA_FIELDS
+
     def __init__(self):
         super().__init__(Area)
 
@@ -162,6 +215,8 @@ class AreaDAO(BaseDAO[Area]):
 class DeviceGroupDAO(BaseDAO[DeviceGroup]):
     """设备分组DAO"""
 
+    list_fields = DEVICE_GROUP_FIELDS
+
     def __init__(self):
         super().__init__(DeviceGroup)
 
@@ -193,6 +248,8 @@ class DeviceGroupDAO(BaseDAO[DeviceGroup]):
 class DeviceDAO(BaseDAO[Device]):
     """设备DAO"""
 
+    list_fields = DEVICE_FIELDS
+
     def __init__(self):
         super().__init__(Device)
 
@@ -270,39 +327,14 @@ class DeviceDAO(BaseDAO[Device]):
                 | Q(description__icontains=keyword)
             )
 
-            # 计算总数
-            total = await query.count()
-
-            # 分页查询
-            offset = (page - 1) * page_size
-            items = await (
-                query.prefetch_related("brand", "device_model", "area", "device_group")
-                .offset(offset)
-                .limit(page_size)
-                .order_by("name")
-            )
-
-            # 计算分页信息
-            total_pages = (total + page_size - 1) // page_size
-            has_next = page < total_pages
-            has_prev = page > 1
-
-            return {
-                "items": items,
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "total_pages": total_pages,
-                "has_next": has_next,
-                "has_prev": has_prev,
-            }
+            return await self.paginate_queryset(query.order_by("name"), page, page_size, fields=DEVICE_FIELDS)
         else:
             return await self.paginate(
                 page=page,
                 page_size=page_size,
                 filters=filters,
-                prefetch_related=["brand", "device_model", "area", "device_group"],
                 order_by=["name"],
+                fields=DEVICE_FIELDS,
             )
 
     async def get_devices_for_monitoring(self) -> list[Device]:
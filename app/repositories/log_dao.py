@@ -178,7 +178,7 @@ class OperationLogDAO(BaseDAO[OperationLog]):
 
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        return await self.delete_by_filters(created_at__lt=cutoff_date)
+        return await self.delete_in_batches(created_at__lt=cutoff_date)
 
 
 class SystemLogDAO(BaseDAO[SystemLog]):
@@ -318,4 +318,4 @@ class SystemLogDAO(BaseDAO[SystemLog]):
 
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        return await self.delete_by_filters(created_at__lt=cutoff_date)
+        return await self.delete_in_batches(created_at__lt=cutoff_date)
@@ -6,39 +6,110 @@
 @Docs: 监控和告警相关的数据访问层
 """
 
-from datetime import datetime
+import hashlib
+from datetime import datetime, timedelta
 from typing import Any
 
-from app.models.data_models import Alert, MonitorMetric
+from tortoise.exceptions import BaseORMException, OperationalError
 
-from .base_dao import BaseDAO
+from app.models.data_models import Alert, MonitorMetric
+from app.utils.logger import logger
+
+from .base_dao import BaseDAO, related_fields
+from .device_dao import DEVICE_FIELDS
+
+# ================================ 列表查询字段 ================================
+
+METRIC_FIELDS = (
+    "id",
+    "device_id",
+    "metric_type",
+    "metric_name",
+    "value",
+    "unit",
+    "threshold_warning",
+    "threshold_critical",
+    "status",
+    "collected_at",
+    "created_at",
+    "updated_at",
+    *related_fields("device", DEVICE_FIELDS),
+)
+ALERT_FIELDS = (
+    "id",
+    "device_id",
+    "alert_type",
+    "severity",
+    "title",
+    "message",
+    "metric_name",
+    "current_value",
+    "threshold_value",
+    "status",
+    "acknowledged_by",
+    "acknowledged_at",
+    "resolved_at",
+    "created_at",
+    "updated_at",
+    *related_fields("device", DEVICE_FIELDS),
+)
 
 
 class MonitorMetricDAO(BaseDAO[MonitorMetric]):
     """监控指标DAO"""
 
+    list_fields = METRIC_FIELDS
+
     def __init__(self):
         super().__init__(MonitorMetric)
 
-    async def list_by_device(self, device_id: int, limit: int = 100) -> list[MonitorMetric]:
-        """获取设备的监控指标（按时间倒序）"""
-        results = await self.list_by_filters(
+    async def list_by_device(self, device_id: int, limit: int = 100) -> list[dict[str, Any]]:
+        """获取设备的监控指标（按时间倒序，设备及其关联数据随同一条查询返回）"""
+        return await self.list_by_filters(
             filters={"device_id": device_id, "is_deleted": False},
-            prefetch_related=["device"],
             order_by=["-collected_at"],
+            limit=limit,
+            fields=self.list_fields,
         )
-        return results[:limit]
 
     async def list_by_device_and_metric_type(
         self, device_id: int, metric_type: str, limit: int = 100
-    ) -> list[MonitorMetric]:
+    ) -> list[dict[str, Any]]:
         """获取设备指定类型的监控指标"""
-        results = await self.list_by_filters(
+        return await self.list_by_filters(
             filters={"device_id": device_id, "metric_type": metric_type, "is_deleted": False},
-            prefetch_related=["device"],
             order_by=["-collected_at"],
+            limit=limit,
+            fields=self.list_fields,
         )
-        return results[:limit]
+
+    async def get_device_list_version(
+        self, device_id: int, metric_type: str | None = None, limit: int = 100
+    ) -> tuple[str, datetime | None]:
+        """获取设备最近N条指标的版本标识，范围与 list_by_device 一致，用于条件请求校验
+
+        只读取 id 与更新时间列。窗口内的记录集合由 id 摘要标识，非最新的指标被删除、更早的指标补入窗口时摘要同样会变化。
+
+        Args:
+            device_id: 设备ID
+            metric_type: 指标类型，为None时不限制
+            limit: 最大条数
+
+        Returns:
+            (窗口内指标 id 的摘要, 指标及其关联设备数据中最新的更新时间)，没有指标时更新时间为None
+        """
+        filters: dict[str, Any] = {"device_id": device_id, "is_deleted": False}
+        if metric_type:
+            filters["metric_type"] = metric_type
+        rows = await (
+            self.model.filter(**filters)
+            .order_by("-collected_at")
+            .limit(limit)
+            .values_list("id", *self.updated_at_fields)
+        )
+        ids_digest = hashlib.blake2b(b",".join(str(row[0]).encode() for row in rows), digest_size=8).hexdigest()
+        latest = max((updated_at for row in rows for updated_at in row[1:] if updated_at is not None), default=None)
+        return ids_digest, latest
 
     async def get_latest_metrics_by_device(self, device_id: int) -> list[MonitorMetric]:
         """获取设备的最新监控指标（每种类型的最新一条）"""
@@ -78,12 +149,12 @@ class MonitorMetricDAO(BaseDAO[MonitorMetric]):
 
     async def get_abnormal_metrics(self, limit: int = 100) -> list[MonitorMetric]:
         """获取异常的监控指标"""
-        results = await self.list_by_filters(
+        return await self.list_by_filters(
             filters={"status__in": ["WARNING", "CRITICAL"], "is_deleted": False},
             prefetch_related=["device"],
             order_by=["-collected_at"],
+            limit=limit,
         )
-        return results[:limit]
 
     async def get_metric_statistics(
         self, device_id: int, metric_type: str, start_time: datetime, end_time: datetime
@@ -109,12 +180,55 @@ class MonitorMetricDAO(BaseDAO[MonitorMetric]):
         return {"max_value": None, "min_value": None, "avg_value": None, "count": 0}
 
     async def clean_old_metrics(self, days: int = 30) -> int:
-        """清理旧的监控数据"""
-        from datetime import timedelta
+        """清理旧的监控数据
 
+        整月早于截止时间的分区直接删除，剩余的旧数据（截止时间所在月份及默认分区）再分批删除。
+        """
         cutoff_date = datetime.now() - timedelta(days=days)
 
-        return await self.delete_by_filters(collected_at__lt=cutoff_date)
+        dropped = await self.drop_partitions_before(cutoff_date)
+        await self.ensure_partitions()
+        return dropped + await self.delete_in_batches(collected_at__lt=cutoff_date)
+
+    async def ensure_partitions(self, months_ahead: int = 2) -> bool:
+        """预建当前月及之后若干个月的监控指标分区
+
+        默认分区中已写入对应月份的数据会先迁入新分区再挂载，不会因默认分区冲突而失败。
+
+        Args:
+            months_ahead: 预建的月份数（不含当前月）
+
+        Returns:
+            是否成功，数据库未启用分区（未执行分区迁移）或建分区失败时返回False
+        """
+        try:
+            await self.model._meta.db.execute_query(
+                "SELECT create_monitor_metrics_partition(date_trunc('month', CURRENT_TIMESTAMP) + n * INTERVAL '1 month') "
+                "FROM generate_series(0, $1::int) AS n",
+                [months_ahead],
+            )
+            return True
+        except BaseORMException as e:
+            logger.warning(f"预建监控指标分区失败: {e}")
+            return False
+
+    async def drop_partitions_before(self, cutoff: datetime) -> int:
+        """删除整月早于截止时间的监控指标分区
+
+        Args:
+            cutoff: 截止时间
+
+        Returns:
+            被删除分区中的记录数，数据库未启用分区时返回0
+        """
+        try:
+            _, rows = await self.model._meta.db.execute_query(
+                "SELECT drop_monitor_metrics_partitions($1::timestamp) AS dropped", [cutoff]
+            )
+        except OperationalError as e:
+            logger.warning(f"删除监控指标旧分区失败: {e}")
+            return 0
+        return rows[0]["dropped"] if rows else 0
 
     async def get_device_metric_summary(self, device_id: int) -> dict[str, Any]:
         """获取设备监控指标汇总"""
@@ -141,6 +255,8 @@ class MonitorMetricDAO(BaseDAO[MonitorMetric]):
 class AlertDAO(BaseDAO[Alert]):
     """告警DAO"""
 
+    list_fields = ALERT_FIELDS
+
     def __init__(self):
         super().__init__(Alert)
 
@@ -337,4 +453,4 @@ class AlertDAO(BaseDAO[Alert]):
         cutoff_date = datetime.now() - timedelta(days=days)
 
         # 只删除已解决的告警
-        return await self.delete_by_filters(status="RESOLVED", resolved_at__lt=cutoff_date)
+        return await self.delete_in_batches(status="RESOLVED", resolved_at__lt=cutoff_date)
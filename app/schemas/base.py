@@ -8,11 +8,14 @@
 
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # 泛型类型变量
 T = TypeVar("T")
 
+# ORM响应模型通用配置：from_attributes 固化进校验器，忽略多余字段，实例只读
+ORM_RESPONSE_CONFIG = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
+
 
 class BaseResponse(BaseModel, Generic[T]):
     """统一响应模型"""
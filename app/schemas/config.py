@@ -13,7 +13,7 @@ from pydantic import BaseModel, Field
 
 from app.models.data_enum import DeviceTypeEnum, TemplateTypeEnum
 
-from .base import BaseQueryParams
+from .base import ORM_RESPONSE_CONFIG, BaseQueryParams
 from .device import BrandResponse
 
 
@@ -52,6 +52,8 @@ class ConfigTemplateUpdate(BaseModel):
 class ConfigTemplateResponse(ConfigTemplateBase):
     """配置模板响应模型"""
 
+    model_config = ORM_RESPONSE_CONFIG
+
     id: int = Field(description="模板ID")
     brand: BrandResponse | None = Field(description="适用品牌")
     created_at: datetime = Field(description="创建时间")
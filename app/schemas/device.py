@@ -14,7 +14,7 @@ from pydantic import BaseModel, Field, IPvAnyAddress
 
 from app.models.data_enum import ConnectionTypeEnum, DeviceStatusEnum, DeviceTypeEnum
 
-from .base import BaseQueryParams
+from .base import ORM_RESPONSE_CONFIG, BaseQueryParams
 
 # ================================ 品牌相关 ================================
 
@@ -46,6 +46,8 @@ class BrandUpdate(BaseModel):
 class BrandResponse(BrandBase):
     """品牌响应模型"""
 
+    model_config = ORM_RESPONSE_CONFIG
+
     id: int = Field(description="品牌ID")
     created_at: datetime = Field(description="创建时间")
     updated_at: datetime = Field(description="更新时间")
@@ -89,6 +91,8 @@ class DeviceModelUpdate(BaseModel):
 class DeviceModelResponse(DeviceModelBase):
     """设备型号响应模型"""
 
+    model_config = ORM_RESPONSE_CONFIG
+
     id: int = Field(description="型号ID")
     brand: BrandResponse = Field(description="品牌信息")
     created_at: datetime = Field(description="创建时间")
@@ -134,6 +138,8 @@ class AreaUpdate(BaseModel):
 class AreaResponse(AreaBase):
     """区域响应模型"""
 
+    model_config = ORM_RESPONSE_CONFIG
+
     id: int = Field(description="区域ID")
     parent: AreaResponse | None = Field(default=None, description="父级区域")
     children: list[AreaResponse] = Field(default_factory=list, description="子区域列表")
@@ -178,6 +184,8 @@ class DeviceGroupUpdate(BaseModel):
 class DeviceGroupResponse(DeviceGroupBase):
     """设备分组响应模型"""
 
+    model_config = ORM_RESPONSE_CONFIG
+
     id: int = Field(description="分组ID")
     area: AreaResponse = Field(description="区域信息")
     device_count: int = Field(default=0, description="设备数量")
@@ -241,6 +249,8 @@ class DeviceUpdate(BaseModel):
 class DeviceResponse(BaseModel):
     """设备响应模型"""
 
+    model_config = ORM_RESPONSE_CONFIG
+
     id: int = Field(description="设备ID")
     name: str = Field(description="设备名称")
     hostname: str | None = Field(description="主机名")
@@ -7,13 +7,13 @@
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
 from app.models.data_enum import ActionEnum, LogLevelEnum, OperationResultEnum, ResourceTypeEnum
 
-from .base import BaseQueryParams, BaseTimeRange
+from .base import ORM_RESPONSE_CONFIG, BaseQueryParams, BaseTimeRange
 
 
 class OperationLogBase(BaseModel):
@@ -40,6 +40,8 @@ class OperationLogCreate(OperationLogBase):
 class OperationLogResponse(OperationLogBase):
     """操作日志响应模型"""
 
+    model_config = ORM_RESPONSE_CONFIG
+
     id: int = Field(description="日志ID")
     created_at: datetime = Field(description="创建时间")
     updated_at: datetime = Field(description="更新时间")
@@ -75,6 +77,8 @@ class SystemLogCreate(SystemLogBase):
 class SystemLogResponse(SystemLogBase):
     """系统日志响应模型"""
 
+    model_config = ORM_RESPONSE_CONFIG
+
     id: int = Field(description="日志ID")
     created_at: datetime = Field(description="创建时间")
     updated_at: datetime = Field(description="更新时间")
@@ -103,8 +107,8 @@ class LogStatistics(BaseModel):
 class LogExportRequest(BaseModel):
     """日志导出请求"""
 
-    log_type: str = Field(description="日志类型", pattern="^(operation|system)$")
+    log_type: Literal["operation", "system"] = Field(description="日志类型")
     start_time: datetime = Field(description="开始时间")
     end_time: datetime = Field(description="结束时间")
     level: LogLevelEnum | None = Field(default=None, description="日志级别筛选")
-    format: str = Field(default="csv", description="导出格式", pattern="^(csv|json|xlsx)$")
+    format: Literal["csv", "json", "xlsx"] = Field(default="csv", description="导出格式")
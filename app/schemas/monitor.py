@@ -7,8 +7,9 @@
 """
 
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from app.models.data_enum import (
     AlertStatusEnum,
@@ -18,10 +19,24 @@ from app.models.data_enum import (
     SeverityEnum,
 )
 
-from .base import BaseQueryParams, BaseTimeRange
+from .base import ORM_RESPONSE_CONFIG, BaseQueryParams, BaseTimeRange
 from .device import DeviceResponse
 
 
+def _reject_null(value: Any) -> Any:
+    """更新模型中可省略但不可为空的字段：显式传入 null 时校验失败，避免 NOT NULL 列写入空值
+
+    Args:
+        value: 字段值
+
+    Returns:
+        原值
+    """
+    if value is None:
+        raise ValueError("不能为 null，不修改时请省略该字段")
+    return value
+
+
 class MonitorMetricBase(BaseModel):
     """监控指标基础模型"""
 
@@ -49,10 +64,14 @@ class MonitorMetricUpdate(BaseModel):
     threshold_critical: float | None = Field(default=None, description="严重告警阈值")
     status: MetricStatusEnum | None = Field(default=None, description="指标状态")
 
+    _value_not_null = field_validator("value", "status")(_reject_null)
+
 
 class MonitorMetricResponse(MonitorMetricBase):
     """监控指标响应模型"""
 
+    model_config = ORM_RESPONSE_CONFIG
+
     id: int = Field(description="指标ID")
     device: DeviceResponse = Field(description="关联设备")
     status: MetricStatusEnum = Field(description="指标状态")
@@ -110,10 +129,14 @@ class AlertUpdate(BaseModel):
     status: AlertStatusEnum | None = Field(default=None, description="告警状态")
     acknowledged_by: str | None = Field(default=None, max_length=50, description="确认人")
 
+    _status_not_null = field_validator("status")(_reject_null)
+
 
 class AlertResponse(AlertBase):
     """告警响应模型"""
 
+    model_config = ORM_RESPONSE_CONFIG
+
     id: int = Field(description="告警ID")
     device: DeviceResponse = Field(description="关联设备")
     status: AlertStatusEnum = Field(description="告警状态")
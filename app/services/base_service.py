@@ -6,8 +6,13 @@
 @Docs: 服务层基类，提供通用业务逻辑
 """
 
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any, Generic, TypeVar
 
+from pydantic import BaseModel
+from tortoise.transactions import in_transaction
+
 from app.repositories.base_dao import BaseDAO
 from app.utils import LogConfig, system_log
 
@@ -26,6 +31,11 @@ class BaseService(Generic[ModelType, DAOType]):
     - 业务逻辑校验
     """
 
+    # 时间范围查询（start_time / end_time）作用的字段
+    time_range_field: str = "created_at"
+    # 分页查询的默认排序
+    default_order_by: tuple[str, ...] = ()
+
     def __init__(self, dao: DAOType):
         """初始化服务
 
@@ -48,17 +58,19 @@ class BaseService(Generic[ModelType, DAOType]):
         Raises:
             ValueError: 当数据无效时
         """
-        # 基础数据校验
-        await self._validate_create_data(data)
+        # 校验、创建及钩子中的关联写入在同一事务内完成，一次提交
+        async with in_transaction():
+            # 基础数据校验
+            await self._validate_create_data(data)
 
-        # 创建前钩子
-        data = await self._before_create(data, user)
+            # 创建前钩子
+            data = await self._before_create(data, user)
 
-        # 执行创建
-        result = await self.dao.create(**data)
+            # 执行创建
+            result = await self.dao.create(**data)
 
-        # 创建后钩子
-        await self._after_create(result, data, user)
+            # 创建后钩子
+            await self._after_create(result, data, user)
 
         return result
 
@@ -75,6 +87,28 @@ class BaseService(Generic[ModelType, DAOType]):
         """
         return await self.dao.get_by_id(resource_id)
 
+    async def get_detail(self, resource_id: int) -> dict[str, Any] | ModelType | None:
+        """获取资源详情，关联数据与列表接口一致地随同一条查询返回
+
+        Args:
+            resource_id: 资源ID
+
+        Returns:
+            嵌套字典或资源对象，资源不存在时返回None
+        """
+        return await self.dao.get_detail(id=resource_id)
+
+    async def get_updated_at(self, resource_id: int) -> datetime | None:
+        """获取资源及其关联数据中最新的更新时间（只读取 updated_at 列，不记录日志）
+
+        Args:
+            resource_id: 资源ID
+
+        Returns:
+            更新时间，资源不存在时返回None
+        """
+        return await self.dao.get_updated_at(resource_id)
+
     @system_log(LogConfig(log_args=True, log_result=False))
     async def update(self, resource_id: int, data: dict, user: str = "system") -> ModelType | None:
         """更新资源
@@ -91,21 +125,22 @@ class BaseService(Generic[ModelType, DAOType]):
             ValueError: 当数据无效时
             NotFoundError: 当资源不存在时
         """
-        # 检查资源是否存在
-        existing = await self.dao.get_by_id(resource_id)
-        if not existing:
-            raise ValueError(f"Resource with id {resource_id} not found")
+        async with in_transaction():
+            # 检查资源是否存在
+            existing = await self.dao.get_by_id(resource_id)
+            if not existing:
+                raise ValueError(f"Resource with id {resource_id} not found")
 
-        # 基础数据校验
-        await self._validate_update_data(data, existing)
+            # 基础数据校验
+            await self._validate_update_data(data, existing)
 
-        # 更新前钩子
-        data = await self._before_update(resource_id, data, existing, user)  # 执行更新
-        result = await self.dao.update_by_id(resource_id, **data)
+            # 更新前钩子
+            data = await self._before_update(resource_id, data, existing, user)  # 执行更新
+            result = await self.dao.update_by_id(resource_id, **data)
 
-        # 更新后钩子
-        if result:
-            await self._after_update(result, data, existing, user)
+            # 更新后钩子
+            if result:
+                await self._after_update(result, data, existing, user)
 
         return result
 
@@ -123,25 +158,53 @@ class BaseService(Generic[ModelType, DAOType]):
         Raises:
             NotFoundError: 当资源不存在时
         """
-        # 检查资源是否存在
-        existing = await self.dao.get_by_id(resource_id)
-        if not existing:
-            raise ValueError(f"Resource with id {resource_id} not found")
+        async with in_transaction():
+            # 检查资源是否存在
+            existing = await self.dao.get_by_id(resource_id)
+            if not existing:
+                raise ValueError(f"Resource with id {resource_id} not found")
 
-        # 删除前校验
-        await self._validate_delete(existing, user)
+            # 删除前校验
+            await self._validate_delete(existing, user)
 
-        # 删除前钩子
-        await self._before_delete(existing, user)
+            # 删除前钩子
+            await self._before_delete(existing, user)
 
-        # 执行删除
-        result = await self.dao.delete_by_id(resource_id)
+            # 执行删除
+            result = await self.dao.delete_by_id(resource_id)
 
-        # 删除后钩子
-        await self._after_delete(existing, user)
+            # 删除后钩子
+            await self._after_delete(existing, user)
 
         return result
 
+    @system_log(LogConfig(log_args=True, log_result=False))
+    async def update_by_id(self, resource_id: int, data: dict, user: str = "system") -> ModelType | None:
+        """直接更新资源，不预先查询也不执行校验与钩子，适用于无更新业务规则的资源
+
+        Args:
+            resource_id: 资源ID
+            data: 更新数据
+            user: 操作用户
+
+        Returns:
+            更新后的资源对象，资源不存在时返回None
+        """
+        return await self.dao.update_by_id(resource_id, **data)
+
+    @system_log(LogConfig(log_args=True))
+    async def delete_by_id(self, resource_id: int, user: str = "system") -> bool:
+        """直接删除资源，不预先查询也不执行校验与钩子，适用于无删除业务规则的资源
+
+        Args:
+            resource_id: 资源ID
+            user: 操作用户
+
+        Returns:
+            是否删除成功，资源不存在时返回False
+        """
+        return await self.dao.delete_by_id(resource_id)
+
     @system_log(LogConfig(log_args=True, log_result=False))
     async def list_all(self, user: str = "system") -> list[ModelType]:
         """获取所有资源
@@ -155,23 +218,110 @@ class BaseService(Generic[ModelType, DAOType]):
         return await self.dao.list_all()
 
     @system_log(LogConfig(log_args=True, log_result=False))
-    async def get_paginated(self, page: int = 1, page_size: int = 20, user: str = "system") -> dict[str, Any]:
+    async def get_paginated(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        filters: dict[str, Any] | None = None,
+        user: str = "system",
+    ) -> dict[str, Any]:
         """分页获取资源
 
         Args:
             page: 页码
             page_size: 每页大小
+            filters: ORM过滤条件，由数据库完成筛选与分页
             user: 操作用户
 
         Returns:
-            分页结果
+            分页结果，包含 items 与 pagination 两部分
         """
         if page < 1:
             page = 1
         if page_size < 1 or page_size > 100:
             page_size = 20
 
-        return await self.dao.paginate(page, page_size)
+        result = await self.dao.paginate(
+            page,
+            page_size,
+            filters=filters,
+            order_by=list(self.default_order_by) or None,
+            fields=self.dao.list_fields,
+        )
+        return self._wrap_pagination(result)
+
+    def build_filters(self, query_params: BaseModel) -> dict[str, Any]:
+        """将查询参数转换为ORM过滤条件
+
+        仅保留模型上存在的字段，start_time / end_time 转换为 time_range_field 的范围条件，
+        并固定排除已软删除的记录，使查询可以命中 WHERE is_deleted = false 的部分索引。
+
+        Args:
+            query_params: 查询参数模型
+
+        Returns:
+            过滤条件字典
+
+        Raises:
+            ValueError: 时间格式无效时
+        """
+        params = query_params.model_dump(exclude={"page", "page_size"}, exclude_none=True)
+        model_fields = self.dao.model._meta.fields_map
+        filters = {key: value for key, value in params.items() if key in model_fields}
+        if "is_deleted" in model_fields:
+            filters["is_deleted"] = False
+
+        if params.get("start_time"):
+            filters[f"{self.time_range_field}__gte"] = datetime.fromisoformat(params["start_time"])
+        if params.get("end_time"):
+            filters[f"{self.time_range_field}__lte"] = datetime.fromisoformat(params["end_time"])
+        return filters
+
+    async def iter_batches(
+        self, filters: dict[str, Any] | None = None, batch_size: int = 5000
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """分批读取资源，用于导出等需要遍历大量数据的场景
+
+        Args:
+            filters: ORM过滤条件
+            batch_size: 每批记录数
+
+        Yields:
+            一批记录字典
+        """
+        async for batch in self.dao.iter_batches(filters, batch_size=batch_size):
+            yield batch
+
+    @property
+    def export_columns(self) -> list[str]:
+        """iter_batches 未指定字段时每条记录包含的字段名，用作导出文件的表头
+
+        Returns:
+            字段名列表，顺序与模型定义一致
+        """
+        return self.dao.value_fields
+
+    @staticmethod
+    def _wrap_pagination(result: dict[str, Any]) -> dict[str, Any]:
+        """将DAO返回的扁平分页结果转换为 items + pagination 结构
+
+        Args:
+            result: DAO分页结果
+
+        Returns:
+            与 PaginatedResponse 结构一致的字典
+        """
+        return {
+            "items": result["items"],
+            "pagination": {
+                "page": result["page"],
+                "page_size": result["page_size"],
+                "total": result["total"],
+                "total_pages": result["total_pages"],
+                "has_next": result["has_next"],
+                "has_prev": result["has_prev"],
+            },
+        }
 
     @system_log(LogConfig(log_args=True))
     async def count(self, user: str = "system") -> int:
@@ -8,6 +8,7 @@
 
 from typing import Any
 
+from app.core.cache import cached
 from app.models.data_models import Area, Brand, Device, DeviceGroup, DeviceModel
 from app.repositories import AreaDAO, BrandDAO, DeviceDAO, DeviceGroupDAO, DeviceModelDAO
 from app.utils import LogConfig, system_log
@@ -202,6 +203,10 @@ class DeviceService(BaseService[Device, DeviceDAO]):
         """根据管理IP地址获取设备"""
         return await self.dao.get_by_field("management_ip", management_ip)
 
+    async def get_detail_by_ip(self, management_ip: str) -> dict[str, Any] | None:
+        """根据管理IP地址获取设备详情（包含关联数据的嵌套字典）"""
+        return await self.dao.get_detail(management_ip=management_ip)
+
     @system_log(LogConfig(log_args=True, log_result=False))
     async def get_by_name(self, name: str, user: str = "system") -> Device | None:
         """根据名称获取设备"""
@@ -210,17 +215,17 @@ class DeviceService(BaseService[Device, DeviceDAO]):
     @system_log(LogConfig(log_args=True, log_result=False))
     async def get_by_area(self, area_id: int, user: str = "system") -> list[Device]:
         """获取指定区域的所有设备"""
-        return await self.dao.list_by_filters(filters={"area_id": area_id})
+        return await self.dao.list_by_filters(filters={"area_id": area_id, "is_deleted": False})
 
     @system_log(LogConfig(log_args=True, log_result=False))
     async def get_by_group(self, group_id: int, user: str = "system") -> list[Device]:
         """获取指定分组的所有设备"""
-        return await self.dao.list_by_filters(filters={"device_group_id": group_id})
+        return await self.dao.list_by_filters(filters={"device_group_id": group_id, "is_deleted": False})
 
     @system_log(LogConfig(log_args=True, log_result=False))
     async def get_by_status(self, status: str, user: str = "system") -> list[Device]:
         """根据状态获取设备"""
-        return await self.dao.list_by_filters(filters={"status": status})
+        return await self.dao.list_by_filters(filters={"status": status, "is_deleted": False})
 
     @system_log(LogConfig(log_args=True, log_result=False))
     async def search_devices(self, keyword: str, user: str = "system") -> list[Device]:
@@ -228,6 +233,7 @@ class DeviceService(BaseService[Device, DeviceDAO]):
         search_result = await self.dao.search_devices(keyword=keyword)
         return search_result.get("items", []) if isinstance(search_result, dict) else search_result
 
+    @cached("stats:devices", ttl=15)
     @system_log(LogConfig(log_args=True))
     async def get_device_statistics(self, user: str = "system") -> dict[str, Any]:
         """获取设备统计信息"""
@@ -19,6 +19,8 @@ from .base_service import BaseService
 class OperationLogService(BaseService[OperationLog, OperationLogDAO]):
     """操作日志服务类"""
 
+    default_order_by = ("-created_at",)
+
     def __init__(self):
         super().__init__(OperationLogDAO())
 
@@ -31,25 +33,49 @@ class OperationLogService(BaseService[OperationLog, OperationLogDAO]):
         if not data.get("user"):
             raise ValueError("操作用户不能为空")
 
+    async def _list_recent(self, filters: dict[str, Any], limit: int, before: datetime | None) -> list[OperationLog]:
+        """按创建时间倒序获取最近的操作日志
+
+        Args:
+            filters: 过滤条件
+            limit: 最大返回条数
+            before: 可选，仅返回该时间之前的日志，用于向前翻页
+
+        Returns:
+            操作日志列表
+        """
+        if before is not None:
+            filters["created_at__lt"] = before
+        return await self.dao.list_by_filters(filters=filters, order_by=["-created_at"], limit=limit)
+
     @system_log(LogConfig(log_args=True, log_result=False))
-    async def get_by_user(self, user: str, user_request: str = "system") -> list[OperationLog]:
+    async def get_by_user(
+        self, user: str, limit: int = 100, before: datetime | None = None, user_request: str = "system"
+    ) -> list[OperationLog]:
         """获取指定用户的操作日志"""
-        return await self.dao.list_by_filters(filters={"user": user})
+        return await self._list_recent({"user": user}, limit, before)
 
     @system_log(LogConfig(log_args=True, log_result=False))
     async def get_by_resource(
-        self, resource_type: str, resource_id: int | None = None, user: str = "system"
+        self,
+        resource_type: str,
+        resource_id: int | None = None,
+        limit: int = 100,
+        before: datetime | None = None,
+        user: str = "system",
     ) -> list[OperationLog]:
         """获取指定资源的操作日志"""
         filters: dict[str, Any] = {"resource_type": resource_type}
         if resource_id is not None:
             filters["resource_id"] = resource_id
-        return await self.dao.list_by_filters(filters=filters)
+        return await self._list_recent(filters, limit, before)
 
     @system_log(LogConfig(log_args=True, log_result=False))
-    async def get_by_action(self, action: str, user: str = "system") -> list[OperationLog]:
+    async def get_by_action(
+        self, action: str, limit: int = 100, before: datetime | None = None, user: str = "system"
+    ) -> list[OperationLog]:
         """获取指定动作的操作日志"""
-        return await self.dao.list_by_filters(filters={"action": action})
+        return await self._list_recent({"action": action}, limit, before)
 
     @system_log(LogConfig(log_args=True, log_result=False))
     async def get_by_date_range(
@@ -109,10 +135,23 @@ class OperationLogService(BaseService[OperationLog, OperationLogDAO]):
             "by_action": action_stats,
         }
 
+    @system_log(LogConfig(log_args=True))
+    async def count_by_result(self, user: str = "system") -> dict[str, int]:
+        """按操作结果统计操作日志数量（单条 GROUP BY 查询）"""
+        counts = await self.dao.get_count_by_status("result")
+        return {getattr(key, "value", key): count for key, count in counts.items()}
+
+    @system_log(LogConfig(log_args=True))
+    async def clean_old_logs(self, days: int, user: str = "system") -> int:
+        """清理指定天数之前的操作日志，返回删除数量"""
+        return await self.dao.clean_old_operation_logs(days=days)
+
 
 class SystemLogService(BaseService[SystemLog, SystemLogDAO]):
     """系统日志服务类"""
 
+    default_order_by = ("-created_at",)
+
     def __init__(self):
         super().__init__(SystemLogDAO())
 
@@ -197,3 +236,14 @@ class SystemLogService(BaseService[SystemLog, SystemLogDAO]):
         return await self.dao.list_by_filters(
             filters={"level": "ERROR", "created_at__gte": since}, order_by=["-created_at"]
         )
+
+    @system_log(LogConfig(log_args=True))
+    async def count_by_level(self, user: str = "system") -> dict[str, int]:
+        """按日志级别统计系统日志数量（单条 GROUP BY 查询）"""
+        counts = await self.dao.get_count_by_status("level")
+        return {getattr(key, "value", key): count for key, count in counts.items()}
+
+    @system_log(LogConfig(log_args=True))
+    async def clean_old_logs(self, days: int, user: str = "system") -> int:
+        """清理指定天数之前的系统日志，返回删除数量"""
+        return await self.dao.clean_old_system_logs(days=days)
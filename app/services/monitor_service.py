@@ -9,6 +9,8 @@
 from datetime import datetime
 from typing import Any
 
+from app.core.exceptions import ConflictException
+from app.models.data_enum import AlertStatusEnum
 from app.models.data_models import Alert, MonitorMetric
 from app.repositories import AlertDAO, MonitorMetricDAO
 from app.utils import LogConfig, system_log
@@ -19,6 +21,9 @@ from .base_service import BaseService
 class MonitorMetricService(BaseService[MonitorMetric, MonitorMetricDAO]):
     """监控指标服务类"""
 
+    time_range_field = "collected_at"
+    default_order_by = ("-collected_at",)
+
     def __init__(self):
         super().__init__(MonitorMetricDAO())
 
@@ -33,18 +38,34 @@ class MonitorMetricService(BaseService[MonitorMetric, MonitorMetricDAO]):
 
     @system_log(LogConfig(log_args=True, log_result=False))
     async def get_by_device(
-        self, device_id: int, metric_type: str | None = None, user: str = "system"
-    ) -> list[MonitorMetric]:
-        """获取设备的监控指标"""
-        filters: dict[str, Any] = {"device_id": device_id}
+        self, device_id: int, metric_type: str | None = None, limit: int = 100, user: str = "system"
+    ) -> list[dict[str, Any]]:
+        """获取设备最近的监控指标（按采集时间倒序）"""
         if metric_type:
-            filters["metric_type"] = metric_type
-        return await self.dao.list_by_filters(filters=filters)
+            return await self.dao.list_by_device_and_metric_type(device_id, metric_type, limit=limit)
+        return await self.dao.list_by_device(device_id, limit=limit)
+
+    async def get_device_list_version(
+        self, device_id: int, metric_type: str | None = None, limit: int = 100
+    ) -> tuple[str, datetime | None]:
+        """获取 get_by_device 同一范围内的列表版本标识（只读取 id 与 updated_at 列，不记录日志）
+
+        Args:
+            device_id: 设备ID
+            metric_type: 指标类型
+            limit: 最大条数
+
+        Returns:
+            (窗口内指标 id 的摘要, 指标及其关联设备数据中最新的更新时间)，没有指标时更新时间为None
+        """
+        return await self.dao.get_device_list_version(device_id, metric_type, limit=limit)
 
 
 class AlertService(BaseService[Alert, AlertDAO]):
     """告警服务类"""
 
+    default_order_by = ("-created_at",)
+
     def __init__(self):
         super().__init__(AlertDAO())
 
@@ -61,7 +82,40 @@ class AlertService(BaseService[Alert, AlertDAO]):
 
     @system_log(LogConfig(log_args=True))
     async def acknowledge_alert(self, alert_id: int, user: str = "system") -> Alert | None:
-        """确认告警"""
-        return await self.dao.update_by_id(
-            alert_id, status="acknowledged", acknowledged_at=datetime.now(), acknowledged_by=user
+        """确认告警，仅活跃状态的告警可被确认"""
+        return await self._transition_alert(
+            alert_id,
+            [AlertStatusEnum.ACTIVE],
+            status=AlertStatusEnum.ACKNOWLEDGED,
+            acknowledged_at=datetime.now(),
+            acknowledged_by=user,
+        )
+
+    @system_log(LogConfig(log_args=True))
+    async def resolve_alert(self, alert_id: int, user: str = "system") -> Alert | None:
+        """解决告警，仅活跃或已确认状态的告警可被解决"""
+        return await self._transition_alert(
+            alert_id,
+            [AlertStatusEnum.ACTIVE, AlertStatusEnum.ACKNOWLEDGED],
+            status=AlertStatusEnum.RESOLVED,
+            resolved_at=datetime.now(),
         )
+
+    async def _transition_alert(self, alert_id: int, from_statuses: list[AlertStatusEnum], **kwargs) -> Alert | None:
+        """以单条条件 UPDATE 完成告警状态流转，避免先查询后写入的竞态
+
+        Args:
+            alert_id: 告警ID
+            from_statuses: 允许流转的当前状态
+            **kwargs: 更新的字段值
+
+        Returns:
+            更新后的告警；告警不存在时返回None
+
+        Raises:
+            ConflictException: 告警存在但当前状态不允许该流转
+        """
+        alert = await self.dao.update_by_id_if(alert_id, {"status__in": from_statuses}, **kwargs)
+        if alert is None and await self.dao.exists_by_id(alert_id):
+            raise ConflictException(message="告警当前状态不允许该操作")
+        return alert
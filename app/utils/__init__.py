@@ -8,8 +8,17 @@
  @Docs: 实用程序模块
 """
 
+from .http_cache import (
+    build_etag,
+    cache_headers,
+    etag_matches,
+    latest_updated_at,
+    not_modified_response,
+    shared_cache_control,
+)
 from .log_decorators import LogConfig, LogConfigs, system_log
 from .logger import log_function_calls, logger
+from .responses import SUCCESS_PAGE_SUFFIX, paginated_response, success_page_prefix
 
 __all__ = [
     "logger",
@@ -17,4 +26,13 @@ __all__ = [
     "system_log",
     "LogConfig",
     "LogConfigs",
+    "build_etag",
+    "etag_matches",
+    "latest_updated_at",
+    "cache_headers",
+    "not_modified_response",
+    "shared_cache_control",
+    "paginated_response",
+    "success_page_prefix",
+    "SUCCESS_PAGE_SUFFIX",
 ]
@@ -0,0 +1,104 @@
+"""
+@Author: li
+@Email: lijianqiao2906@live.com
+@FileName: http_cache.py
+@DateTime: 2025-06-17
+@Docs: HTTP条件请求工具，基于 ETag / If-None-Match 实现304短路
+"""
+
+from datetime import datetime
+from typing import Any
+
+from fastapi import Request, Response, status
+
+DEFAULT_CACHE_CONTROL = "private, max-age=5"
+# 仪表盘高频轮询的只读接口，允许反向代理在短时间内直接返回缓存
+SHARED_CACHE_CONTROL = "public, max-age=5, stale-while-revalidate=10"
+
+
+def build_etag(resource_id: int | str, updated_at: datetime) -> str:
+    """根据记录ID与更新时间生成弱ETag
+
+    Args:
+        resource_id: 记录ID，列表资源可传入由ID与条数组成的字符串
+        updated_at: 记录更新时间
+
+    Returns:
+        弱ETag字符串
+    """
+    return f'W/"{resource_id}-{updated_at.timestamp()}"'
+
+
+def latest_updated_at(data: dict[str, Any]) -> datetime:
+    """取嵌套数据中记录自身及各关联记录最新的更新时间
+
+    响应中内嵌了关联对象时，关联记录的修改不会改变主记录的 updated_at，
+    ETag 需要以全部内嵌对象中最新的更新时间生成。
+
+    Args:
+        data: 包含 updated_at 的嵌套字典
+
+    Returns:
+        最新的更新时间
+    """
+    latest = data["updated_at"]
+    for value in data.values():
+        if isinstance(value, dict) and "updated_at" in value:
+            latest = max(latest, latest_updated_at(value))
+    return latest
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """判断客户端 If-None-Match 是否命中当前ETag
+
+    Args:
+        if_none_match: 请求头 If-None-Match 的值
+        etag: 当前资源的ETag
+
+    Returns:
+        是否命中
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def cache_headers(etag: str, cache_control: str = DEFAULT_CACHE_CONTROL) -> dict[str, str]:
+    """构造条件请求相关的响应头
+
+    Args:
+        etag: 当前资源的ETag
+        cache_control: Cache-Control 头的值
+
+    Returns:
+        包含 ETag 与 Cache-Control 的响应头字典
+    """
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified_response(request: Request, headers: dict[str, str]) -> Response | None:
+    """客户端缓存仍有效时构造304响应
+
+    Args:
+        request: 当前请求
+        headers: cache_headers 生成的响应头
+
+    Returns:
+        命中时返回304响应，否则返回None
+    """
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def shared_cache_control(response: Response) -> None:
+    """为只读接口设置可被反向代理缓存的 Cache-Control，作为路由依赖使用
+
+    以依赖形式设置响应头，结果缓存命中、未执行接口函数时同样生效。
+
+    Args:
+        response: FastAPI 注入的响应对象
+    """
+    response.headers["Cache-Control"] = SHARED_CACHE_CONTROL
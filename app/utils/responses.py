@@ -0,0 +1,53 @@
+"""
+@Author: li
+@Email: lijianqiao2906@live.com
+@FileName: responses.py
+@DateTime: 2025-06-17
+@Docs: 分页列表响应工具，由pydantic-core一次性序列化列表数据，绕过 response_model 的二次校验
+"""
+
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# 不带统一包装的分页响应：{"items": [...], "pagination": {...}}
+PAGE_PREFIX = b'{"items":'
+PAGE_SUFFIX = b"}"
+# 带统一成功包装的分页响应：{"success": true, "message": ..., "data": {"items": ..., "pagination": ...}, "code": 200}
+SUCCESS_PAGE_SUFFIX = b'},"code":200}'
+
+
+def success_page_prefix(message: str) -> bytes:
+    """预先序列化统一成功包装中位于列表数据之前的固定部分
+
+    Args:
+        message: 响应消息
+
+    Returns:
+        序列化后的响应前缀，与 SUCCESS_PAGE_SUFFIX 配对使用
+    """
+    return b'{"success":true,"message":' + orjson.dumps(message) + b',"data":' + PAGE_PREFIX
+
+
+def paginated_response(
+    adapter: TypeAdapter,
+    result: dict[str, Any],
+    prefix: bytes = PAGE_PREFIX,
+    suffix: bytes = PAGE_SUFFIX,
+) -> Response:
+    """由pydantic-core一次性序列化列表数据，再与前缀及分页信息拼接
+
+    Args:
+        adapter: 列表响应模型的 TypeAdapter
+        result: 服务层返回的分页结果
+        prefix: 列表数据之前的固定部分
+        suffix: 分页信息之后的固定部分
+
+    Returns:
+        application/json 响应
+    """
+    items_json = adapter.dump_json(adapter.validate_python(result["items"]))
+    body = prefix + items_json + b',"pagination":' + orjson.dumps(result["pagination"]) + suffix
+    return Response(content=body, media_type="application/json")
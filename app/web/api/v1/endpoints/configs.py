@@ -34,7 +34,7 @@ async def create_config_template(
         template = await config_service.create(data.model_dump())
         return SuccessResponse(
             message="配置模板创建成功",
-            data=ConfigTemplateResponse.model_validate(template, from_attributes=True),
+            data=ConfigTemplateResponse.model_validate(template),
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -57,9 +57,7 @@ async def list_config_templates(
             user="system",
         )
 
-        templates = [
-            ConfigTemplateResponse.model_validate(template, from_attributes=True) for template in result["items"]
-        ]
+        templates = [ConfigTemplateResponse.model_validate(template) for template in result["items"]]
 
         return SuccessResponse(
             message="获取配置模板列表成功",
@@ -86,7 +84,7 @@ async def get_config_template(
 
     return SuccessResponse(
         message="获取配置模板详情成功",
-        data=ConfigTemplateResponse.model_validate(template, from_attributes=True),
+        data=ConfigTemplateResponse.model_validate(template),
     )
 
 
@@ -108,7 +106,7 @@ async def update_config_template(
 
         return SuccessResponse(
             message="配置模板更新成功",
-            data=ConfigTemplateResponse.model_validate(template, from_attributes=True),
+            data=ConfigTemplateResponse.model_validate(template),
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -149,9 +147,7 @@ async def get_templates_by_type(
     """根据类型获取配置模板"""
     try:
         templates = await config_service.get_by_type(template_type)
-        template_list = [
-            ConfigTemplateResponse.model_validate(template, from_attributes=True) for template in templates
-        ]
+        template_list = [ConfigTemplateResponse.model_validate(template) for template in templates]
 
         return SuccessResponse(
             message=f"获取到 {len(template_list)} 个配置模板",
@@ -171,9 +167,7 @@ async def search_config_templates(
     """搜索配置模板"""
     try:
         templates = await config_service.search_templates(keyword)
-        template_list = [
-            ConfigTemplateResponse.model_validate(template, from_attributes=True) for template in templates
-        ]
+        template_list = [ConfigTemplateResponse.model_validate(template) for template in templates]
 
         return SuccessResponse(
             message=f"搜索到 {len(template_list)} 个配置模板",
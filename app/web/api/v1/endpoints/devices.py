@@ -6,7 +6,11 @@
 @Docs: 设备管理相关API端点
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Any
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import IPvAnyAddress, TypeAdapter
 
 from app.core.dependencies import (
     AreaServiceDep,
@@ -41,9 +45,115 @@ from app.schemas import (
     StatusResponse,
     SuccessResponse,
 )
+from app.utils import (
+    SUCCESS_PAGE_SUFFIX,
+    build_etag,
+    cache_headers,
+    latest_updated_at,
+    not_modified_response,
+    paginated_response,
+    success_page_prefix,
+)
 
 router = APIRouter(prefix="/devices", tags=["设备管理"])
 
+
+# 成功响应消息，作为模块级常量在各请求间复用
+_MSG_BRAND_CREATED = "品牌创建成功"
+_MSG_BRAND_LIST = "获取品牌列表成功"
+_MSG_BRAND_DETAIL = "获取品牌详情成功"
+_MSG_BRAND_UPDATED = "品牌更新成功"
+_MSG_DEVICE_MODEL_CREATED = "设备型号创建成功"
+_MSG_DEVICE_MODEL_LIST = "获取设备型号列表成功"
+_MSG_DEVICE_MODEL_DETAIL = "获取设备型号详情成功"
+_MSG_DEVICE_MODEL_UPDATED = "设备型号更新成功"
+_MSG_AREA_CREATED = "区域创建成功"
+_MSG_AREA_LIST = "获取区域列表成功"
+_MSG_AREA_DETAIL = "获取区域详情成功"
+_MSG_AREA_UPDATED = "区域更新成功"
+_MSG_DEVICE_GROUP_CREATED = "设备分组创建成功"
+_MSG_DEVICE_GROUP_LIST = "获取设备分组列表成功"
+_MSG_DEVICE_GROUP_DETAIL = "获取设备分组详情成功"
+_MSG_DEVICE_GROUP_UPDATED = "设备分组更新成功"
+_MSG_DEVICE_CREATED = "设备创建成功"
+_MSG_DEVICE_LIST = "获取设备列表成功"
+_MSG_DEVICE_DETAIL = "获取设备详情成功"
+_MSG_DEVICE_UPDATED = "设备更新成功"
+_MSG_DEVICE_STATUS_UPDATED = "设备状态更新成功"
+_MSG_DEVICE_BY_IP = "获取设备信息成功"
+_MSG_DEVICE_STATISTICS = "获取设备统计信息成功"
+
+
+def _orjson_response(
+    message: str,
+    data: Any,
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """使用orjson直接构造成功响应，跳过SuccessResponse包装模型的构造与校验
+
+    Args:
+        message: 响应消息
+        data: 响应数据
+        status_code: HTTP状态码
+        headers: 额外响应头
+
+    Returns:
+        application/json 响应
+    """
+    payload = orjson.dumps(
+        {"success": True, "message": message, "data": data, "code": 200},
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS,
+    )
+    return Response(content=payload, status_code=status_code, headers=headers, media_type="application/json")
+
+
+def _status_body(message: str) -> bytes:
+    """预先序列化删除类接口的固定响应体
+
+    Args:
+        message: 响应消息
+
+    Returns:
+        序列化后的响应体
+    """
+    return orjson.dumps(
+        {"success": True, "message": message, "data": {"status": "success", "message": message}, "code": 200}
+    )
+
+
+def _json_bytes_response(body: bytes) -> Response:
+    """直接返回预先序列化的响应体
+
+    Args:
+        body: 序列化后的响应体
+
+    Returns:
+        application/json 响应
+    """
+    return Response(content=body, media_type="application/json")
+
+
+_BODY_BRAND_DELETED = _status_body("品牌删除成功")
+_BODY_DEVICE_MODEL_DELETED = _status_body("设备型号删除成功")
+_BODY_AREA_DELETED = _status_body("区域删除成功")
+_BODY_DEVICE_GROUP_DELETED = _status_body("设备分组删除成功")
+_BODY_DEVICE_DELETED = _status_body("设备删除成功")
+
+_BRAND_LIST_ADAPTER = TypeAdapter(list[BrandResponse])
+_DEVICE_MODEL_LIST_ADAPTER = TypeAdapter(list[DeviceModelResponse])
+_AREA_LIST_ADAPTER = TypeAdapter(list[AreaResponse])
+_DEVICE_GROUP_LIST_ADAPTER = TypeAdapter(list[DeviceGroupResponse])
+_DEVICE_LIST_ADAPTER = TypeAdapter(list[DeviceResponse])
+
+_BRAND_LIST_PREFIX = success_page_prefix(_MSG_BRAND_LIST)
+_DEVICE_MODEL_LIST_PREFIX = success_page_prefix(_MSG_DEVICE_MODEL_LIST)
+_AREA_LIST_PREFIX = success_page_prefix(_MSG_AREA_LIST)
+_DEVICE_GROUP_LIST_PREFIX = success_page_prefix(_MSG_DEVICE_GROUP_LIST)
+_DEVICE_LIST_PREFIX = success_page_prefix(_MSG_DEVICE_LIST)
+
+
 # ================================ 品牌管理 ================================
 
 
@@ -51,13 +161,12 @@ router = APIRouter(prefix="/devices", tags=["设备管理"])
 async def create_brand(
     data: BrandCreate,
     brand_service: BrandServiceDep,
-) -> SuccessResponse[BrandResponse]:
+) -> Response:
     """创建设备品牌"""
     try:
         brand = await brand_service.create(data.model_dump())
-        return SuccessResponse(
-            message="品牌创建成功",
-            data=BrandResponse.model_validate(brand, from_attributes=True),
+        return _orjson_response(
+            _MSG_BRAND_CREATED, BrandResponse.model_validate(brand).model_dump(), status_code=status.HTTP_201_CREATED
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -69,7 +178,7 @@ async def create_brand(
 async def list_brands(
     brand_service: BrandServiceDep,
     params: BrandQueryParams = Depends(),
-) -> SuccessResponse[PaginatedResponse[BrandResponse]]:
+) -> Response:
     """获取品牌列表"""
     try:
         result = await brand_service.get_paginated(
@@ -77,15 +186,7 @@ async def list_brands(
             page_size=params.page_size,
         )
 
-        brands = [BrandResponse.model_validate(brand, from_attributes=True) for brand in result["items"]]
-
-        return SuccessResponse(
-            message="获取品牌列表成功",
-            data=PaginatedResponse(
-                items=brands,
-                pagination=result["pagination"],
-            ),
-        )
+        return paginated_response(_BRAND_LIST_ADAPTER, result, _BRAND_LIST_PREFIX, SUCCESS_PAGE_SUFFIX)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"获取品牌列表失败: {str(e)}"
@@ -95,17 +196,20 @@ async def list_brands(
 @router.get("/brands/{brand_id}", response_model=SuccessResponse[BrandResponse])
 async def get_brand(
     brand_id: int,
+    request: Request,
     brand_service: BrandServiceDep,
-) -> SuccessResponse[BrandResponse]:
+) -> Response:
     """获取品牌详情"""
-    brand = await brand_service.get_by_id(brand_id)
+    brand = await brand_service.get_detail(brand_id)
     if not brand:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="品牌不存在")
 
-    return SuccessResponse(
-        message="获取品牌详情成功",
-        data=BrandResponse.model_validate(brand, from_attributes=True),
-    )
+    headers = cache_headers(build_etag(brand["id"], latest_updated_at(brand)))
+    not_modified = not_modified_response(request, headers)
+    if not_modified:
+        return not_modified
+
+    return _orjson_response(_MSG_BRAND_DETAIL, BrandResponse.model_validate(brand).model_dump(), headers=headers)
 
 
 @router.put("/brands/{brand_id}", response_model=SuccessResponse[BrandResponse])
@@ -113,7 +217,7 @@ async def update_brand(
     brand_id: int,
     data: BrandUpdate,
     brand_service: BrandServiceDep,
-) -> SuccessResponse[BrandResponse]:
+) -> Response:
     """更新品牌信息"""
     try:
         # 过滤掉None值
@@ -125,10 +229,7 @@ async def update_brand(
         if not brand:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="品牌不存在")
 
-        return SuccessResponse(
-            message="品牌更新成功",
-            data=BrandResponse.model_validate(brand, from_attributes=True),
-        )
+        return _orjson_response(_MSG_BRAND_UPDATED, BrandResponse.model_validate(brand).model_dump())
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
@@ -139,16 +240,13 @@ async def update_brand(
 async def delete_brand(
     brand_id: int,
     brand_service: BrandServiceDep,
-) -> SuccessResponse[StatusResponse]:
+) -> Response:
     """删除品牌"""
     try:
         success = await brand_service.delete(brand_id)
         if not success:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="品牌不存在")
-        return SuccessResponse(
-            message="品牌删除成功",
-            data=StatusResponse(status="success", message="品牌删除成功"),
-        )
+        return _json_bytes_response(_BODY_BRAND_DELETED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
@@ -162,13 +260,14 @@ async def delete_brand(
 async def create_device_model(
     data: DeviceModelCreate,
     device_model_service: DeviceModelServiceDep,
-) -> SuccessResponse[DeviceModelResponse]:
+) -> Response:
     """创建设备型号"""
     try:
         model = await device_model_service.create(data.model_dump())
-        return SuccessResponse(
-            message="设备型号创建成功",
-            data=DeviceModelResponse.model_validate(model, from_attributes=True),
+        return _orjson_response(
+            _MSG_DEVICE_MODEL_CREATED,
+            DeviceModelResponse.model_validate(model).model_dump(),
+            status_code=status.HTTP_201_CREATED,
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -182,7 +281,7 @@ async def create_device_model(
 async def list_device_models(
     device_model_service: DeviceModelServiceDep,
     params: DeviceModelQueryParams = Depends(),
-) -> SuccessResponse[PaginatedResponse[DeviceModelResponse]]:
+) -> Response:
     """获取设备型号列表"""
     try:
         result = await device_model_service.get_paginated(
@@ -190,15 +289,7 @@ async def list_device_models(
             page_size=params.page_size,
         )
 
-        models = [DeviceModelResponse.model_validate(model, from_attributes=True) for model in result["items"]]
-
-        return SuccessResponse(
-            message="获取设备型号列表成功",
-            data=PaginatedResponse(
-                items=models,
-                pagination=result["pagination"],
-            ),
-        )
+        return paginated_response(_DEVICE_MODEL_LIST_ADAPTER, result, _DEVICE_MODEL_LIST_PREFIX, SUCCESS_PAGE_SUFFIX)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"获取设备型号列表失败: {str(e)}"
@@ -208,16 +299,21 @@ async def list_device_models(
 @router.get("/models/{model_id}", response_model=SuccessResponse[DeviceModelResponse])
 async def get_device_model(
     model_id: int,
+    request: Request,
     device_model_service: DeviceModelServiceDep,
-) -> SuccessResponse[DeviceModelResponse]:
+) -> Response:
     """获取设备型号详情"""
-    model = await device_model_service.get_by_id(model_id)
+    model = await device_model_service.get_detail(model_id)
     if not model:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备型号不存在")
 
-    return SuccessResponse(
-        message="获取设备型号详情成功",
-        data=DeviceModelResponse.model_validate(model, from_attributes=True),
+    headers = cache_headers(build_etag(model["id"], latest_updated_at(model)))
+    not_modified = not_modified_response(request, headers)
+    if not_modified:
+        return not_modified
+
+    return _orjson_response(
+        _MSG_DEVICE_MODEL_DETAIL, DeviceModelResponse.model_validate(model).model_dump(), headers=headers
     )
 
 
@@ -226,7 +322,7 @@ async def update_device_model(
     model_id: int,
     data: DeviceModelUpdate,
     device_model_service: DeviceModelServiceDep,
-) -> SuccessResponse[DeviceModelResponse]:
+) -> Response:
     """更新设备型号信息"""
     try:
         update_data = {k: v for k, v in data.model_dump().items() if v is not None}
@@ -237,10 +333,7 @@ async def update_device_model(
         if not model:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备型号不存在")
 
-        return SuccessResponse(
-            message="设备型号更新成功",
-            data=DeviceModelResponse.model_validate(model, from_attributes=True),
-        )
+        return _orjson_response(_MSG_DEVICE_MODEL_UPDATED, DeviceModelResponse.model_validate(model).model_dump())
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
@@ -253,17 +346,14 @@ async def update_device_model(
 async def delete_device_model(
     model_id: int,
     device_model_service: DeviceModelServiceDep,
-) -> SuccessResponse[StatusResponse]:
+) -> Response:
     """删除设备型号"""
     try:
         success = await device_model_service.delete(model_id)
         if not success:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备型号不存在")
 
-        return SuccessResponse(
-            message="设备型号删除成功",
-            data=StatusResponse(status="success", message="设备型号删除成功"),
-        )
+        return _json_bytes_response(_BODY_DEVICE_MODEL_DELETED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
@@ -279,13 +369,12 @@ async def delete_device_model(
 async def create_area(
     data: AreaCreate,
     area_service: AreaServiceDep,
-) -> SuccessResponse[AreaResponse]:
+) -> Response:
     """创建区域"""
     try:
         area = await area_service.create(data.model_dump())
-        return SuccessResponse(
-            message="区域创建成功",
-            data=AreaResponse.model_validate(area, from_attributes=True),
+        return _orjson_response(
+            _MSG_AREA_CREATED, AreaResponse.model_validate(area).model_dump(), status_code=status.HTTP_201_CREATED
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -297,7 +386,7 @@ async def create_area(
 async def list_areas(
     area_service: AreaServiceDep,
     params: AreaQueryParams = Depends(),
-) -> SuccessResponse[PaginatedResponse[AreaResponse]]:
+) -> Response:
     """获取区域列表"""
     try:
         result = await area_service.get_paginated(
@@ -305,15 +394,7 @@ async def list_areas(
             page_size=params.page_size,
         )
 
-        areas = [AreaResponse.model_validate(area, from_attributes=True) for area in result["items"]]
-
-        return SuccessResponse(
-            message="获取区域列表成功",
-            data=PaginatedResponse(
-                items=areas,
-                pagination=result["pagination"],
-            ),
-        )
+        return paginated_response(_AREA_LIST_ADAPTER, result, _AREA_LIST_PREFIX, SUCCESS_PAGE_SUFFIX)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"获取区域列表失败: {str(e)}"
@@ -323,17 +404,20 @@ async def list_areas(
 @router.get("/areas/{area_id}", response_model=SuccessResponse[AreaResponse])
 async def get_area(
     area_id: int,
+    request: Request,
     area_service: AreaServiceDep,
-) -> SuccessResponse[AreaResponse]:
+) -> Response:
     """获取区域详情"""
-    area = await area_service.get_by_id(area_id)
+    area = await area_service.get_detail(area_id)
     if not area:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="区域不存在")
 
-    return SuccessResponse(
-        message="获取区域详情成功",
-        data=AreaResponse.model_validate(area, from_attributes=True),
-    )
+    headers = cache_headers(build_etag(area["id"], latest_updated_at(area)))
+    not_modified = not_modified_response(request, headers)
+    if not_modified:
+        return not_modified
+
+    return _orjson_response(_MSG_AREA_DETAIL, AreaResponse.model_validate(area).model_dump(), headers=headers)
 
 
 @router.put("/areas/{area_id}", response_model=SuccessResponse[AreaResponse])
@@ -341,7 +425,7 @@ async def update_area(
     area_id: int,
     data: AreaUpdate,
     area_service: AreaServiceDep,
-) -> SuccessResponse[AreaResponse]:
+) -> Response:
     """更新区域信息"""
     try:
         update_data = {k: v for k, v in data.model_dump().items() if v is not None}
@@ -352,10 +436,7 @@ async def update_area(
         if not area:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="区域不存在")
 
-        return SuccessResponse(
-            message="区域更新成功",
-            data=AreaResponse.model_validate(area, from_attributes=True),
-        )
+        return _orjson_response(_MSG_AREA_UPDATED, AreaResponse.model_validate(area).model_dump())
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
@@ -366,17 +447,14 @@ async def update_area(
 async def delete_area(
     area_id: int,
     area_service: AreaServiceDep,
-) -> SuccessResponse[StatusResponse]:
+) -> Response:
     """删除区域"""
     try:
         success = await area_service.delete(area_id)
         if not success:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="区域不存在")
 
-        return SuccessResponse(
-            message="区域删除成功",
-            data=StatusResponse(status="success", message="区域删除成功"),
-        )
+        return _json_bytes_response(_BODY_AREA_DELETED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
@@ -390,13 +468,14 @@ async def delete_area(
 async def create_device_group(
     data: DeviceGroupCreate,
     device_group_service: DeviceGroupServiceDep,
-) -> SuccessResponse[DeviceGroupResponse]:
+) -> Response:
     """创建设备分组"""
     try:
         group = await device_group_service.create(data.model_dump())
-        return SuccessResponse(
-            message="设备分组创建成功",
-            data=DeviceGroupResponse.model_validate(group, from_attributes=True),
+        return _orjson_response(
+            _MSG_DEVICE_GROUP_CREATED,
+            DeviceGroupResponse.model_validate(group).model_dump(),
+            status_code=status.HTTP_201_CREATED,
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -410,7 +489,7 @@ async def create_device_group(
 async def list_device_groups(
     device_group_service: DeviceGroupServiceDep,
     params: DeviceGroupQueryParams = Depends(),
-) -> SuccessResponse[PaginatedResponse[DeviceGroupResponse]]:
+) -> Response:
     """获取设备分组列表"""
     try:
         result = await device_group_service.get_paginated(
@@ -418,15 +497,7 @@ async def list_device_groups(
             page_size=params.page_size,
         )
 
-        groups = [DeviceGroupResponse.model_validate(group, from_attributes=True) for group in result["items"]]
-
-        return SuccessResponse(
-            message="获取设备分组列表成功",
-            data=PaginatedResponse(
-                items=groups,
-                pagination=result["pagination"],
-            ),
-        )
+        return paginated_response(_DEVICE_GROUP_LIST_ADAPTER, result, _DEVICE_GROUP_LIST_PREFIX, SUCCESS_PAGE_SUFFIX)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"获取设备分组列表失败: {str(e)}"
@@ -436,16 +507,21 @@ async def list_device_groups(
 @router.get("/groups/{group_id}", response_model=SuccessResponse[DeviceGroupResponse])
 async def get_device_group(
     group_id: int,
+    request: Request,
     device_group_service: DeviceGroupServiceDep,
-) -> SuccessResponse[DeviceGroupResponse]:
+) -> Response:
     """获取设备分组详情"""
-    group = await device_group_service.get_by_id(group_id)
+    group = await device_group_service.get_detail(group_id)
     if not group:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备分组不存在")
 
-    return SuccessResponse(
-        message="获取设备分组详情成功",
-        data=DeviceGroupResponse.model_validate(group, from_attributes=True),
+    headers = cache_headers(build_etag(group["id"], latest_updated_at(group)))
+    not_modified = not_modified_response(request, headers)
+    if not_modified:
+        return not_modified
+
+    return _orjson_response(
+        _MSG_DEVICE_GROUP_DETAIL, DeviceGroupResponse.model_validate(group).model_dump(), headers=headers
     )
 
 
@@ -454,7 +530,7 @@ async def update_device_group(
     group_id: int,
     data: DeviceGroupUpdate,
     device_group_service: DeviceGroupServiceDep,
-) -> SuccessResponse[DeviceGroupResponse]:
+) -> Response:
     """更新设备分组信息"""
     try:
         update_data = {k: v for k, v in data.model_dump().items() if v is not None}
@@ -465,10 +541,7 @@ async def update_device_group(
         if not group:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备分组不存在")
 
-        return SuccessResponse(
-            message="设备分组更新成功",
-            data=DeviceGroupResponse.model_validate(group, from_attributes=True),
-        )
+        return _orjson_response(_MSG_DEVICE_GROUP_UPDATED, DeviceGroupResponse.model_validate(group).model_dump())
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
@@ -481,17 +554,14 @@ async def update_device_group(
 async def delete_device_group(
     group_id: int,
     device_group_service: DeviceGroupServiceDep,
-) -> SuccessResponse[StatusResponse]:
+) -> Response:
     """删除设备分组"""
     try:
         success = await device_group_service.delete(group_id)
         if not success:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备分组不存在")
 
-        return SuccessResponse(
-            message="设备分组删除成功",
-            data=StatusResponse(status="success", message="设备分组删除成功"),
-        )
+        return _json_bytes_response(_BODY_DEVICE_GROUP_DELETED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
@@ -507,7 +577,7 @@ async def delete_device_group(
 async def create_device(
     data: DeviceCreate,
     device_service: DeviceServiceDep,
-) -> SuccessResponse[DeviceResponse]:
+) -> Response:
     """创建设备"""
     try:
         device_data = data.model_dump()
@@ -516,9 +586,8 @@ async def create_device(
             device_data["management_ip"] = str(device_data["management_ip"])
 
         device = await device_service.create(device_data)
-        return SuccessResponse(
-            message="设备创建成功",
-            data=DeviceResponse.model_validate(device, from_attributes=True),
+        return _orjson_response(
+            _MSG_DEVICE_CREATED, DeviceResponse.model_validate(device).model_dump(), status_code=status.HTTP_201_CREATED
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -526,11 +595,15 @@ async def create_device(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"创建设备失败: {str(e)}") from e
 
 
-@router.get("", response_model=SuccessResponse[PaginatedResponse[DeviceResponse]])
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": SuccessResponse[PaginatedResponse[DeviceResponse]]}},
+)
 async def list_devices(
     device_service: DeviceServiceDep,
     params: DeviceQueryParams = Depends(),
-) -> SuccessResponse[PaginatedResponse[DeviceResponse]]:
+) -> Response:
     """获取设备列表"""
     try:
         result = await device_service.get_paginated(
@@ -538,35 +611,82 @@ async def list_devices(
             page_size=params.page_size,
         )
 
-        devices = [DeviceResponse.model_validate(device, from_attributes=True) for device in result["items"]]
-
-        return SuccessResponse(
-            message="获取设备列表成功",
-            data=PaginatedResponse(
-                items=devices,
-                pagination=result["pagination"],
-            ),
-        )
+        return paginated_response(_DEVICE_LIST_ADAPTER, result, _DEVICE_LIST_PREFIX, SUCCESS_PAGE_SUFFIX)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"获取设备列表失败: {str(e)}"
         ) from e
 
 
+@router.get(
+    "/search",
+    response_model=None,
+    responses={200: {"model": SuccessResponse[list[DeviceResponse]]}},
+)
+async def search_devices(
+    device_service: DeviceServiceDep,
+    keyword: str = Query(..., min_length=1, description="搜索关键词"),
+) -> Response:
+    """搜索设备"""
+    try:
+        devices = await device_service.search_devices(keyword)
+        device_list = [DeviceResponse.model_validate(device).model_dump() for device in devices]
+
+        return _orjson_response(f"搜索到 {len(device_list)} 个设备", device_list)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"搜索设备失败: {str(e)}") from e
+
+
+@router.get(
+    "/statistics",
+    response_model=None,
+    responses={200: {"model": SuccessResponse[dict]}},
+)
+async def get_device_statistics(
+    device_service: DeviceServiceDep,
+) -> Response:
+    """获取设备统计信息"""
+    try:
+        statistics = await device_service.get_device_statistics()
+        return _orjson_response(_MSG_DEVICE_STATISTICS, statistics)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"获取设备统计失败: {str(e)}"
+        ) from e
+
+
 @router.get("/{device_id}", response_model=SuccessResponse[DeviceResponse])
 async def get_device(
     device_id: int,
+    request: Request,
     device_service: DeviceServiceDep,
-) -> SuccessResponse[DeviceResponse]:
+) -> Response:
     """获取设备详情"""
-    device = await device_service.get_by_id(device_id)
+    device = await device_service.get_detail(device_id)
     if not device:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备不存在")
 
-    return SuccessResponse(
-        message="获取设备详情成功",
-        data=DeviceResponse.model_validate(device, from_attributes=True),
-    )
+    headers = cache_headers(build_etag(device["id"], latest_updated_at(device)))
+    not_modified = not_modified_response(request, headers)
+    if not_modified:
+        return not_modified
+
+    return _orjson_response(_MSG_DEVICE_DETAIL, DeviceResponse.model_validate(device).model_dump(), headers=headers)
+
+
+@router.head("/{device_id}")
+async def head_device(
+    device_id: int,
+    request: Request,
+    device_service: DeviceServiceDep,
+) -> Response:
+    """仅根据设备及其关联数据的更新时间校验设备是否变化，不返回响应体"""
+    updated_at = await device_service.get_updated_at(device_id)
+    if updated_at is None:
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+
+    headers = cache_headers(build_etag(device_id, updated_at))
+    return not_modified_response(request, headers) or Response(headers=headers)
 
 
 @router.put("/{device_id}", response_model=SuccessResponse[DeviceResponse])
@@ -574,7 +694,7 @@ async def update_device(
     device_id: int,
     data: DeviceUpdate,
     device_service: DeviceServiceDep,
-) -> SuccessResponse[DeviceResponse]:
+) -> Response:
     """更新设备信息"""
     try:
         update_data = {k: v for k, v in data.model_dump().items() if v is not None}
@@ -589,10 +709,7 @@ async def update_device(
         if not device:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备不存在")
 
-        return SuccessResponse(
-            message="设备更新成功",
-            data=DeviceResponse.model_validate(device, from_attributes=True),
-        )
+        return _orjson_response(_MSG_DEVICE_UPDATED, DeviceResponse.model_validate(device).model_dump())
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
@@ -603,17 +720,14 @@ async def update_device(
 async def delete_device(
     device_id: int,
     device_service: DeviceServiceDep,
-) -> SuccessResponse[StatusResponse]:
+) -> Response:
     """删除设备"""
     try:
         success = await device_service.delete(device_id)
         if not success:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备不存在")
 
-        return SuccessResponse(
-            message="设备删除成功",
-            data=StatusResponse(status="success", message="设备删除成功"),
-        )
+        return _json_bytes_response(_BODY_DEVICE_DELETED)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except Exception as e:
@@ -625,17 +739,14 @@ async def update_device_status(
     device_id: int,
     data: DeviceStatusUpdate,
     device_service: DeviceServiceDep,
-) -> SuccessResponse[DeviceResponse]:
+) -> Response:
     """更新设备状态"""
     try:
         device = await device_service.update_device_status(device_id, data.status.value)
         if not device:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备不存在")
 
-        return SuccessResponse(
-            message="设备状态更新成功",
-            data=DeviceResponse.model_validate(device, from_attributes=True),
-        )
+        return _orjson_response(_MSG_DEVICE_STATUS_UPDATED, DeviceResponse.model_validate(device).model_dump())
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"更新设备状态失败: {str(e)}"
@@ -644,53 +755,21 @@ async def update_device_status(
 
 @router.get("/by-ip/{management_ip}", response_model=SuccessResponse[DeviceResponse])
 async def get_device_by_ip(
-    management_ip: str,
+    management_ip: IPvAnyAddress,
+    request: Request,
     device_service: DeviceServiceDep,
-) -> SuccessResponse[DeviceResponse]:
+) -> Response:
     """根据IP地址获取设备"""
     try:
-        device = await device_service.get_by_ip(management_ip)
+        device = await device_service.get_detail_by_ip(str(management_ip))
         if not device:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="设备不存在")
 
-        return SuccessResponse(
-            message="获取设备信息成功",
-            data=DeviceResponse.model_validate(device, from_attributes=True),
-        )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"获取设备失败: {str(e)}") from e
-
-
-@router.get("/search", response_model=SuccessResponse[list[DeviceResponse]])
-async def search_devices(
-    device_service: DeviceServiceDep,
-    keyword: str = Query(..., min_length=1, description="搜索关键词"),
-) -> SuccessResponse[list[DeviceResponse]]:
-    """搜索设备"""
-    try:
-        devices = await device_service.search_devices(keyword)
-        device_list = [DeviceResponse.model_validate(device, from_attributes=True) for device in devices]
-
-        return SuccessResponse(
-            message=f"搜索到 {len(device_list)} 个设备",
-            data=device_list,
-        )
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"搜索设备失败: {str(e)}") from e
+        headers = cache_headers(build_etag(device["id"], latest_updated_at(device)))
+        not_modified = not_modified_response(request, headers)
+        if not_modified:
+            return not_modified
 
-
-@router.get("/statistics", response_model=SuccessResponse[dict])
-async def get_device_statistics(
-    device_service: DeviceServiceDep,
-) -> SuccessResponse[dict]:
-    """获取设备统计信息"""
-    try:
-        statistics = await device_service.get_device_statistics()
-        return SuccessResponse(
-            message="获取设备统计信息成功",
-            data=statistics,
-        )
+        return _orjson_response(_MSG_DEVICE_BY_IP, DeviceResponse.model_validate(device).model_dump(), headers=headers)
     except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"获取设备统计失败: {str(e)}"
-        ) from e
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"获取设备失败: {str(e)}") from e
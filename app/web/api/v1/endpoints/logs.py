@@ -6,12 +6,22 @@
 @Docs: 日志管理API端点
 """
 
+import asyncio
+import csv
+import io
+from collections.abc import AsyncIterator
 from datetime import datetime
+from enum import Enum
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 
+from app.core.cache import cached
 from app.core.dependencies import get_operation_log_service, get_system_log_service
+from app.models.data_enum import LogLevelEnum, OperationResultEnum
 from app.schemas.base import PaginatedResponse, StatusResponse
 from app.schemas.log import (
     LogExportRequest,
@@ -24,8 +34,88 @@ from app.schemas.log import (
     SystemLogResponse,
 )
 from app.services.log_service import OperationLogService, SystemLogService
+from app.utils import build_etag, cache_headers, not_modified_response, paginated_response
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+def _export_filters(export_request: LogExportRequest) -> dict[str, Any]:
+    """根据导出请求构造ORM过滤条件
+
+    Args:
+        export_request: 日志导出请求
+
+    Returns:
+        过滤条件字典
+    """
+    filters: dict[str, Any] = {
+        "created_at__gte": export_request.start_time,
+        "created_at__lte": export_request.end_time,
+    }
+    if export_request.log_type == "system" and export_request.level:
+        filters["level"] = export_request.level
+    return filters
+
+
+def _csv_value(value: Any) -> Any:
+    """将 values() 取出的字段值转换为CSV单元格内容"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict | list):
+        return orjson.dumps(value).decode()
+    return value
+
+
+async def _stream_csv(batches: AsyncIterator[list[dict[str, Any]]], columns: list[str]) -> AsyncIterator[bytes]:
+    """逐批编码CSV，每批复用同一个缓冲区并产出一个数据块
+
+    表头由模型字段名生成并与第一批数据一起输出，没有匹配记录时仍返回只含表头的有效CSV。
+
+    Args:
+        batches: 分批读取的日志记录
+        columns: 列名，与记录字典的键一致
+
+    Yields:
+        UTF-8 编码的CSV数据块
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for batch in batches:
+        writer.writerows([_csv_value(row[column]) for column in columns] for row in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def _stream_json(batches: AsyncIterator[list[dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """逐批编码JSON数组，每批由orjson一次序列化
+
+    数组的起止符号与相邻批次合并输出，避免向压缩中间件写入仅含一个字节的数据块。
+
+    Args:
+        batches: 分批读取的日志记录
+
+    Yields:
+        JSON数组的数据块
+    """
+    separator = b"["
+    async for batch in batches:
+        yield separator + orjson.dumps(batch, default=str)[1:-1]
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+_EXPORT_MEDIA_TYPES = {"csv": "text/csv", "json": "application/json"}
+
+
+_OPERATION_LOG_LIST_ADAPTER = TypeAdapter(list[OperationLogResponse])
+_SYSTEM_LOG_LIST_ADAPTER = TypeAdapter(list[SystemLogResponse])
 
-router = APIRouter()
 
 # ================================ 操作日志管理 ================================
 
@@ -40,8 +130,11 @@ async def list_operation_logs(
         result = await service.get_paginated(
             page=query_params.page,
             page_size=query_params.page_size,
+            filters=service.build_filters(query_params),
         )
-        return result
+        return paginated_response(_OPERATION_LOG_LIST_ADAPTER, result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -49,12 +142,20 @@ async def list_operation_logs(
 @router.get("/operations/{log_id}", response_model=OperationLogResponse)
 async def get_operation_log(
     log_id: int,
+    request: Request,
+    response: Response,
     service: OperationLogService = Depends(get_operation_log_service),
 ):
     """获取操作日志详情"""
     log = await service.get_by_id(log_id)
     if not log:
         raise HTTPException(status_code=404, detail="操作日志不存在")
+
+    headers = cache_headers(build_etag(log.id, log.updated_at))
+    not_modified = not_modified_response(request, headers)
+    if not_modified:
+        return not_modified
+    response.headers.update(headers)
     return log
 
 
@@ -78,25 +179,26 @@ async def delete_operation_log(
     service: OperationLogService = Depends(get_operation_log_service),
 ):
     """删除操作日志"""
-    log = await service.get_by_id(log_id)
-    if not log:
-        raise HTTPException(status_code=404, detail="操作日志不存在")
-
     try:
-        await service.delete(log_id)
-        return StatusResponse(status="success", message="操作日志删除成功")
+        deleted = await service.delete_by_id(log_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    if not deleted:
+        raise HTTPException(status_code=404, detail="操作日志不存在")
+    return StatusResponse(status="success", message="操作日志删除成功")
+
 
 @router.get("/operations/user/{user}", response_model=list[OperationLogResponse])
 async def get_user_operation_logs(
     user: str,
+    limit: int = Query(100, ge=1, le=1000, description="最大返回条数"),
+    before: datetime | None = Query(None, description="仅返回该时间之前的日志"),
     service: OperationLogService = Depends(get_operation_log_service),
 ):
     """获取指定用户的操作日志"""
     try:
-        return await service.get_by_user(user)
+        return await service.get_by_user(user, limit=limit, before=before)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -105,11 +207,13 @@ async def get_user_operation_logs(
 async def get_resource_operation_logs(
     resource_type: str,
     resource_id: int | None = Query(None, description="资源ID筛选"),
+    limit: int = Query(100, ge=1, le=1000, description="最大返回条数"),
+    before: datetime | None = Query(None, description="仅返回该时间之前的日志"),
     service: OperationLogService = Depends(get_operation_log_service),
 ):
     """获取指定资源的操作日志"""
     try:
-        return await service.get_by_resource(resource_type, resource_id)
+        return await service.get_by_resource(resource_type, resource_id, limit=limit, before=before)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -117,11 +221,13 @@ async def get_resource_operation_logs(
 @router.get("/operations/action/{action}", response_model=list[OperationLogResponse])
 async def get_action_operation_logs(
     action: str,
+    limit: int = Query(100, ge=1, le=1000, description="最大返回条数"),
+    before: datetime | None = Query(None, description="仅返回该时间之前的日志"),
     service: OperationLogService = Depends(get_operation_log_service),
 ):
     """获取指定操作的日志"""
     try:
-        return await service.get_by_action(action)
+        return await service.get_by_action(action, limit=limit, before=before)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -139,8 +245,11 @@ async def list_system_logs(
         result = await service.get_paginated(
             page=query_params.page,
             page_size=query_params.page_size,
+            filters=service.build_filters(query_params),
         )
-        return result
+        return paginated_response(_SYSTEM_LOG_LIST_ADAPTER, result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -148,12 +257,20 @@ async def list_system_logs(
 @router.get("/system/{log_id}", response_model=SystemLogResponse)
 async def get_system_log(
     log_id: int,
+    request: Request,
+    response: Response,
     service: SystemLogService = Depends(get_system_log_service),
 ):
     """获取系统日志详情"""
     log = await service.get_by_id(log_id)
     if not log:
         raise HTTPException(status_code=404, detail="系统日志不存在")
+
+    headers = cache_headers(build_etag(log.id, log.updated_at))
+    not_modified = not_modified_response(request, headers)
+    if not_modified:
+        return not_modified
+    response.headers.update(headers)
     return log
 
 
@@ -177,77 +294,92 @@ async def delete_system_log(
     service: SystemLogService = Depends(get_system_log_service),
 ):
     """删除系统日志"""
-    log = await service.get_by_id(log_id)
-    if not log:
-        raise HTTPException(status_code=404, detail="系统日志不存在")
-
     try:
-        await service.delete(log_id)
-        return StatusResponse(status="success", message="系统日志删除成功")
+        deleted = await service.delete_by_id(log_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    if not deleted:
+        raise HTTPException(status_code=404, detail="系统日志不存在")
+    return StatusResponse(status="success", message="系统日志删除成功")
+
 
 # ================================ 日志统计和导出 ================================
 
 
 @router.get("/statistics", response_model=LogStatistics)
+@cached("stats:logs", ttl=15)
 async def get_log_statistics(
     operation_service: OperationLogService = Depends(get_operation_log_service),
     system_service: SystemLogService = Depends(get_system_log_service),
 ):
-    """获取日志统计信息"""
+    """获取日志统计信息，两类日志的统计并发查询"""
     try:
-        # 这里需要在服务层实现统计方法
-        # 暂时返回默认值，后续可以完善
+        level_counts, result_counts = await asyncio.gather(
+            system_service.count_by_level(),
+            operation_service.count_by_result(),
+        )
         return LogStatistics(
-            total_count=0,
-            error_count=0,
-            warning_count=0,
-            info_count=0,
-            debug_count=0,
-            operation_success_count=0,
-            operation_failed_count=0,
+            total_count=sum(level_counts.values()) + sum(result_counts.values()),
+            error_count=level_counts.get(LogLevelEnum.ERROR.value, 0)
+            + level_counts.get(LogLevelEnum.CRITICAL.value, 0),
+            warning_count=level_counts.get(LogLevelEnum.WARNING.value, 0),
+            info_count=level_counts.get(LogLevelEnum.INFO.value, 0),
+            debug_count=level_counts.get(LogLevelEnum.DEBUG.value, 0),
+            operation_success_count=result_counts.get(OperationResultEnum.SUCCESS.value, 0),
+            operation_failed_count=result_counts.get(OperationResultEnum.FAILED.value, 0),
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@router.post("/export", response_class=FileResponse)
+@router.post("/export", response_class=StreamingResponse)
 async def export_logs(
     export_request: LogExportRequest,
     operation_service: OperationLogService = Depends(get_operation_log_service),
     system_service: SystemLogService = Depends(get_system_log_service),
 ):
-    """导出日志"""
-    try:
-        # 这里需要实现日志导出逻辑
-        # 暂时返回一个示例文件路径
-        file_path = f"/tmp/logs_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_request.format}"
-
-        # 实际实现中需要根据参数查询日志并生成文件
-        # 这里只是示例
-
-        return FileResponse(
-            path=file_path,
-            filename=f"logs_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_request.format}",
-            media_type="application/octet-stream",
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    """导出日志，边查询边输出，内存占用不超过一批数据"""
+    if export_request.format not in _EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"暂不支持导出为 {export_request.format} 格式")
+
+    service: OperationLogService | SystemLogService = (
+        operation_service if export_request.log_type == "operation" else system_service
+    )
+    filename = f"logs_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_request.format}"
+    batches = service.iter_batches(_export_filters(export_request))
+    if export_request.format == "csv":
+        content = _stream_csv(batches, service.export_columns)
+    else:
+        content = _stream_json(batches)
+
+    return StreamingResponse(
+        content,
+        media_type=_EXPORT_MEDIA_TYPES[export_request.format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.delete("/cleanup", response_model=StatusResponse)
 async def cleanup_old_logs(
     days: int = Query(30, description="保留天数", ge=1),
-    log_type: str = Query("all", description="日志类型", regex="^(all|operation|system)$"),
+    log_type: Literal["all", "operation", "system"] = Query("all", description="日志类型"),
     operation_service: OperationLogService = Depends(get_operation_log_service),
     system_service: SystemLogService = Depends(get_system_log_service),
 ):
-    """清理旧日志"""
+    """清理旧日志，清理全部日志时两张表并发删除"""
     try:
-        # 这里需要在服务层实现清理方法
-        # 暂时返回成功状态
-        return StatusResponse(status="success", message=f"成功清理{days}天前的{log_type}日志")
+        if log_type == "all":
+            operation_deleted, system_deleted = await asyncio.gather(
+                operation_service.clean_old_logs(days),
+                system_service.clean_old_logs(days),
+            )
+            deleted = operation_deleted + system_deleted
+        elif log_type == "operation":
+            deleted = await operation_service.clean_old_logs(days)
+        else:
+            deleted = await system_service.clean_old_logs(days)
+
+        return StatusResponse(status="success", message=f"成功清理{days}天前的{log_type}日志 {deleted} 条")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
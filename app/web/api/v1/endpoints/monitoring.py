@@ -6,21 +6,44 @@
 @Docs: SNMP监控API端点
 """
 
+import asyncio
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 
 from app.core.dependencies import SNMPServiceDep
 from app.network.schemas import MonitoringStartRequest, ThresholdUpdateRequest
+from app.utils import shared_cache_control
 
-router = APIRouter(prefix="/monitoring", tags=["SNMP监控"])
+router = APIRouter(prefix="/monitoring", tags=["SNMP监控"], default_response_class=ORJSONResponse)
+
+# 启动与停止需等待轮询任务创建或退出，同一时刻只允许一个执行，重复请求直接返回409；
+# 共用一把锁，避免两者交错导致轮询任务重复创建或残留
+_lifecycle_lock = asyncio.Lock()
+
+
+def _ensure_unlocked(lock: asyncio.Lock, detail: str) -> None:
+    """操作正在执行时直接拒绝新的请求
+
+    Args:
+        lock: 操作对应的锁
+        detail: 冲突时返回的错误信息
+
+    Raises:
+        HTTPException: 操作正在执行时抛出409
+    """
+    if lock.locked():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
 
 
 @router.post("/start", summary="启动SNMP监控")
 async def start_monitoring(request: MonitoringStartRequest, snmp_service: SNMPServiceDep) -> dict[str, Any]:
     """启动SNMP监控服务"""
     try:
-        result = await snmp_service.start_monitoring(poll_interval=request.poll_interval)
+        _ensure_unlocked(_lifecycle_lock, "监控服务正在启动或停止，请稍后重试")
+        async with _lifecycle_lock:
+            result = await snmp_service.start_monitoring(poll_interval=request.poll_interval)
 
         if result["success"]:
             return {"success": True, "data": result}
@@ -39,7 +62,9 @@ async def start_monitoring(request: MonitoringStartRequest, snmp_service: SNMPSe
 async def stop_monitoring(snmp_service: SNMPServiceDep) -> dict[str, Any]:
     """停止SNMP监控服务"""
     try:
-        result = await snmp_service.stop_monitoring()
+        _ensure_unlocked(_lifecycle_lock, "监控服务正在启动或停止，请稍后重试")
+        async with _lifecycle_lock:
+            result = await snmp_service.stop_monitoring()
 
         if result["success"]:
             return {"success": True, "data": result}
@@ -54,7 +79,7 @@ async def stop_monitoring(snmp_service: SNMPServiceDep) -> dict[str, Any]:
         ) from None
 
 
-@router.get("/status", summary="获取监控状态")
+@router.get("/status", summary="获取监控状态", dependencies=[Depends(shared_cache_control)])
 async def get_monitoring_status(snmp_service: SNMPServiceDep) -> dict[str, Any]:
     """获取SNMP监控服务状态"""
     try:
@@ -67,7 +92,7 @@ async def get_monitoring_status(snmp_service: SNMPServiceDep) -> dict[str, Any]:
         ) from None
 
 
-@router.get("/devices", summary="获取所有设备监控数据")
+@router.get("/devices", summary="获取所有设备监控数据", dependencies=[Depends(shared_cache_control)])
 async def get_all_device_metrics(snmp_service: SNMPServiceDep) -> dict[str, Any]:
     """获取所有设备的监控指标"""
     try:
@@ -80,7 +105,7 @@ async def get_all_device_metrics(snmp_service: SNMPServiceDep) -> dict[str, Any]
         ) from None
 
 
-@router.get("/devices/{device_id}", summary="获取指定设备监控数据")
+@router.get("/devices/{device_id}", summary="获取指定设备监控数据", dependencies=[Depends(shared_cache_control)])
 async def get_device_metrics(device_id: int, snmp_service: SNMPServiceDep) -> dict[str, Any]:
     """获取指定设备的监控指标"""
     try:
@@ -99,7 +124,7 @@ async def get_device_metrics(device_id: int, snmp_service: SNMPServiceDep) -> di
         ) from None
 
 
-@router.get("/alerts", summary="获取告警信息")
+@router.get("/alerts", summary="获取告警信息", dependencies=[Depends(shared_cache_control)])
 async def get_alerts(snmp_service: SNMPServiceDep, hours: int = 24, device_id: int | None = None) -> dict[str, Any]:
     """获取告警信息
 
@@ -121,14 +146,8 @@ async def get_alerts(snmp_service: SNMPServiceDep, hours: int = 24, device_id: i
 async def update_thresholds(request: ThresholdUpdateRequest, snmp_service: SNMPServiceDep) -> dict[str, Any]:
     """更新告警阈值配置"""
     try:
-        # 构建更新的阈值字典
-        thresholds = {}
-        if request.cpu_usage is not None:
-            thresholds["cpu_usage"] = request.cpu_usage
-        if request.memory_usage is not None:
-            thresholds["memory_usage"] = request.memory_usage
-        if request.interface_down_count is not None:
-            thresholds["interface_down_count"] = request.interface_down_count
+        # 仅保留请求中提供的阈值，新增的阈值字段无需修改此处
+        thresholds = request.model_dump(exclude_none=True)
 
         if not thresholds:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="至少需要提供一个阈值参数")
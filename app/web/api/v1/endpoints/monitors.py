@@ -6,9 +6,12 @@
 @Docs: 监控指标和告警管理API端点
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
 from app.core.dependencies import get_alert_service, get_monitor_metric_service
+from app.core.exceptions import ConflictException
 from app.schemas.base import PaginatedResponse, StatusResponse
 from app.schemas.monitor import (
     AlertAcknowledge,
@@ -25,8 +28,14 @@ from app.schemas.monitor import (
     MonitorMetricUpdate,
 )
 from app.services.monitor_service import AlertService, MonitorMetricService
+from app.utils import build_etag, cache_headers, latest_updated_at, not_modified_response, paginated_response
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+_MONITOR_METRIC_LIST_ADAPTER = TypeAdapter(list[MonitorMetricResponse])
+_ALERT_LIST_ADAPTER = TypeAdapter(list[AlertResponse])
 
-router = APIRouter()
 
 # ================================ 监控指标管理 ================================
 
@@ -41,8 +50,24 @@ async def list_monitor_metrics(
         result = await service.get_paginated(
             page=query_params.page,
             page_size=query_params.page_size,
+            filters=service.build_filters(query_params),
         )
-        return result
+        return paginated_response(_MONITOR_METRIC_LIST_ADAPTER, result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/metrics/statistics", response_model=list[MetricStatistics])
+async def get_metric_statistics(
+    service: MonitorMetricService = Depends(get_monitor_metric_service),
+):
+    """获取监控指标统计信息"""
+    try:
+        # 这里需要在服务层实现统计方法
+        # 暂时返回空列表，后续可以完善
+        return []
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -50,12 +75,20 @@ async def list_monitor_metrics(
 @router.get("/metrics/{metric_id}", response_model=MonitorMetricResponse)
 async def get_monitor_metric(
     metric_id: int,
+    request: Request,
+    response: Response,
     service: MonitorMetricService = Depends(get_monitor_metric_service),
 ):
     """获取监控指标详情"""
-    metric = await service.get_by_id(metric_id)
+    metric = await service.get_detail(metric_id)
     if not metric:
         raise HTTPException(status_code=404, detail="监控指标不存在")
+
+    headers = cache_headers(build_etag(metric["id"], latest_updated_at(metric)))
+    not_modified = not_modified_response(request, headers)
+    if not_modified:
+        return not_modified
+    response.headers.update(headers)
     return metric
 
 
@@ -80,18 +113,18 @@ async def update_monitor_metric(
     service: MonitorMetricService = Depends(get_monitor_metric_service),
 ):
     """更新监控指标"""
-    metric = await service.get_by_id(metric_id)
-    if not metric:
-        raise HTTPException(status_code=404, detail="监控指标不存在")
-
     try:
-        update_data = {k: v for k, v in metric_data.model_dump().items() if v is not None}
-        return await service.update(metric_id, update_data)
+        update_data = metric_data.model_dump(exclude_unset=True)
+        metric = await service.update_by_id(metric_id, update_data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    if not metric:
+        raise HTTPException(status_code=404, detail="监控指标不存在")
+    return metric
+
 
 @router.delete("/metrics/{metric_id}", response_model=StatusResponse)
 async def delete_monitor_metric(
@@ -99,38 +132,38 @@ async def delete_monitor_metric(
     service: MonitorMetricService = Depends(get_monitor_metric_service),
 ):
     """删除监控指标"""
-    metric = await service.get_by_id(metric_id)
-    if not metric:
-        raise HTTPException(status_code=404, detail="监控指标不存在")
     try:
-        await service.delete(metric_id)
-        return StatusResponse(status="success", message="监控指标删除成功")
+        deleted = await service.delete_by_id(metric_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    if not deleted:
+        raise HTTPException(status_code=404, detail="监控指标不存在")
+    return StatusResponse(status="success", message="监控指标删除成功")
+
 
 @router.get("/metrics/device/{device_id}", response_model=list[MonitorMetricResponse])
 async def get_device_metrics(
     device_id: int,
+    request: Request,
+    response: Response,
     metric_type: str | None = Query(None, description="指标类型筛选"),
+    limit: int = Query(100, ge=1, le=1000, description="最大返回条数"),
     service: MonitorMetricService = Depends(get_monitor_metric_service),
 ):
-    """获取设备的监控指标"""
-    try:
-        return await service.get_by_device(device_id, metric_type)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
-
-
-@router.get("/metrics/statistics", response_model=list[MetricStatistics])
-async def get_metric_statistics(
-    service: MonitorMetricService = Depends(get_monitor_metric_service),
-):
-    """获取监控指标统计信息"""
+    """获取设备最近的监控指标（按采集时间倒序）"""
     try:
-        # 这里需要在服务层实现统计方法
-        # 暂时返回空列表，后续可以完善
-        return []
+        # 先只读取同一范围内的 id 与更新时间列，客户端缓存有效时不再取完整数据
+        ids_digest, latest = await service.get_device_list_version(device_id, metric_type, limit=limit)
+        if latest is not None:
+            # 以 id 摘要与最新更新时间（含设备及其关联数据）标识整个列表，新增、删除或修改任一指标都会改变ETag
+            headers = cache_headers(build_etag(f"{device_id}-{metric_type or ''}-{limit}-{ids_digest}", latest))
+            not_modified = not_modified_response(request, headers)
+            if not_modified:
+                return not_modified
+            response.headers.update(headers)
+
+        return await service.get_by_device(device_id, metric_type, limit=limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -148,8 +181,32 @@ async def list_alerts(
         result = await service.get_paginated(
             page=query_params.page,
             page_size=query_params.page_size,
+            filters=service.build_filters(query_params),
+        )
+        return paginated_response(_ALERT_LIST_ADAPTER, result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/alerts/statistics", response_model=AlertStatistics)
+async def get_alert_statistics(
+    service: AlertService = Depends(get_alert_service),
+):
+    """获取告警统计信息"""
+    try:
+        # 这里需要在服务层实现统计方法
+        # 暂时返回默认值，后续可以完善
+        return AlertStatistics(
+            total_count=0,
+            active_count=0,
+            acknowledged_count=0,
+            resolved_count=0,
+            critical_count=0,
+            warning_count=0,
+            info_count=0,
         )
-        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -157,12 +214,20 @@ async def list_alerts(
 @router.get("/alerts/{alert_id}", response_model=AlertResponse)
 async def get_alert(
     alert_id: int,
+    request: Request,
+    response: Response,
     service: AlertService = Depends(get_alert_service),
 ):
     """获取告警详情"""
-    alert = await service.get_by_id(alert_id)
+    alert = await service.get_detail(alert_id)
     if not alert:
         raise HTTPException(status_code=404, detail="告警不存在")
+
+    headers = cache_headers(build_etag(alert["id"], latest_updated_at(alert)))
+    not_modified = not_modified_response(request, headers)
+    if not_modified:
+        return not_modified
+    response.headers.update(headers)
     return alert
 
 
@@ -187,18 +252,18 @@ async def update_alert(
     service: AlertService = Depends(get_alert_service),
 ):
     """更新告警"""
-    alert = await service.get_by_id(alert_id)
-    if not alert:
-        raise HTTPException(status_code=404, detail="告警不存在")
-
     try:
-        update_data = {k: v for k, v in alert_data.model_dump().items() if v is not None}
-        return await service.update(alert_id, update_data)
+        update_data = alert_data.model_dump(exclude_unset=True)
+        alert = await service.update_by_id(alert_id, update_data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    if not alert:
+        raise HTTPException(status_code=404, detail="告警不存在")
+    return alert
+
 
 @router.delete("/alerts/{alert_id}", response_model=StatusResponse)
 async def delete_alert(
@@ -206,16 +271,15 @@ async def delete_alert(
     service: AlertService = Depends(get_alert_service),
 ):
     """删除告警"""
-    alert = await service.get_by_id(alert_id)
-    if not alert:
-        raise HTTPException(status_code=404, detail="告警不存在")
-
     try:
-        await service.delete(alert_id)
-        return StatusResponse(status="success", message="告警删除成功")
+        deleted = await service.delete_by_id(alert_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    if not deleted:
+        raise HTTPException(status_code=404, detail="告警不存在")
+    return StatusResponse(status="success", message="告警删除成功")
+
 
 @router.post("/alerts/{alert_id}/acknowledge", response_model=AlertResponse)
 async def acknowledge_alert(
@@ -224,15 +288,17 @@ async def acknowledge_alert(
     service: AlertService = Depends(get_alert_service),
 ):
     """确认告警"""
-    alert = await service.get_by_id(alert_id)
-    if not alert:
-        raise HTTPException(status_code=404, detail="告警不存在")
-
     try:
-        return await service.acknowledge_alert(alert_id, acknowledge_data.acknowledged_by)
+        alert = await service.acknowledge_alert(alert_id, acknowledge_data.acknowledged_by)
+    except ConflictException as e:
+        raise HTTPException(status_code=409, detail=e.message) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    if not alert:
+        raise HTTPException(status_code=404, detail="告警不存在")
+    return alert
+
 
 @router.post("/alerts/{alert_id}/resolve", response_model=AlertResponse)
 async def resolve_alert(
@@ -241,38 +307,14 @@ async def resolve_alert(
     service: AlertService = Depends(get_alert_service),
 ):
     """解决告警"""
-    alert = await service.get_by_id(alert_id)
-    if not alert:
-        raise HTTPException(status_code=404, detail="告警不存在")
-
     try:
-        # 需要在服务层实现resolve_alert方法
-        update_data = {
-            "status": "resolved",
-            "resolved_at": "now()",
-            "resolution_note": resolve_data.resolution_note,
-        }
-        return await service.update(alert_id, update_data)
+        # 告警表暂无 resolution_note 字段，备注不入库
+        alert = await service.resolve_alert(alert_id, resolve_data.resolved_by)
+    except ConflictException as e:
+        raise HTTPException(status_code=409, detail=e.message) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-
-@router.get("/alerts/statistics", response_model=AlertStatistics)
-async def get_alert_statistics(
-    service: AlertService = Depends(get_alert_service),
-):
-    """获取告警统计信息"""
-    try:
-        # 这里需要在服务层实现统计方法
-        # 暂时返回默认值，后续可以完善
-        return AlertStatistics(
-            total_count=0,
-            active_count=0,
-            acknowledged_count=0,
-            resolved_count=0,
-            critical_count=0,
-            warning_count=0,
-            info_count=0,
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    if not alert:
+        raise HTTPException(status_code=404, detail="告警不存在")
+    return alert
@@ -7,13 +7,81 @@
 """
 
 import asyncio
-import json
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from loguru import logger
 
 from app.network.cli.cli_manager import cli_manager
+from app.web.ws.utils import receive_frame
+
+# 交互式命令输出的合并发送阈值：累计输出达到该字节数或等待超过该时间即发送一帧
+_CHUNK_FLUSH_BYTES = 16 * 1024
+_CHUNK_FLUSH_INTERVAL = 0.02
+# 交互式命令输出结束标记
+_STREAM_END = object()
+# 交互式命令输出消息中固定不变的前缀，预先编码后与每批输出拼接
+_CHUNK_PREFIX = b'{"type":"interactive_command_chunk","action":"execute_interactive_command","chunk":'
+_CHUNKS_PREFIX = b'{"type":"interactive_command_chunks","action":"execute_interactive_command","chunks":'
+# 请求结果消息：action -> 消息类型，结构均为 {"type","action","result","timestamp"}
+_RESULT_TYPES = {
+    "create_session": "session_created",
+    "close_session": "session_closed",
+    "execute_command": "command_result",
+    "send_configuration": "configuration_result",
+    "list_sessions": "sessions_list",
+    "get_session_info": "session_info",
+}
+# 结果消息的固定前缀按 action 预先编码，发送时只需序列化 result 与时间戳
+_RESULT_PREFIXES = {
+    action: orjson.dumps({"type": message_type, "action": action})[:-1] + b',"result":'
+    for action, message_type in _RESULT_TYPES.items()
+}
+# 各action的必填字段：(字段名, 期望类型, 缺失或格式错误时的提示)，按顺序校验
+_REQUIRED_FIELDS: dict[str, tuple[tuple[str, type, str], ...]] = {
+    "create_session": (("device_id", object, "缺少device_id参数"),),
+    "close_session": (("session_id", object, "缺少session_id参数"),),
+    "execute_command": (("session_id", object, "缺少session_id参数"), ("command", object, "缺少command参数")),
+    "execute_interactive_command": (
+        ("session_id", object, "缺少session_id参数"),
+        ("command", object, "缺少command参数"),
+    ),
+    "send_configuration": (
+        ("session_id", object, "缺少session_id参数"),
+        ("config_lines", list, "缺少config_lines参数或格式错误"),
+    ),
+    "get_session_info": (("session_id", object, "缺少session_id参数"),),
+}
+
+
+def _dumps(message: dict[str, Any]) -> str:
+    """将消息序列化为JSON文本
+
+    客户端按文本帧解析（JSON.parse(event.data)），因此仍以文本帧发送；
+    orjson 在C层完成序列化，解码为str的开销远小于 json.dumps。
+
+    Args:
+        message: 消息内容
+
+    Returns:
+        JSON文本
+    """
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _with_timestamp(body: bytes) -> str:
+    """为预编码的消息体补上时间戳字段并闭合
+
+    Args:
+        body: 不含结尾括号的消息体
+
+    Returns:
+        JSON文本
+    """
+    return (body + b',"timestamp":' + orjson.dumps(asyncio.get_running_loop().time()) + b"}").decode()
 
 
 class CLIWebSocket:
@@ -23,6 +91,10 @@ class CLIWebSocket:
         """初始化WebSocket管理器"""
         self.active_connections: dict[str, WebSocket] = {}
         self.session_connections: dict[str, str] = {}  # session_id -> websocket_id
+        # 反向索引：websocket_id -> 该连接创建的会话ID，断开时无需遍历全部会话
+        self.client_sessions: defaultdict[str, set[str]] = defaultdict(set)
+        # 连接建立时缓存 send_text 绑定方法，流式输出时每帧省去一次属性查找
+        self._senders: dict[str, Callable[[str], Awaitable[None]]] = {}
 
     async def connect(self, websocket: WebSocket, client_id: str) -> None:
         """接受WebSocket连接
@@ -33,6 +105,7 @@ class CLIWebSocket:
         """
         await websocket.accept()
         self.active_connections[client_id] = websocket
+        self._senders[client_id] = websocket.send_text
         logger.info(f"WebSocket客户端 {client_id} 已连接")
 
     def disconnect(self, client_id: str) -> None:
@@ -43,18 +116,28 @@ class CLIWebSocket:
         """
         if client_id in self.active_connections:
             del self.active_connections[client_id]
+        self._senders.pop(client_id, None)
 
         # 清理会话连接映射
-        sessions_to_remove = []
-        for session_id, ws_client_id in self.session_connections.items():
-            if ws_client_id == client_id:
-                sessions_to_remove.append(session_id)
-
-        for session_id in sessions_to_remove:
-            del self.session_connections[session_id]
+        for session_id in self.client_sessions.pop(client_id, ()):
+            self.session_connections.pop(session_id, None)
 
         logger.info(f"WebSocket客户端 {client_id} 已断开")
 
+    def _forget_session(self, client_id: str, session_id: str) -> None:
+        """从反向索引中移除会话，连接无会话时删除该项
+
+        Args:
+            client_id: 客户端ID
+            session_id: 会话ID
+        """
+        sessions = self.client_sessions.get(client_id)
+        if sessions is None:
+            return
+        sessions.discard(session_id)
+        if not sessions:
+            del self.client_sessions[client_id]
+
     async def send_message(self, client_id: str, message: dict[str, Any]) -> bool:
         """发送消息给指定客户端
 
@@ -65,12 +148,38 @@ class CLIWebSocket:
         Returns:
             bool: 是否发送成功
         """
-        if client_id not in self.active_connections:
+        return await self.send_text(client_id, _dumps(message))
+
+    async def send_result(self, client_id: str, action: str, result: Any) -> bool:
+        """发送请求结果消息给指定客户端
+
+        Args:
+            client_id: 客户端ID
+            action: 请求的action
+            result: 处理结果
+
+        Returns:
+            bool: 是否发送成功
+        """
+        body = _RESULT_PREFIXES[action] + orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+        return await self.send_text(client_id, _with_timestamp(body))
+
+    async def send_text(self, client_id: str, text: str) -> bool:
+        """发送已编码的JSON文本给指定客户端
+
+        Args:
+            client_id: 客户端ID
+            text: JSON文本
+
+        Returns:
+            bool: 是否发送成功
+        """
+        send = self._senders.get(client_id)
+        if send is None:
             return False
 
         try:
-            websocket = self.active_connections[client_id]
-            await websocket.send_text(json.dumps(message))
+            await send(text)
             return True
         except Exception as e:
             logger.error(f"发送消息给客户端 {client_id} 失败: {e}")
@@ -79,37 +188,62 @@ class CLIWebSocket:
     async def handle_message(self, client_id: str, message: dict[str, Any]) -> None:
         """处理客户端消息
 
+        按action与必填字段做结构化匹配，字段在模式中直接绑定后传给处理方法。
+
         Args:
             client_id: 客户端ID
             message: 消息内容
         """
         try:
-            action = message.get("action")
-            if not action:
-                await self.send_error(client_id, "缺少action字段")
-                return
-
-            if action == "create_session":
-                await self._handle_create_session(client_id, message)
-            elif action == "close_session":
-                await self._handle_close_session(client_id, message)
-            elif action == "execute_command":
-                await self._handle_execute_command(client_id, message)
-            elif action == "execute_interactive_command":
-                await self._handle_execute_interactive_command(client_id, message)
-            elif action == "send_configuration":
-                await self._handle_send_configuration(client_id, message)
-            elif action == "list_sessions":
-                await self._handle_list_sessions(client_id, message)
-            elif action == "get_session_info":
-                await self._handle_get_session_info(client_id, message)
-            else:
-                await self.send_error(client_id, f"未知的action: {action}")
+            match message:
+                case {"action": "create_session", "device_id": device_id} if device_id:
+                    await self._handle_create_session(client_id, device_id, message.get("user_id"))
+                case {"action": "close_session", "session_id": session_id} if session_id:
+                    await self._handle_close_session(client_id, session_id)
+                case {"action": "execute_command", "session_id": session_id, "command": command} if (
+                    session_id and command
+                ):
+                    await self._handle_execute_command(client_id, session_id, command)
+                case {"action": "execute_interactive_command", "session_id": session_id, "command": command} if (
+                    session_id and command
+                ):
+                    await self._handle_execute_interactive_command(client_id, session_id, command)
+                case {"action": "send_configuration", "session_id": session_id, "config_lines": list(config_lines)} if (
+                    session_id and config_lines
+                ):
+                    await self._handle_send_configuration(client_id, session_id, config_lines)
+                case {"action": "list_sessions"}:
+                    await self._handle_list_sessions(client_id, message.get("user_id"), message.get("device_id"))
+                case {"action": "get_session_info", "session_id": session_id} if session_id:
+                    await self._handle_get_session_info(client_id, session_id)
+                case {"action": str(action)} if action in _REQUIRED_FIELDS:
+                    await self.send_error(client_id, self._invalid_field_error(action, message))
+                case {"action": action} if action:
+                    await self.send_error(client_id, f"未知的action: {action}")
+                case _:
+                    await self.send_error(client_id, "缺少action字段")
 
         except Exception as e:
             logger.error(f"处理客户端 {client_id} 消息失败: {e}")
             await self.send_error(client_id, f"处理消息失败: {str(e)}")
 
+    @staticmethod
+    def _invalid_field_error(action: str, message: dict[str, Any]) -> str:
+        """返回消息中第一个缺失或格式错误的必填字段的提示
+
+        Args:
+            action: 请求的action
+            message: 消息内容
+
+        Returns:
+            str: 错误提示
+        """
+        for field, expected_type, error in _REQUIRED_FIELDS[action]:
+            value = message.get(field)
+            if not value or not isinstance(value, expected_type):
+                return error
+        return f"{action} 参数错误"
+
     async def send_error(self, client_id: str, error_message: str) -> None:
         """发送错误消息
 
@@ -118,92 +252,40 @@ class CLIWebSocket:
             error_message: 错误消息
         """
         await self.send_message(
-            client_id, {"type": "error", "message": error_message, "timestamp": asyncio.get_event_loop().time()}
+            client_id, {"type": "error", "message": error_message, "timestamp": asyncio.get_running_loop().time()}
         )
 
-    async def _handle_create_session(self, client_id: str, message: dict[str, Any]) -> None:
+    async def _handle_create_session(self, client_id: str, device_id: int, user_id: str | None) -> None:
         """处理创建会话请求"""
-        device_id = message.get("device_id")
-        user_id = message.get("user_id")
-
-        if not device_id:
-            await self.send_error(client_id, "缺少device_id参数")
-            return
-
         result = await cli_manager.create_session(device_id, user_id)
 
         if result["success"]:
             session_id = result["session_id"]
             self.session_connections[session_id] = client_id
+            self.client_sessions[client_id].add(session_id)
 
-        await self.send_message(
-            client_id,
-            {
-                "type": "session_created",
-                "action": "create_session",
-                "result": result,
-                "timestamp": asyncio.get_event_loop().time(),
-            },
-        )
+        await self.send_result(client_id, "create_session", result)
 
-    async def _handle_close_session(self, client_id: str, message: dict[str, Any]) -> None:
+    async def _handle_close_session(self, client_id: str, session_id: str) -> None:
         """处理关闭会话请求"""
-        session_id = message.get("session_id")
-
-        if not session_id:
-            await self.send_error(client_id, "缺少session_id参数")
-            return
-
         result = await cli_manager.close_session(session_id)
 
-        if result["success"] and session_id in self.session_connections:
-            del self.session_connections[session_id]
+        if result["success"]:
+            owner = self.session_connections.pop(session_id, None)
+            if owner is not None:
+                self._forget_session(owner, session_id)
 
-        await self.send_message(
-            client_id,
-            {
-                "type": "session_closed",
-                "action": "close_session",
-                "result": result,
-                "timestamp": asyncio.get_event_loop().time(),
-            },
-        )
+        await self.send_result(client_id, "close_session", result)
 
-    async def _handle_execute_command(self, client_id: str, message: dict[str, Any]) -> None:
+    async def _handle_execute_command(self, client_id: str, session_id: str, command: str) -> None:
         """处理执行命令请求"""
-        session_id = message.get("session_id")
-        command = message.get("command")
-
-        if not session_id:
-            await self.send_error(client_id, "缺少session_id参数")
-            return
-        if not command:
-            await self.send_error(client_id, "缺少command参数")
-            return
-
         result = await cli_manager.execute_command(session_id, command)
 
-        await self.send_message(
-            client_id,
-            {
-                "type": "command_result",
-                "action": "execute_command",
-                "result": result,
-                "timestamp": asyncio.get_event_loop().time(),
-            },
-        )
+        await self.send_result(client_id, "execute_command", result)
 
-    async def _handle_execute_interactive_command(self, client_id: str, message: dict[str, Any]) -> None:
+    async def _handle_execute_interactive_command(self, client_id: str, session_id: str, command: str) -> None:
         """处理执行交互式命令请求"""
-        session_id = message.get("session_id")
-        command = message.get("command")
-
-        if not session_id:
-            await self.send_error(client_id, "缺少session_id参数")
-            return
-        if not command:
-            await self.send_error(client_id, "缺少command参数")
-            return
+        loop = asyncio.get_running_loop()
 
         # 发送开始信号
         await self.send_message(
@@ -213,21 +295,48 @@ class CLIWebSocket:
                 "action": "execute_interactive_command",
                 "session_id": session_id,
                 "command": command,
-                "timestamp": asyncio.get_event_loop().time(),
+                "timestamp": loop.time(),
             },
         )
 
-        # 流式发送输出
-        async for chunk in cli_manager.execute_interactive_command(session_id, command):
-            await self.send_message(
-                client_id,
-                {
-                    "type": "interactive_command_chunk",
-                    "action": "execute_interactive_command",
-                    "chunk": chunk,
-                    "timestamp": asyncio.get_event_loop().time(),
-                },
-            )
+        # 流式发送输出：设备输出先进入队列，发送端按大小或时间窗口合并成一帧
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                async for chunk in cli_manager.execute_interactive_command(session_id, command):
+                    queue.put_nowait(chunk)
+            finally:
+                queue.put_nowait(_STREAM_END)
+
+        producer = asyncio.create_task(produce())
+        try:
+            finished = False
+            while not finished:
+                chunks: list[dict[str, Any]] = []
+                size = 0
+                item = await queue.get()
+                deadline = loop.time() + _CHUNK_FLUSH_INTERVAL
+                while item is not _STREAM_END:
+                    chunks.append(item)
+                    size += len(item.get("output") or "")
+                    remaining = deadline - loop.time()
+                    if size >= _CHUNK_FLUSH_BYTES or remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), remaining)
+                    except TimeoutError:
+                        break
+                else:
+                    finished = True
+
+                if chunks:
+                    await self._send_interactive_chunks(client_id, chunks)
+
+            # 输出生成过程中的异常在此抛出，交由 handle_message 统一处理
+            await producer
+        finally:
+            producer.cancel()
 
         # 发送结束信号
         await self.send_message(
@@ -237,70 +346,48 @@ class CLIWebSocket:
                 "action": "execute_interactive_command",
                 "session_id": session_id,
                 "command": command,
-                "timestamp": asyncio.get_event_loop().time(),
+                "timestamp": loop.time(),
             },
         )
 
-    async def _handle_send_configuration(self, client_id: str, message: dict[str, Any]) -> None:
-        """处理发送配置请求"""
-        session_id = message.get("session_id")
-        config_lines = message.get("config_lines")
+    async def _send_interactive_chunks(self, client_id: str, chunks: list[dict[str, Any]]) -> None:
+        """发送一批交互式命令输出
 
-        if not session_id:
-            await self.send_error(client_id, "缺少session_id参数")
-            return
-        if not config_lines or not isinstance(config_lines, list):
-            await self.send_error(client_id, "缺少config_lines参数或格式错误")
+        仅有一个片段时保持原有的单片段消息格式，多个片段合并为一条 interactive_command_chunks 消息。
+        消息的固定部分已预先编码，每帧只需序列化输出片段与时间戳。
+
+        Args:
+            client_id: 客户端ID
+            chunks: 输出片段列表
+        """
+        if len(chunks) == 1:
+            body = _CHUNK_PREFIX + orjson.dumps(chunks[0], option=orjson.OPT_NON_STR_KEYS)
+        else:
+            body = _CHUNKS_PREFIX + orjson.dumps(chunks, option=orjson.OPT_NON_STR_KEYS)
+        await self.send_text(client_id, _with_timestamp(body))
+
+    async def _handle_send_configuration(self, client_id: str, session_id: str, config_lines: list[str]) -> None:
+        """处理发送配置请求"""
+        # 在占用设备会话前校验每一行，格式错误时尽早失败
+        if not all(isinstance(line, str) for line in config_lines):
+            await self.send_error(client_id, "config_lines只能包含字符串")
             return
 
         result = await cli_manager.send_configuration(session_id, config_lines)
 
-        await self.send_message(
-            client_id,
-            {
-                "type": "configuration_result",
-                "action": "send_configuration",
-                "result": result,
-                "timestamp": asyncio.get_event_loop().time(),
-            },
-        )
+        await self.send_result(client_id, "send_configuration", result)
 
-    async def _handle_list_sessions(self, client_id: str, message: dict[str, Any]) -> None:
+    async def _handle_list_sessions(self, client_id: str, user_id: str | None, device_id: int | None) -> None:
         """处理列出会话请求"""
-        user_id = message.get("user_id")
-        device_id = message.get("device_id")
-
         result = cli_manager.list_sessions(user_id, device_id)
 
-        await self.send_message(
-            client_id,
-            {
-                "type": "sessions_list",
-                "action": "list_sessions",
-                "result": result,
-                "timestamp": asyncio.get_event_loop().time(),
-            },
-        )
+        await self.send_result(client_id, "list_sessions", result)
 
-    async def _handle_get_session_info(self, client_id: str, message: dict[str, Any]) -> None:
+    async def _handle_get_session_info(self, client_id: str, session_id: str) -> None:
         """处理获取会话信息请求"""
-        session_id = message.get("session_id")
-
-        if not session_id:
-            await self.send_error(client_id, "缺少session_id参数")
-            return
-
         result = cli_manager.get_session_info(session_id)
 
-        await self.send_message(
-            client_id,
-            {
-                "type": "session_info",
-                "action": "get_session_info",
-                "result": result,
-                "timestamp": asyncio.get_event_loop().time(),
-            },
-        )
+        await self.send_result(client_id, "get_session_info", result)
 
 
 # 全局WebSocket管理器
@@ -319,12 +406,12 @@ async def cli_websocket_endpoint(websocket: WebSocket, client_id: str = "default
     try:
         while True:
             # 接收消息
-            data = await websocket.receive_text()
+            data = await receive_frame(websocket)
 
             try:
-                message = json.loads(data)
+                message = orjson.loads(data)
                 await cli_websocket.handle_message(client_id, message)
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 await cli_websocket.send_error(client_id, f"JSON解析错误: {str(e)}")
             except Exception as e:
                 logger.error(f"处理WebSocket消息异常: {e}")
@@ -0,0 +1,31 @@
+"""
+@Author: li
+@Email: lijianqiao2906@live.com
+@FileName: utils.py
+@DateTime: 2025-06-17
+@Docs: WebSocket端点公用工具
+"""
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+
+async def receive_frame(websocket: WebSocket) -> str | bytes:
+    """接收一帧客户端消息
+
+    文本帧与二进制帧均原样返回，可直接交给 orjson.loads 解析：二进制帧无需先解码为str，
+    也不会像 receive_text 那样在收到二进制帧时抛出 KeyError。
+
+    Args:
+        websocket: WebSocket连接
+
+    Returns:
+        帧内容
+
+    Raises:
+        WebSocketDisconnect: 客户端断开连接时
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message["code"], message.get("reason"))
+    data = message.get("text")
+    return data if data is not None else message.get("bytes") or b""
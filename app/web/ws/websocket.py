@@ -7,10 +7,12 @@
 """
 
 import asyncio
-import json
+from collections import defaultdict
 from datetime import datetime
+from functools import cache
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 
 from app.core.dependencies import (
@@ -19,67 +21,148 @@ from app.core.dependencies import (
     get_monitor_metric_service,
     get_system_log_service,
 )
+from app.core.event_bus import event_bus, set_subscriber_check
 from app.services.device_service import DeviceService
 from app.services.log_service import SystemLogService
 from app.services.monitor_service import AlertService, MonitorMetricService
+from app.web.ws.utils import receive_frame
 
 router = APIRouter()
 
 
+def _dumps(message: dict[str, Any]) -> str:
+    """将推送消息序列化为JSON文本
+
+    orjson 原生序列化 datetime，输出与 isoformat() 一致，消息中可直接放入 datetime 对象。
+
+    Args:
+        message: 消息内容
+
+    Returns:
+        JSON文本
+    """
+    return orjson.dumps(message).decode()
+
+
+# 每个客户端待发送消息的上限，慢客户端积压超过该值时丢弃最旧的消息
+_SEND_QUEUE_SIZE = 256
+# 消息时间戳的缓存粒度（秒），时间戳仅用于展示，允许该范围内的误差
+_TIMESTAMP_RESOLUTION = 0.1
+
+
 class ConnectionManager:
-    """WebSocket连接管理器"""
+    """WebSocket连接管理器
+
+    每个客户端持有一个有界发送队列和独立的写任务，推送方只负责入队，慢客户端不会拖慢推送或其他客户端。
+    """
 
     def __init__(self):
         self.active_connections: dict[str, WebSocket] = {}
         self.subscriptions: dict[str, set[str]] = {}  # 客户端订阅的数据类型
+        self.send_queues: dict[str, asyncio.Queue[str]] = {}
+        self.writers: dict[str, asyncio.Task] = {}
+        # 反向索引：数据类型 -> {客户端ID: 发送队列}，广播时直接遍历订阅者的队列
+        self.channel_subscribers: defaultdict[str, dict[str, asyncio.Queue[str]]] = defaultdict(dict)
+        self._now_iso = ""
+        self._now_expires = 0.0
+
+    @property
+    def now_iso(self) -> str:
+        """当前时间的ISO字符串，按 _TIMESTAMP_RESOLUTION 缓存，避免每条消息都格式化一次"""
+        loop_time = asyncio.get_running_loop().time()
+        if loop_time >= self._now_expires:
+            self._now_iso = datetime.now().isoformat()
+            self._now_expires = loop_time + _TIMESTAMP_RESOLUTION
+        return self._now_iso
 
     async def connect(self, websocket: WebSocket, client_id: str):
         """接受新连接"""
         await websocket.accept()
+        self.disconnect(client_id)
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=_SEND_QUEUE_SIZE)
         self.active_connections[client_id] = websocket
         self.subscriptions[client_id] = set()
+        self.send_queues[client_id] = queue
+        self.writers[client_id] = asyncio.create_task(self._writer(client_id, websocket, queue))
 
     def disconnect(self, client_id: str):
         """断开连接"""
         self.active_connections.pop(client_id, None)
-        self.subscriptions.pop(client_id, None)
+        self.send_queues.pop(client_id, None)
+        writer = self.writers.pop(client_id, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        self._drop_subscriptions(client_id)
+
+    def _drop_subscriptions(self, client_id: str):
+        """移除客户端的全部订阅，并同步清理反向索引"""
+        for data_type in self.subscriptions.pop(client_id, ()):
+            self._remove_subscriber(data_type, client_id)
+
+    def _remove_subscriber(self, data_type: str, client_id: str):
+        """从反向索引中移除订阅者，数据类型无订阅者时删除该项"""
+        subscribers = self.channel_subscribers.get(data_type)
+        if subscribers is None:
+            return
+        subscribers.pop(client_id, None)
+        if not subscribers:
+            del self.channel_subscribers[data_type]
+
+    async def _writer(self, client_id: str, websocket: WebSocket, queue: asyncio.Queue[str]):
+        """按顺序发送客户端队列中的消息，发送失败时断开该客户端"""
+        send = websocket.send_text
+        try:
+            while True:
+                message = await queue.get()
+                await send(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 同一客户端ID可能已重新连接，只清理发送失败的那个连接
+            if self.active_connections.get(client_id) is websocket:
+                self.disconnect(client_id)
+
+    @staticmethod
+    def _enqueue(queue: asyncio.Queue[str], message: str):
+        """消息入队，队列已满时丢弃最旧的一条，入队操作永不阻塞"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message)
 
     async def send_personal_message(self, message: str, client_id: str):
         """发送个人消息"""
-        websocket = self.active_connections.get(client_id)
-        if websocket:
-            try:
-                await websocket.send_text(message)
-            except Exception:
-                self.disconnect(client_id)
+        queue = self.send_queues.get(client_id)
+        if queue is not None:
+            self._enqueue(queue, message)
 
     async def broadcast(self, message: str, data_type: str | None = None):
-        """广播消息"""
-        disconnected_clients = []
-
-        for client_id, websocket in self.active_connections.items():
-            # 如果指定了数据类型，只发送给订阅了该类型的客户端
-            if data_type and data_type not in self.subscriptions.get(client_id, set()):
-                continue
+        """广播消息
 
-            try:
-                await websocket.send_text(message)
-            except Exception:
-                disconnected_clients.append(client_id)
+        消息只编码一次，写入各目标客户端的发送队列，由各自的写任务并发发送。
+        """
+        # 如果指定了数据类型，只发送给订阅了该类型的客户端
+        queues = self.channel_subscribers.get(data_type, {}) if data_type else self.send_queues
+        for queue in queues.values():
+            self._enqueue(queue, message)
 
-        # 清理断开的连接
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
+    def has_subscribers(self, data_type: str) -> bool:
+        """判断数据类型当前是否有订阅者"""
+        return bool(self.channel_subscribers.get(data_type))
 
     def subscribe(self, client_id: str, data_types: list[str]):
         """订阅数据类型"""
-        if client_id in self.subscriptions:
+        queue = self.send_queues.get(client_id)
+        if queue is not None and client_id in self.subscriptions:
             self.subscriptions[client_id].update(data_types)
+            for data_type in data_types:
+                self.channel_subscribers[data_type][client_id] = queue
 
     def unsubscribe(self, client_id: str, data_types: list[str]):
         """取消订阅数据类型"""
         if client_id in self.subscriptions:
             self.subscriptions[client_id].difference_update(data_types)
+            for data_type in data_types:
+                self._remove_subscriber(data_type, client_id)
 
 
 manager = ConnectionManager()
@@ -99,12 +182,12 @@ async def websocket_endpoint(
 
     # 发送连接成功消息
     await manager.send_personal_message(
-        json.dumps(
+        _dumps(
             {
                 "type": "connection",
                 "status": "connected",
                 "client_id": client_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": manager.now_iso,
             }
         ),
         client_id,
@@ -113,160 +196,117 @@ async def websocket_endpoint(
     try:
         while True:
             # 接收客户端消息
-            data = await websocket.receive_text()
+            data = await receive_frame(websocket)
 
             try:
-                message = json.loads(data)
+                message = orjson.loads(data)
                 await handle_client_message(message, client_id)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 await manager.send_personal_message(
-                    json.dumps(
-                        {"type": "error", "message": "Invalid JSON format", "timestamp": datetime.now().isoformat()}
-                    ),
+                    _dumps({"type": "error", "message": "Invalid JSON format", "timestamp": manager.now_iso}),
                     client_id,
                 )
 
     except WebSocketDisconnect:
-        manager.disconnect(client_id)
+        pass
+    finally:
+        # 任何原因退出都释放发送任务、队列与订阅；同一客户端ID可能已重新连接，只清理本连接
+        if manager.active_connections.get(client_id) is websocket:
+            manager.disconnect(client_id)
+
+
+async def _handle_subscribe(message: dict[str, Any], client_id: str):
+    """订阅数据类型"""
+    data_types = message.get("data_types", [])
+    manager.subscribe(client_id, data_types)
+
+    await manager.send_personal_message(
+        _dumps(
+            {
+                "type": "subscription",
+                "status": "subscribed",
+                "data_types": data_types,
+                "timestamp": manager.now_iso,
+            }
+        ),
+        client_id,
+    )
+
+
+async def _handle_unsubscribe(message: dict[str, Any], client_id: str):
+    """取消订阅数据类型"""
+    data_types = message.get("data_types", [])
+    manager.unsubscribe(client_id, data_types)
+
+    await manager.send_personal_message(
+        _dumps(
+            {
+                "type": "subscription",
+                "status": "unsubscribed",
+                "data_types": data_types,
+                "timestamp": manager.now_iso,
+            }
+        ),
+        client_id,
+    )
+
+
+async def _handle_ping(message: dict[str, Any], client_id: str):
+    """心跳检测"""
+    await manager.send_personal_message(_dumps({"type": "pong", "timestamp": manager.now_iso}), client_id)
+
+
+# 消息类型 -> 处理函数
+_MESSAGE_HANDLERS = {
+    "subscribe": _handle_subscribe,
+    "unsubscribe": _handle_unsubscribe,
+    "ping": _handle_ping,
+}
 
 
 async def handle_client_message(message: dict[str, Any], client_id: str):
-    """处理客户端消息"""
+    """处理客户端消息，未知类型的消息直接忽略"""
     message_type = message.get("type")
-
-    if message_type == "subscribe":
-        # 订阅数据类型
-        data_types = message.get("data_types", [])
-        manager.subscribe(client_id, data_types)
-
-        await manager.send_personal_message(
-            json.dumps(
-                {
-                    "type": "subscription",
-                    "status": "subscribed",
-                    "data_types": data_types,
-                    "timestamp": datetime.now().isoformat(),
-                }
-            ),
-            client_id,
-        )
-
-    elif message_type == "unsubscribe":
-        # 取消订阅数据类型
-        data_types = message.get("data_types", [])
-        manager.unsubscribe(client_id, data_types)
-
-        await manager.send_personal_message(
-            json.dumps(
-                {
-                    "type": "subscription",
-                    "status": "unsubscribed",
-                    "data_types": data_types,
-                    "timestamp": datetime.now().isoformat(),
-                }
-            ),
-            client_id,
-        )
-
-    elif message_type == "ping":
-        # 心跳检测
-        await manager.send_personal_message(
-            json.dumps({"type": "pong", "timestamp": datetime.now().isoformat()}), client_id
-        )
+    handler = _MESSAGE_HANDLERS.get(message_type) if isinstance(message_type, str) else None
+    if handler is not None:
+        await handler(message, client_id)
 
 
 # 实时数据推送任务
 async def push_real_time_data():
-    """推送实时数据的后台任务"""
+    """推送实时数据的后台任务
+
+    不再定时轮询，而是消费事件总线：业务方在状态变化时发布事件，每个事件只编码一次后写入其订阅者的发送队列。
+    """
     while True:
+        data_type, message_type, data = await event_bus.get()
+        # 事件入队后订阅者可能已全部离开，此时无需编码
+        if not manager.has_subscribers(data_type):
+            continue
         try:
-            # 推送设备状态更新
-            await push_device_status()
+            message = _push_prefix(message_type) + orjson.dumps(data) + b',"timestamp":' + orjson.dumps(manager.now_iso)
+            await manager.broadcast((message + b"}").decode(), data_type)
+        except Exception as e:
+            print(f"推送实时数据时发生错误: {e}")
 
-            # 推送新告警
-            await push_new_alerts()
 
-            # 推送监控指标更新
-            await push_metric_updates()
+@cache
+def _push_prefix(message_type: str) -> bytes:
+    """预先编码推送消息中 data 字段之前的固定部分，按消息类型缓存"""
+    return b'{"type":' + orjson.dumps(message_type) + b',"data":'
 
-            # 推送系统日志
-            await push_system_logs()
 
-            # 等待5秒后下次推送
-            await asyncio.sleep(5)
+# 启动实时数据推送任务的函数
+def start_real_time_push() -> asyncio.Task:
+    """启动实时数据推送任务
 
-        except Exception as e:
-            print(f"推送实时数据时发生错误: {e}")
-            await asyncio.sleep(10)  # 发生错误时等待更长时间
-
-
-async def push_device_status():
-    """推送设备状态更新"""
-    # 这里应该查询最近更新的设备状态
-    # 暂时发送示例数据
-    device_update = {
-        "type": "device_status",
-        "data": {"device_id": 1, "status": "online", "last_seen": datetime.now().isoformat()},
-        "timestamp": datetime.now().isoformat(),
-    }
-
-    await manager.broadcast(json.dumps(device_update), "device_status")
-
-
-async def push_new_alerts():
-    """推送新告警"""
-    # 这里应该查询最近的新告警
-    # 暂时发送示例数据
-    alert_data = {
-        "type": "new_alert",
-        "data": {
-            "alert_id": 1,
-            "device_id": 1,
-            "severity": "warning",
-            "message": "CPU使用率过高",
-            "created_at": datetime.now().isoformat(),
-        },
-        "timestamp": datetime.now().isoformat(),
-    }
-
-    await manager.broadcast(json.dumps(alert_data), "alerts")
-
-
-async def push_metric_updates():
-    """推送监控指标更新"""
-    # 这里应该查询最新的监控指标数据
-    # 暂时发送示例数据
-    metric_data = {
-        "type": "metric_update",
-        "data": {
-            "device_id": 1,
-            "metrics": {"cpu_usage": 75.5, "memory_usage": 68.2, "disk_usage": 45.1, "network_io": 1250.8},
-        },
-        "timestamp": datetime.now().isoformat(),
-    }
-
-    await manager.broadcast(json.dumps(metric_data), "metrics")
-
-
-async def push_system_logs():
-    """推送系统日志"""
-    # 这里应该查询最新的系统日志
-    # 暂时发送示例数据
-    log_data = {
-        "type": "system_log",
-        "data": {
-            "level": "info",
-            "message": "系统运行正常",
-            "module": "monitor_service",
-            "created_at": datetime.now().isoformat(),
-        },
-        "timestamp": datetime.now().isoformat(),
-    }
-
-    await manager.broadcast(json.dumps(log_data), "system_logs")
+    Returns:
+        推送任务，应用关闭时由调用方取消
+    """
+    set_subscriber_check(manager.has_subscribers)
+    return asyncio.create_task(push_real_time_data())
 
 
-# 启动实时数据推送任务的函数
-def start_real_time_push():
-    """启动实时数据推送任务"""
-    asyncio.create_task(push_real_time_data())
+def stop_real_time_push() -> None:
+    """停止接收实时事件，之后发布的事件直接丢弃"""
+    set_subscriber_check(None)
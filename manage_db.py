@@ -8,29 +8,77 @@
 @Docs: 数据库管理脚本
 """
 
+import argparse
 import asyncio
 import sys
+import time
 from pathlib import Path
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.db import check_database_connection, generate_schemas
+from app.db import close_database, generate_schemas, init_database, ping_database
 from app.utils.logger import logger
 
+try:
+    import uvloop
+except ImportError:  # Windows 等平台未安装 uvloop，使用标准事件循环
+    uvloop = None
 
-async def test_connection():
-    """测试数据库连接"""
+# --wait-for 重试的最大间隔（秒）
+MAX_RETRY_DELAY = 5.0
+
+
+async def wait_for_database(timeout: float) -> bool:
+    """等待数据库可用，失败时按指数退避重试直到超时
+
+    Args:
+        timeout: 最长等待时间（秒），为0时只尝试一次
+
+    Returns:
+        bool: 数据库可用返回True，超时返回False
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.5
+    while not await ping_database():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        logger.info(f"数据库暂不可用，{min(delay, remaining):.1f} 秒后重试...")
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, MAX_RETRY_DELAY)
+    return True
+
+
+async def test_connection(repeat: int = 1, wait_for: float = 0) -> bool:
+    """测试数据库连接
+
+    连接池在整个测试过程中复用，多次探测只有首次需要建立连接。
+
+    Args:
+        repeat: 探测次数
+        wait_for: 首次探测失败时最长等待时间（秒）
+
+    Returns:
+        bool: 全部探测成功返回True
+    """
     logger.info("开始测试数据库连接...")
-    is_connected = await check_database_connection()
-    if is_connected:
-        logger.info("✅ 数据库连接测试成功")
-    else:
+    if not await wait_for_database(wait_for):
         logger.error("❌ 数据库连接测试失败")
-    return is_connected
+        return False
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if not await ping_database():
+            logger.error("❌ 数据库连接测试失败")
+            return False
+    elapsed_ms = (time.perf_counter() - start) * 1000
 
+    logger.info(f"✅ 数据库连接测试成功，共 {repeat} 次，平均耗时 {elapsed_ms / repeat:.2f} ms")
+    return True
 
-async def create_tables():
+
+async def create_tables() -> bool:
     """创建数据库表 (开发环境使用)"""
     logger.warning("警告: 此操作将生成数据库表结构")
     logger.warning("生产环境请使用: aerich upgrade")
@@ -38,27 +86,42 @@ async def create_tables():
     try:
         await generate_schemas()
         logger.info("✅ 数据库表结构生成成功")
+        return True
     except Exception as e:
         logger.error(f"❌ 数据库表结构生成失败: {e}")
+        return False
 
 
-async def main():
-    """主函数"""
-    if len(sys.argv) < 2:
-        print("用法:")
-        print("  python manage_db.py test      # 测试数据库连接")
-        print("  python manage_db.py create    # 创建数据库表 (开发环境)")
-        return
+def build_parser() -> argparse.ArgumentParser:
+    """构建命令行参数解析器"""
+    parser = argparse.ArgumentParser(description="数据库管理脚本")
+    subparsers = parser.add_subparsers(dest="command", required=True)
 
-    command = sys.argv[1]
+    test_parser = subparsers.add_parser("test", help="测试数据库连接")
+    test_parser.add_argument("--repeat", type=int, default=1, help="复用同一连接池连续探测的次数")
+    test_parser.add_argument(
+        "--wait-for", type=float, default=0, metavar="SECONDS", help="数据库不可用时最长等待时间，用于CI健康检查"
+    )
 
-    if command == "test":
-        await test_connection()
-    elif command == "create":
-        await create_tables()
-    else:
-        logger.error(f"未知命令: {command}")
+    subparsers.add_parser("create", help="创建数据库表 (开发环境)")
+    return parser
+
+
+async def main(args: argparse.Namespace) -> bool:
+    """主函数，数据库连接只初始化一次，所有命令在同一连接池上执行"""
+    await init_database()
+    try:
+        if args.command == "test":
+            return await test_connection(max(args.repeat, 1), max(args.wait_for, 0))
+        return await create_tables()
+    finally:
+        await close_database()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    arguments = build_parser().parse_args()
+    if uvloop is not None:
+        succeeded = uvloop.run(main(arguments))
+    else:
+        succeeded = asyncio.run(main(arguments))
+    sys.exit(0 if succeeded else 1)
@@ -351,4 +351,13 @@ CREATE TABLE IF NOT EXISTS "aerich" (
 
 async def downgrade(db: BaseDBAsyncClient) -> str:
     return """
-        """
+        DROP TABLE IF EXISTS "system_logs" CASCADE;
+        DROP TABLE IF EXISTS "operation_logs" CASCADE;
+        DROP TABLE IF EXISTS "monitor_metrics" CASCADE;
+        DROP TABLE IF EXISTS "alerts" CASCADE;
+        DROP TABLE IF EXISTS "devices" CASCADE;
+        DROP TABLE IF EXISTS "device_models" CASCADE;
+        DROP TABLE IF EXISTS "device_groups" CASCADE;
+        DROP TABLE IF EXISTS "config_templates" CASCADE;
+        DROP TABLE IF EXISTS "brands" CASCADE;
+        DROP TABLE IF EXISTS "areas" CASCADE;"""
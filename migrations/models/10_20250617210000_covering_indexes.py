@@ -0,0 +1,24 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_devices_area_id_aca5ae";
+        CREATE INDEX IF NOT EXISTS "idx_devices_area_id_aca5ae" ON "devices" ("area_id", "status") INCLUDE ("name", "management_ip") WHERE "is_deleted" = false;
+        DROP INDEX IF EXISTS "idx_alerts_device__5f477b";
+        CREATE INDEX IF NOT EXISTS "idx_alerts_device__5f477b" ON "alerts" ("device_id", "status") INCLUDE ("title", "severity", "created_at") WHERE "is_deleted" = false;
+        DROP INDEX IF EXISTS "idx_monitor_met_device__52ec73";
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_device__52ec73" ON "monitor_metrics" ("device_id", "metric_type", "collected_at") INCLUDE ("value", "status");
+        ANALYZE "devices";
+        ANALYZE "alerts";
+        ANALYZE "monitor_metrics";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_devices_area_id_aca5ae";
+        CREATE INDEX IF NOT EXISTS "idx_devices_area_id_aca5ae" ON "devices" ("area_id", "status") WHERE "is_deleted" = false;
+        DROP INDEX IF EXISTS "idx_alerts_device__5f477b";
+        CREATE INDEX IF NOT EXISTS "idx_alerts_device__5f477b" ON "alerts" ("device_id", "status") WHERE "is_deleted" = false;
+        DROP INDEX IF EXISTS "idx_monitor_met_device__52ec73";
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_device__52ec73" ON "monitor_metrics" ("device_id", "metric_type", "collected_at");"""
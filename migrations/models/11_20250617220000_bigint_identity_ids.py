@@ -0,0 +1,33 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "operation_logs" ALTER COLUMN "id" DROP DEFAULT;
+        DROP SEQUENCE IF EXISTS "operation_logs_id_seq";
+        ALTER TABLE "operation_logs" ALTER COLUMN "id" TYPE BIGINT;
+        ALTER TABLE "operation_logs" ALTER COLUMN "id" ADD GENERATED BY DEFAULT AS IDENTITY (CACHE 1000);
+        SELECT setval(pg_get_serial_sequence('"operation_logs"', 'id'), COALESCE(MAX("id"), 0) + 1, false) FROM "operation_logs";
+        ALTER TABLE "system_logs" ALTER COLUMN "id" DROP DEFAULT;
+        DROP SEQUENCE IF EXISTS "system_logs_id_seq";
+        ALTER TABLE "system_logs" ALTER COLUMN "id" TYPE BIGINT;
+        ALTER TABLE "system_logs" ALTER COLUMN "id" ADD GENERATED BY DEFAULT AS IDENTITY (CACHE 1000);
+        SELECT setval(pg_get_serial_sequence('"system_logs"', 'id'), COALESCE(MAX("id"), 0) + 1, false) FROM "system_logs";
+        ALTER TABLE "monitor_metrics" ALTER COLUMN "id" TYPE BIGINT;
+        ALTER SEQUENCE "monitor_metrics_id_seq" AS BIGINT CACHE 1000;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "operation_logs" ALTER COLUMN "id" DROP IDENTITY IF EXISTS;
+        ALTER TABLE "operation_logs" ALTER COLUMN "id" TYPE INT;
+        CREATE SEQUENCE IF NOT EXISTS "operation_logs_id_seq" AS INTEGER OWNED BY "operation_logs"."id";
+        ALTER TABLE "operation_logs" ALTER COLUMN "id" SET DEFAULT nextval('operation_logs_id_seq');
+        SELECT setval('operation_logs_id_seq', COALESCE(MAX("id"), 0) + 1, false) FROM "operation_logs";
+        ALTER TABLE "system_logs" ALTER COLUMN "id" DROP IDENTITY IF EXISTS;
+        ALTER TABLE "system_logs" ALTER COLUMN "id" TYPE INT;
+        CREATE SEQUENCE IF NOT EXISTS "system_logs_id_seq" AS INTEGER OWNED BY "system_logs"."id";
+        ALTER TABLE "system_logs" ALTER COLUMN "id" SET DEFAULT nextval('system_logs_id_seq');
+        SELECT setval('system_logs_id_seq', COALESCE(MAX("id"), 0) + 1, false) FROM "system_logs";
+        ALTER SEQUENCE "monitor_metrics_id_seq" AS INTEGER CACHE 1;
+        ALTER TABLE "monitor_metrics" ALTER COLUMN "id" TYPE INT;"""
@@ -0,0 +1,15 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_devices_last_ch_371d5e";
+        ALTER TABLE "devices" SET (fillfactor = 80);
+        ALTER TABLE "alerts" SET (fillfactor = 80);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "alerts" RESET (fillfactor);
+        ALTER TABLE "devices" RESET (fillfactor);
+        CREATE INDEX IF NOT EXISTS "idx_devices_last_ch_371d5e" ON "devices" ("last_check_time");"""
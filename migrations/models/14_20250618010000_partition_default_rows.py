@@ -0,0 +1,48 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE OR REPLACE FUNCTION create_monitor_metrics_partition(month_start TIMESTAMPTZ) RETURNS VOID AS $$
+        DECLARE
+            lower_bound TIMESTAMPTZ := date_trunc('month', month_start);
+            upper_bound TIMESTAMPTZ := date_trunc('month', month_start) + INTERVAL '1 month';
+            partition_name TEXT := 'monitor_metrics_' || to_char(date_trunc('month', month_start), 'YYYY_MM');
+        BEGIN
+            IF to_regclass(quote_ident(partition_name)) IS NOT NULL THEN
+                RETURN;
+            END IF;
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE "monitor_metrics" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name
+            );
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM "monitor_metrics_default" WHERE "collected_at" >= %L AND "collected_at" < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                lower_bound,
+                upper_bound,
+                partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE "monitor_metrics" ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                lower_bound,
+                upper_bound
+            );
+        END;
+        $$ LANGUAGE plpgsql;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE OR REPLACE FUNCTION create_monitor_metrics_partition(month_start TIMESTAMPTZ) RETURNS VOID AS $$
+        DECLARE
+            lower_bound TIMESTAMPTZ := date_trunc('month', month_start);
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF "monitor_metrics" FOR VALUES FROM (%L) TO (%L)',
+                'monitor_metrics_' || to_char(lower_bound, 'YYYY_MM'),
+                lower_bound,
+                lower_bound + INTERVAL '1 month'
+            );
+        END;
+        $$ LANGUAGE plpgsql;"""
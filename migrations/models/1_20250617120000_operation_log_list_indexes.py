@@ -0,0 +1,13 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_operation_l_action_27b553" ON "operation_logs" ("action", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_operation_l_resourc_3bf607" ON "operation_logs" ("resource_type", "resource_id", "created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_operation_l_action_27b553";
+        DROP INDEX IF EXISTS "idx_operation_l_resourc_3bf607";"""
@@ -0,0 +1,41 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_areas_is_dele_910666";
+        DROP INDEX IF EXISTS "idx_brands_is_dele_011e64";
+        DROP INDEX IF EXISTS "idx_config_temp_is_dele_fb1efb";
+        DROP INDEX IF EXISTS "idx_device_grou_is_dele_647abc";
+        DROP INDEX IF EXISTS "idx_device_mode_is_dele_f67ef2";
+        DROP INDEX IF EXISTS "idx_devices_is_dele_3ea52b";
+        DROP INDEX IF EXISTS "idx_alerts_is_dele_90e495";
+        DROP INDEX IF EXISTS "idx_monitor_met_is_dele_8ca6f0";
+        DROP INDEX IF EXISTS "idx_operation_l_is_dele_4d9ae2";
+        DROP INDEX IF EXISTS "idx_system_logs_is_dele_2dba6b";
+        DROP INDEX IF EXISTS "idx_devices_brand_i_41bf0a";
+        CREATE INDEX IF NOT EXISTS "idx_devices_brand_i_41bf0a" ON "devices" ("brand_id", "status") WHERE "is_deleted" = false;
+        DROP INDEX IF EXISTS "idx_devices_area_id_aca5ae";
+        CREATE INDEX IF NOT EXISTS "idx_devices_area_id_aca5ae" ON "devices" ("area_id", "status") WHERE "is_deleted" = false;
+        DROP INDEX IF EXISTS "idx_devices_device__a15ecb";
+        CREATE INDEX IF NOT EXISTS "idx_devices_device__a15ecb" ON "devices" ("device_group_id", "status") WHERE "is_deleted" = false;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_areas_is_dele_910666" ON "areas" ("is_deleted");
+        CREATE INDEX IF NOT EXISTS "idx_brands_is_dele_011e64" ON "brands" ("is_deleted");
+        CREATE INDEX IF NOT EXISTS "idx_config_temp_is_dele_fb1efb" ON "config_templates" ("is_deleted");
+        CREATE INDEX IF NOT EXISTS "idx_device_grou_is_dele_647abc" ON "device_groups" ("is_deleted");
+        CREATE INDEX IF NOT EXISTS "idx_device_mode_is_dele_f67ef2" ON "device_models" ("is_deleted");
+        CREATE INDEX IF NOT EXISTS "idx_devices_is_dele_3ea52b" ON "devices" ("is_deleted");
+        CREATE INDEX IF NOT EXISTS "idx_alerts_is_dele_90e495" ON "alerts" ("is_deleted");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_is_dele_8ca6f0" ON "monitor_metrics" ("is_deleted");
+        CREATE INDEX IF NOT EXISTS "idx_operation_l_is_dele_4d9ae2" ON "operation_logs" ("is_deleted");
+        CREATE INDEX IF NOT EXISTS "idx_system_logs_is_dele_2dba6b" ON "system_logs" ("is_deleted");
+        DROP INDEX IF EXISTS "idx_devices_brand_i_41bf0a";
+        CREATE INDEX IF NOT EXISTS "idx_devices_brand_i_41bf0a" ON "devices" ("brand_id", "status");
+        DROP INDEX IF EXISTS "idx_devices_area_id_aca5ae";
+        CREATE INDEX IF NOT EXISTS "idx_devices_area_id_aca5ae" ON "devices" ("area_id", "status");
+        DROP INDEX IF EXISTS "idx_devices_device__a15ecb";
+        CREATE INDEX IF NOT EXISTS "idx_devices_device__a15ecb" ON "devices" ("device_group_id", "status");"""
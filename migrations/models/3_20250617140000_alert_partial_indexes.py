@@ -0,0 +1,17 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_alerts_device__5f477b";
+        CREATE INDEX IF NOT EXISTS "idx_alerts_device__5f477b" ON "alerts" ("device_id", "status") WHERE "is_deleted" = false;
+        DROP INDEX IF EXISTS "idx_alerts_severit_c9b062";
+        CREATE INDEX IF NOT EXISTS "idx_alerts_severit_c9b062" ON "alerts" ("severity", "status", "created_at") WHERE "is_deleted" = false;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_alerts_device__5f477b";
+        CREATE INDEX IF NOT EXISTS "idx_alerts_device__5f477b" ON "alerts" ("device_id", "status");
+        DROP INDEX IF EXISTS "idx_alerts_severit_c9b062";
+        CREATE INDEX IF NOT EXISTS "idx_alerts_severit_c9b062" ON "alerts" ("severity", "status", "created_at");"""
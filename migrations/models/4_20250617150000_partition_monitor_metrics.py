@@ -0,0 +1,131 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "monitor_metrics" RENAME TO "monitor_metrics_unpartitioned";
+        ALTER SEQUENCE "monitor_metrics_id_seq" OWNED BY NONE;
+        CREATE TABLE "monitor_metrics" (
+            "id" INT NOT NULL DEFAULT nextval('monitor_metrics_id_seq'),
+            "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "is_deleted" BOOL NOT NULL DEFAULT False,
+            "metric_type" VARCHAR(11) NOT NULL,
+            "metric_name" VARCHAR(100) NOT NULL,
+            "value" DOUBLE PRECISION NOT NULL,
+            "unit" VARCHAR(20),
+            "threshold_warning" DOUBLE PRECISION,
+            "threshold_critical" DOUBLE PRECISION,
+            "status" VARCHAR(8) NOT NULL DEFAULT 'normal',
+            "collected_at" TIMESTAMPTZ NOT NULL,
+            "device_id" INT NOT NULL REFERENCES "devices" ("id") ON DELETE CASCADE,
+            PRIMARY KEY ("id", "collected_at")
+        ) PARTITION BY RANGE ("collected_at");
+        ALTER SEQUENCE "monitor_metrics_id_seq" OWNED BY "monitor_metrics"."id";
+        CREATE TABLE "monitor_metrics_default" PARTITION OF "monitor_metrics" DEFAULT;
+        CREATE OR REPLACE FUNCTION create_monitor_metrics_partition(month_start TIMESTAMPTZ) RETURNS VOID AS $$
+        DECLARE
+            lower_bound TIMESTAMPTZ := date_trunc('month', month_start);
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF "monitor_metrics" FOR VALUES FROM (%L) TO (%L)',
+                'monitor_metrics_' || to_char(lower_bound, 'YYYY_MM'),
+                lower_bound,
+                lower_bound + INTERVAL '1 month'
+            );
+        END;
+        $$ LANGUAGE plpgsql;
+        CREATE OR REPLACE FUNCTION drop_monitor_metrics_partitions(cutoff TIMESTAMPTZ) RETURNS BIGINT AS $$
+        DECLARE
+            partition_name TEXT;
+            partition_rows BIGINT;
+            dropped_rows BIGINT := 0;
+        BEGIN
+            FOR partition_name IN
+                SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = '"monitor_metrics"'::regclass AND c.relname ~ '^monitor_metrics_[0-9]{4}_[0-9]{2}$'
+            LOOP
+                IF to_date(substr(partition_name, 17), 'YYYY_MM')::TIMESTAMPTZ + INTERVAL '1 month' <= cutoff THEN
+                    EXECUTE format('SELECT count(*) FROM %I', partition_name) INTO partition_rows;
+                    EXECUTE format('DROP TABLE %I', partition_name);
+                    dropped_rows := dropped_rows + partition_rows;
+                END IF;
+            END LOOP;
+            RETURN dropped_rows;
+        END;
+        $$ LANGUAGE plpgsql;
+        SELECT create_monitor_metrics_partition(months.month_start) FROM (
+            SELECT DISTINCT date_trunc('month', "collected_at") AS month_start FROM "monitor_metrics_unpartitioned"
+            UNION
+            SELECT date_trunc('month', CURRENT_TIMESTAMP) + n * INTERVAL '1 month' FROM generate_series(0, 2) AS n
+        ) AS months;
+        INSERT INTO "monitor_metrics" ("id", "created_at", "updated_at", "is_deleted", "metric_type", "metric_name", "value", "unit", "threshold_warning", "threshold_critical", "status", "collected_at", "device_id")
+        SELECT "id", "created_at", "updated_at", "is_deleted", "metric_type", "metric_name", "value", "unit", "threshold_warning", "threshold_critical", "status", "collected_at", "device_id" FROM "monitor_metrics_unpartitioned";
+        DROP TABLE "monitor_metrics_unpartitioned";
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_created_cfb550" ON "monitor_metrics" ("created_at");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_metric__539ac6" ON "monitor_metrics" ("metric_type");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_status_4d3e2d" ON "monitor_metrics" ("status");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_collect_d50813" ON "monitor_metrics" ("collected_at");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_device__52ec73" ON "monitor_metrics" ("device_id", "metric_type", "collected_at");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_status_b7d1f2" ON "monitor_metrics" ("status", "collected_at");
+        COMMENT ON COLUMN "monitor_metrics"."id" IS '主键ID';
+        COMMENT ON COLUMN "monitor_metrics"."created_at" IS '创建时间';
+        COMMENT ON COLUMN "monitor_metrics"."updated_at" IS '更新时间';
+        COMMENT ON COLUMN "monitor_metrics"."is_deleted" IS '是否已删除';
+        COMMENT ON COLUMN "monitor_metrics"."metric_type" IS '指标类型';
+        COMMENT ON COLUMN "monitor_metrics"."metric_name" IS '指标名称';
+        COMMENT ON COLUMN "monitor_metrics"."value" IS '指标值';
+        COMMENT ON COLUMN "monitor_metrics"."unit" IS '指标单位';
+        COMMENT ON COLUMN "monitor_metrics"."threshold_warning" IS '告警阈值';
+        COMMENT ON COLUMN "monitor_metrics"."threshold_critical" IS '严重告警阈值';
+        COMMENT ON COLUMN "monitor_metrics"."status" IS '指标状态';
+        COMMENT ON COLUMN "monitor_metrics"."collected_at" IS '采集时间';
+        COMMENT ON COLUMN "monitor_metrics"."device_id" IS '关联设备';
+        COMMENT ON TABLE "monitor_metrics" IS '监控指标表';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "monitor_metrics" RENAME TO "monitor_metrics_partitioned";
+        ALTER SEQUENCE "monitor_metrics_id_seq" OWNED BY NONE;
+        CREATE TABLE "monitor_metrics" (
+            "id" INT NOT NULL DEFAULT nextval('monitor_metrics_id_seq') PRIMARY KEY,
+            "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "is_deleted" BOOL NOT NULL DEFAULT False,
+            "metric_type" VARCHAR(11) NOT NULL,
+            "metric_name" VARCHAR(100) NOT NULL,
+            "value" DOUBLE PRECISION NOT NULL,
+            "unit" VARCHAR(20),
+            "threshold_warning" DOUBLE PRECISION,
+            "threshold_critical" DOUBLE PRECISION,
+            "status" VARCHAR(8) NOT NULL DEFAULT 'normal',
+            "collected_at" TIMESTAMPTZ NOT NULL,
+            "device_id" INT NOT NULL REFERENCES "devices" ("id") ON DELETE CASCADE
+        );
+        ALTER SEQUENCE "monitor_metrics_id_seq" OWNED BY "monitor_metrics"."id";
+        INSERT INTO "monitor_metrics" ("id", "created_at", "updated_at", "is_deleted", "metric_type", "metric_name", "value", "unit", "threshold_warning", "threshold_critical", "status", "collected_at", "device_id")
+        SELECT "id", "created_at", "updated_at", "is_deleted", "metric_type", "metric_name", "value", "unit", "threshold_warning", "threshold_critical", "status", "collected_at", "device_id" FROM "monitor_metrics_partitioned";
+        DROP TABLE "monitor_metrics_partitioned";
+        DROP FUNCTION IF EXISTS create_monitor_metrics_partition(TIMESTAMPTZ);
+        DROP FUNCTION IF EXISTS drop_monitor_metrics_partitions(TIMESTAMPTZ);
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_created_cfb550" ON "monitor_metrics" ("created_at");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_metric__539ac6" ON "monitor_metrics" ("metric_type");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_status_4d3e2d" ON "monitor_metrics" ("status");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_collect_d50813" ON "monitor_metrics" ("collected_at");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_device__52ec73" ON "monitor_metrics" ("device_id", "metric_type", "collected_at");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_status_b7d1f2" ON "monitor_metrics" ("status", "collected_at");
+        COMMENT ON COLUMN "monitor_metrics"."id" IS '主键ID';
+        COMMENT ON COLUMN "monitor_metrics"."created_at" IS '创建时间';
+        COMMENT ON COLUMN "monitor_metrics"."updated_at" IS '更新时间';
+        COMMENT ON COLUMN "monitor_metrics"."is_deleted" IS '是否已删除';
+        COMMENT ON COLUMN "monitor_metrics"."metric_type" IS '指标类型';
+        COMMENT ON COLUMN "monitor_metrics"."metric_name" IS '指标名称';
+        COMMENT ON COLUMN "monitor_metrics"."value" IS '指标值';
+        COMMENT ON COLUMN "monitor_metrics"."unit" IS '指标单位';
+        COMMENT ON COLUMN "monitor_metrics"."threshold_warning" IS '告警阈值';
+        COMMENT ON COLUMN "monitor_metrics"."threshold_critical" IS '严重告警阈值';
+        COMMENT ON COLUMN "monitor_metrics"."status" IS '指标状态';
+        COMMENT ON COLUMN "monitor_metrics"."collected_at" IS '采集时间';
+        COMMENT ON COLUMN "monitor_metrics"."device_id" IS '关联设备';
+        COMMENT ON TABLE "monitor_metrics" IS '监控指标表';"""
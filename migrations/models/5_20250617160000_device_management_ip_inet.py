@@ -0,0 +1,11 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "devices" ALTER COLUMN "management_ip" TYPE INET USING "management_ip"::inet;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "devices" ALTER COLUMN "management_ip" TYPE VARCHAR(15) USING host("management_ip");"""
@@ -0,0 +1,13 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_monitor_met_created_cfb550";
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_created_cfb550" ON "monitor_metrics" USING BRIN ("created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_monitor_met_created_cfb550";
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_created_cfb550" ON "monitor_metrics" ("created_at");"""
@@ -0,0 +1,61 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TYPE connection_type AS ENUM ('ssh', 'telnet', 'snmp');
+        CREATE TYPE device_status AS ENUM ('online', 'offline', 'error', 'unknown', 'maintenance');
+        CREATE TYPE metric_status AS ENUM ('normal', 'warning', 'critical', 'unknown');
+        CREATE TYPE alert_severity AS ENUM ('info', 'warning', 'critical', 'fatal');
+        CREATE TYPE alert_status AS ENUM ('active', 'acknowledged', 'resolved', 'suppressed');
+        CREATE TYPE operation_result AS ENUM ('success', 'failed', 'timeout', 'cancelled');
+        ALTER TABLE "devices"
+            ALTER COLUMN "connection_type" DROP DEFAULT,
+            ALTER COLUMN "connection_type" TYPE connection_type USING "connection_type"::connection_type,
+            ALTER COLUMN "connection_type" SET DEFAULT 'ssh',
+            ALTER COLUMN "status" DROP DEFAULT,
+            ALTER COLUMN "status" TYPE device_status USING "status"::device_status,
+            ALTER COLUMN "status" SET DEFAULT 'unknown';
+        ALTER TABLE "monitor_metrics"
+            ALTER COLUMN "status" DROP DEFAULT,
+            ALTER COLUMN "status" TYPE metric_status USING "status"::metric_status,
+            ALTER COLUMN "status" SET DEFAULT 'normal';
+        ALTER TABLE "alerts"
+            ALTER COLUMN "severity" TYPE alert_severity USING "severity"::alert_severity,
+            ALTER COLUMN "status" DROP DEFAULT,
+            ALTER COLUMN "status" TYPE alert_status USING "status"::alert_status,
+            ALTER COLUMN "status" SET DEFAULT 'active';
+        ALTER TABLE "operation_logs"
+            ALTER COLUMN "result" DROP DEFAULT,
+            ALTER COLUMN "result" TYPE operation_result USING "result"::operation_result,
+            ALTER COLUMN "result" SET DEFAULT 'success';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "devices"
+            ALTER COLUMN "connection_type" DROP DEFAULT,
+            ALTER COLUMN "connection_type" TYPE VARCHAR(6) USING "connection_type"::text,
+            ALTER COLUMN "connection_type" SET DEFAULT 'ssh',
+            ALTER COLUMN "status" DROP DEFAULT,
+            ALTER COLUMN "status" TYPE VARCHAR(11) USING "status"::text,
+            ALTER COLUMN "status" SET DEFAULT 'unknown';
+        ALTER TABLE "monitor_metrics"
+            ALTER COLUMN "status" DROP DEFAULT,
+            ALTER COLUMN "status" TYPE VARCHAR(8) USING "status"::text,
+            ALTER COLUMN "status" SET DEFAULT 'normal';
+        ALTER TABLE "alerts"
+            ALTER COLUMN "severity" TYPE VARCHAR(8) USING "severity"::text,
+            ALTER COLUMN "status" DROP DEFAULT,
+            ALTER COLUMN "status" TYPE VARCHAR(12) USING "status"::text,
+            ALTER COLUMN "status" SET DEFAULT 'active';
+        ALTER TABLE "operation_logs"
+            ALTER COLUMN "result" DROP DEFAULT,
+            ALTER COLUMN "result" TYPE VARCHAR(9) USING "result"::text,
+            ALTER COLUMN "result" SET DEFAULT 'success';
+        DROP TYPE IF EXISTS connection_type;
+        DROP TYPE IF EXISTS device_status;
+        DROP TYPE IF EXISTS metric_status;
+        DROP TYPE IF EXISTS alert_severity;
+        DROP TYPE IF EXISTS alert_status;
+        DROP TYPE IF EXISTS operation_result;"""
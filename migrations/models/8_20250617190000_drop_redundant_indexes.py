@@ -0,0 +1,29 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_areas_code_72953d";
+        DROP INDEX IF EXISTS "idx_brands_code_e376fa";
+        DROP INDEX IF EXISTS "idx_devices_status_45b5c1";
+        DROP INDEX IF EXISTS "idx_alerts_severit_97b068";
+        DROP INDEX IF EXISTS "idx_monitor_met_status_4d3e2d";
+        DROP INDEX IF EXISTS "idx_operation_l_user_2390d3";
+        DROP INDEX IF EXISTS "idx_operation_l_action_4da1e2";
+        DROP INDEX IF EXISTS "idx_operation_l_resourc_a196f5";
+        DROP INDEX IF EXISTS "idx_system_logs_level_607a60";
+        DROP INDEX IF EXISTS "idx_system_logs_module_943f90";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_areas_code_72953d" ON "areas" ("code");
+        CREATE INDEX IF NOT EXISTS "idx_brands_code_e376fa" ON "brands" ("code");
+        CREATE INDEX IF NOT EXISTS "idx_devices_status_45b5c1" ON "devices" ("status");
+        CREATE INDEX IF NOT EXISTS "idx_alerts_severit_97b068" ON "alerts" ("severity");
+        CREATE INDEX IF NOT EXISTS "idx_monitor_met_status_4d3e2d" ON "monitor_metrics" ("status");
+        CREATE INDEX IF NOT EXISTS "idx_operation_l_user_2390d3" ON "operation_logs" ("user");
+        CREATE INDEX IF NOT EXISTS "idx_operation_l_action_4da1e2" ON "operation_logs" ("action");
+        CREATE INDEX IF NOT EXISTS "idx_operation_l_resourc_a196f5" ON "operation_logs" ("resource_type");
+        CREATE INDEX IF NOT EXISTS "idx_system_logs_level_607a60" ON "system_logs" ("level");
+        CREATE INDEX IF NOT EXISTS "idx_system_logs_module_943f90" ON "system_logs" ("module");"""
@@ -0,0 +1,25 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "system_logs"
+            ALTER COLUMN "message" SET COMPRESSION lz4,
+            ALTER COLUMN "exception_info" SET COMPRESSION lz4,
+            ALTER COLUMN "extra_data" SET COMPRESSION lz4;
+        ALTER TABLE "operation_logs"
+            ALTER COLUMN "details" SET COMPRESSION lz4,
+            ALTER COLUMN "error_message" SET COMPRESSION lz4;
+        ALTER TABLE "alerts" ALTER COLUMN "message" SET COMPRESSION lz4;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "system_logs"
+            ALTER COLUMN "message" SET COMPRESSION DEFAULT,
+            ALTER COLUMN "exception_info" SET COMPRESSION DEFAULT,
+            ALTER COLUMN "extra_data" SET COMPRESSION DEFAULT;
+        ALTER TABLE "operation_logs"
+            ALTER COLUMN "details" SET COMPRESSION DEFAULT,
+            ALTER COLUMN "error_message" SET COMPRESSION DEFAULT;
+        ALTER TABLE "alerts" ALTER COLUMN "message" SET COMPRESSION DEFAULT;"""
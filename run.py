@@ -6,6 +6,8 @@
 @Docs: 主程序
 """
 
+import sys
+
 import uvicorn
 
 from app.core.config import settings
@@ -14,13 +16,19 @@ from app.core.config import settings
 def main():
     """主函数"""
 
+    debug = settings.DEBUG
+
     # 启动FastAPI应用
     uvicorn.run(
         "app.main:app",  # 使用导入字符串而不是应用对象
         host=settings.HOST,
         port=settings.PORT,
         log_level=settings.LOG_LEVEL.lower(),  # 转换为小写字符串
-        reload=settings.DEBUG,  # 开发模式下启用热重载
+        reload=debug,  # 开发模式下启用热重载
+        workers=None if debug else settings.WORKERS,  # 热重载只支持单进程
+        # uvloop 与 httptools 由 uvicorn[standard] 安装，显式指定以免缺失时静默退回纯Python实现
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop 不支持 Windows
+        http="httptools",
     )
 
 